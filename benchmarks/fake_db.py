@@ -0,0 +1,205 @@
+import re
+import uuid
+import sqlite3
+import threading
+from collections import Counter
+
+
+TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table}(
+    student_id VARCHAR(10) PRIMARY KEY,
+    study_hours_per_week FLOAT,
+    attendance_rate FLOAT,
+    previous_grades FLOAT,
+    participate_in_act VARCHAR(10),
+    parent_edu_level VARCHAR(50),
+    passed VARCHAR(3)
+)
+"""
+
+# Khóa chính của các bảng khác student_performance (cho ON DUPLICATE KEY UPDATE)
+PRIMARY_KEYS = {
+    'etl_checkpoint': 'run_id, part',
+    'student_performance_summary': 'participate_in_act, parent_edu_level, passed',
+    'student_performance_histogram': 'participate_in_act, parent_edu_level, passed, column_name, bucket'
+}
+
+
+def to_sqlite_(query: str) -> str:
+    """
+    Chuyển một câu lệnh MySQL trong queries.sql sang cú pháp tương đương của SQLite.
+
+    Args:
+        query (str): Câu lệnh MySQL.
+
+    Returns:
+        str: Câu lệnh SQLite.
+    """
+    if query.startswith('EXPLAIN '):
+        return 'EXPLAIN QUERY PLAN ' + to_sqlite_(query[len('EXPLAIN '):])
+    if 'information_schema.statistics' in query:
+        return "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?"
+    query = query.replace('%s', '?')
+    # CREATE TABLE ... LIKE và RENAME TABLE nhiều bảng (dùng khi tải lại vào bảng phụ)
+    like = re.match(r'CREATE TABLE (\w+) LIKE \w+', query)
+    if like:
+        return TABLE_SCHEMA.format(table=like.group(1))
+    if query.startswith('RENAME TABLE'):
+        renames = re.findall(r'(\w+) TO (\w+)', query)
+        return ''.join(f'ALTER TABLE {old} RENAME TO {new};' for old, new in renames)
+    if 'ON DUPLICATE KEY UPDATE' in query:
+        key = PRIMARY_KEYS.get(re.match(r'INSERT INTO (\w+)', query).group(1), 'student_id')
+        query = query.replace('ON DUPLICATE KEY UPDATE', f'ON CONFLICT({key}) DO UPDATE SET')
+        query = re.sub(r'VALUES\((\w+)\)', r'excluded.\1', query)
+    return query
+
+
+class RecordingCursor:
+    """
+    Cursor giả lập của mysql.connector chạy trên SQLite, đếm các câu lệnh được thực thi.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._rows = []
+        self.rowcount = -1
+        self.description = None
+
+    def execute(self, query: str, params: tuple = ()) -> None:
+        self._connection.record_(query, 1)
+        if query.startswith('RENAME TABLE'):
+            self._connection.db.executescript(to_sqlite_(query))
+            return
+        cursor = self._connection.db.execute(to_sqlite_(query), tuple(params))
+        self._rows = cursor.fetchall()
+        self.rowcount = cursor.rowcount
+        self.description = cursor.description
+
+    def executemany(self, query: str, seq_params) -> None:
+        seq_params = [tuple(params) for params in seq_params]
+        self._connection.record_(query, len(seq_params))
+        cursor = self._connection.db.executemany(to_sqlite_(query), seq_params)
+        self.rowcount = cursor.rowcount
+
+    def fetchall(self) -> list[tuple]:
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchone(self) -> tuple|None:
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size: int = 1) -> list[tuple]:
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def close(self) -> None:
+        self._rows = []
+
+
+class SQLiteConnection:
+    """
+    Kết nối giả lập của mysql.connector trên một CSDL SQLite dùng chung.
+
+    Attributes:
+        db (sqlite3.Connection): Kết nối SQLite thật.
+    """
+
+    def __init__(self, manager, uri: str):
+        self._manager = manager
+        self.db = sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    def record_(self, query: str, rows: int) -> None:
+        self._manager.record_(query, rows)
+
+    def cursor(self, prepared: bool = False, buffered: bool|None = None, **kwargs) -> RecordingCursor:
+        return RecordingCursor(self)
+
+    def commit(self) -> None:
+        self.db.commit()
+        self._manager.record_('COMMIT', 0)
+
+    def rollback(self) -> None:
+        self.db.rollback()
+        self._manager.record_('ROLLBACK', 0)
+
+    def consume_results(self) -> None:
+        pass
+
+    def is_connected(self) -> bool:
+        return True
+
+    def ping(self, reconnect: bool = False, attempts: int = 1, delay: int = 0) -> None:
+        pass
+
+    def close(self) -> None:
+        self.db.close()
+
+
+class SQLiteConnectionManager:
+    """
+    Thay thế ConnectionManager khi đo hiệu năng: mỗi kết nối là một kết nối SQLite tới cùng một
+    CSDL trong bộ nhớ, mọi câu lệnh được đếm theo loại.
+
+    Attributes:
+        statements (Counter): Số lần thực thi theo loại câu lệnh (từ khóa đầu tiên).
+        rows (Counter): Số dòng tham số theo loại câu lệnh.
+        pool_size (int): Số kết nối tối đa (chỉ để tương thích).
+    """
+
+    def __init__(self, pool_size: int = 5):
+        self._uri = f'file:bench_{uuid.uuid4().hex}?mode=memory&cache=shared'
+        # Giữ một kết nối mở để CSDL trong bộ nhớ không bị xóa
+        self._root = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        self._root.execute(TABLE_SCHEMA.format(table='student_performance'))
+        self._root.commit()
+        self._lock = threading.Lock()
+        self.statements = Counter()
+        self.rows = Counter()
+        self.pool_size = pool_size
+
+    def record_(self, query: str, rows: int) -> None:
+        kind = query.split(None, 1)[0].upper()
+        with self._lock:
+            self.statements[kind] += 1
+            self.rows[kind] += rows
+
+    def get_connection(self) -> SQLiteConnection:
+        return SQLiteConnection(self, self._uri)
+
+    def check_(self, connection, last_used: float) -> bool:
+        return True
+
+    def count(self) -> int:
+        """
+        Đếm số bản ghi trong bảng.
+        """
+        return self._root.execute('SELECT COUNT(*) FROM student_performance').fetchone()[0]
+
+    def reset(self) -> None:
+        """
+        Xóa dữ liệu trong bảng (cùng các bảng tổng hợp nếu có) và các bộ đếm câu lệnh.
+        """
+        self._root.execute('DELETE FROM student_performance')
+        for table in ('student_performance_summary', 'student_performance_histogram'):
+            if self._root.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (table,)).fetchone():
+                self._root.execute(f'DELETE FROM {table}')
+        self._root.commit()
+        with self._lock:
+            self.statements.clear()
+            self.rows.clear()
+
+
+def install(manager: SQLiteConnectionManager|None = None) -> SQLiteConnectionManager:
+    """
+    Cho mọi StudentPerformanceDAO tạo sau lời gọi này dùng CSDL SQLite giả lập thay cho MySQL.
+
+    Args:
+        manager (SQLiteConnectionManager|None): Đối tượng quản lý kết nối giả lập, mặc định là None (tạo mới).
+
+    Returns:
+        SQLiteConnectionManager: Đối tượng quản lý kết nối đang được dùng.
+    """
+    import dao
+    manager = manager if manager is not None else SQLiteConnectionManager()
+    dao.get_connection_manager = lambda *args, **kwargs: manager
+    return manager
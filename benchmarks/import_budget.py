@@ -0,0 +1,124 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from synthetic import write_csv
+
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Các thư viện nặng không được import khi chỉ import business.etl hoặc khi lần chạy tăng dần không có gì thay đổi
+heavy_modules = ('pandas', 'numpy', 'mysql', 'kaggle')
+
+# Đặt các đường dẫn trạng thái của etl vào thư mục tạm để không đụng tới business/data và etl_log.log
+setup_code = """
+import sys
+sys.path.insert(0, {business_dir!r})
+import etl
+etl.data_dir = {workdir!r}
+etl.fingerprint_file = etl.data_dir + '/fingerprints.db'
+etl.staging_dir = etl.data_dir + '/.staging'
+etl.last_run_file = etl.data_dir + '/.last_run.json'
+etl.metrics_file = etl.data_dir + '/metrics.jsonl'
+etl.metrics_prom_file = etl.data_dir + '/metrics.prom'
+etl.log_file = etl.data_dir + '/etl_log.log'
+"""
+
+first_run_code = """
+sys.path.insert(0, {benchmarks_dir!r})
+import fake_db
+fake_db.install()
+etl.etl_process(source={csv_path!r}, incremental=True)
+"""
+
+noop_run_code = """
+etl.etl_process(source={csv_path!r}, incremental=True)
+loaded = [name for name in {heavy_modules!r} if name in sys.modules]
+if loaded:
+    sys.exit('Heavy modules imported: ' + ', '.join(loaded))
+"""
+
+
+def import_time_(module: str) -> tuple[float, set[str]]:
+    """
+    Đo thời gian import một module bằng python -X importtime trong một tiến trình mới.
+
+    Args:
+        module (str): Tên module.
+
+    Returns:
+        tuple[float, set[str]]: Thời gian import tích lũy (ms) và tập tên các package gốc đã được import.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=root_dir, capture_output=True, text=True, check=True)
+    total = 0.0
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        packages.add(name.strip().split('.')[0])
+        if name.strip() == module:
+            total = int(cumulative) / 1000
+    return total, packages
+
+
+def run_python_(code: str) -> float:
+    """
+    Chạy một đoạn mã trong một tiến trình Python mới và đo thời gian (kể cả khởi động trình thông dịch).
+
+    Args:
+        code (str): Mã cần chạy.
+
+    Returns:
+        float: Thời gian chạy (ms).
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], cwd=root_dir, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv: list[str]|None = None) -> int:
+    parser = argparse.ArgumentParser(description='Import time and cold start budget of the ETL entry point.')
+    parser.add_argument('--import-budget-ms', type=float, default=100.0)
+    parser.add_argument('--cold-start-budget-ms', type=float, default=200.0)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    failures = []
+    runs = [import_time_('business.etl') for _ in range(args.repeat)]
+    import_ms = min(ms for ms, _ in runs)
+    heavy = sorted(set(heavy_modules) & runs[0][1])
+    print(f'import business.etl: {import_ms:.1f}ms (budget {args.import_budget_ms:.0f}ms)')
+    if import_ms > args.import_budget_ms:
+        failures.append('import time')
+    if heavy:
+        print('  heavy modules imported: ' + ', '.join(heavy))
+        failures.append('heavy imports')
+
+    workdir = tempfile.mkdtemp(prefix='sp_cold_')
+    try:
+        csv_path = write_csv(os.path.join(workdir, 'data.csv'), 10000)
+        names = dict(business_dir=os.path.join(root_dir, 'business'), benchmarks_dir=os.path.dirname(__file__),
+                     workdir=workdir, csv_path=csv_path, heavy_modules=heavy_modules)
+        run_python_((setup_code + first_run_code).format(**names))
+        cold_ms = min(run_python_((setup_code + noop_run_code).format(**names)) for _ in range(args.repeat))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(f'no-op incremental run: {cold_ms:.1f}ms (budget {args.cold_start_budget_ms:.0f}ms)')
+    if cold_ms > args.cold_start_budget_ms:
+        failures.append('cold start')
+
+    if failures:
+        print('Over budget: ' + ', '.join(failures))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,295 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__))))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'business')))
+
+import io
+import re
+import json
+import time
+import logging
+import argparse
+import platform
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from typing import Callable
+
+# Không ghi log của ETL vào business/etl_log.log trong lúc đo
+logging.basicConfig(handlers=[logging.NullHandler()])
+
+import etl
+from dao import StudentPerformanceDAO
+from model import create_model, create_models_from_frame
+from sql.sql_reader import SQLFileReader
+from sink import SQLiteSink, ColumnarFileSink
+from synthetic import generate_frame, write_csv
+import fake_db
+
+
+sql_file_path = os.path.join(os.path.dirname(__file__), '..', 'sql', 'queries.sql')
+default_baseline = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Các truy vấn lọc của StudentPerformanceDAO.find và các chỉ mục mà kế hoạch thực thi phải dùng (một trong số đó)
+QUERY_CASES = (
+    ('find_range', dict(attendance_rate=(None, 60)), ('idx_attendance_rate',)),
+    ('find_category', dict(passed='No', parent_edu_level='Master'), ('idx_passed_edu_level',)),
+    ('find_range_category', dict(attendance_rate=(None, 60), passed='No'),
+     ('idx_attendance_rate', 'idx_passed_edu_level')),
+    ('top_k', dict(limit=10, order_by='previous_grades', descending=True), ('idx_previous_grades',))
+)
+
+
+def measure_(func: Callable, repeat: int, setup: Callable|None = None) -> float:
+    """
+    Đo thời gian chạy tốt nhất của một hàm qua nhiều lần lặp, phần setup không được tính giờ.
+
+    Args:
+        func (Callable): Hàm cần đo.
+        repeat (int): Số lần lặp.
+        setup (Callable|None): Hàm chạy trước mỗi lần đo, mặc định là None.
+
+    Returns:
+        float: Thời gian nhỏ nhất (giây).
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        # Bỏ các dòng print của ETL và các cảnh báo của StudentModel
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def used_indexes_(plan: list[dict]) -> set[str]:
+    """
+    Lấy các chỉ mục được dùng trong một kế hoạch thực thi: cột key của EXPLAIN trong MySQL (không phải
+    possible_keys), hoặc 'USING INDEX <tên>' trong cột detail của EXPLAIN QUERY PLAN trên CSDL giả lập.
+
+    Args:
+        plan (list[dict]): Kết quả của StudentPerformanceDAO.explain_find.
+
+    Returns:
+        set[str]: Tên các chỉ mục được dùng.
+    """
+    used = set()
+    for row in plan:
+        if row.get('key'):
+            # index_merge liệt kê nhiều chỉ mục cách nhau bằng dấu phẩy
+            used.update(row['key'].split(','))
+        used.update(re.findall(r'USING (?:COVERING )?INDEX (\w+)', str(row.get('detail') or '')))
+    return used
+
+
+def check_index_usage_(dao: StudentPerformanceDAO) -> None:
+    """
+    Kiểm tra kế hoạch thực thi (EXPLAIN) của các truy vấn trong QUERY_CASES có dùng chỉ mục mong đợi.
+
+    Args:
+        dao (StudentPerformanceDAO): DAO trên CSDL đã có các chỉ mục (xem create_indexes).
+
+    Raises:
+        AssertionError: Nếu một truy vấn không dùng chỉ mục nào trong số được mong đợi.
+    """
+    for name, query_kwargs, indexes in QUERY_CASES:
+        plan = dao.explain_find(**query_kwargs)
+        if not used_indexes_(plan) & set(indexes):
+            raise AssertionError(f'{name} does not use any of {indexes}: {plan}')
+
+
+def check_mysql_indexes(db_config: dict) -> None:
+    """
+    Tạo các chỉ mục còn thiếu trên CSDL MySQL thật và kiểm tra kế hoạch thực thi của QUERY_CASES
+    trên đó (bảng cần có dữ liệu, với bảng rỗng MySQL có thể không dùng chỉ mục).
+
+    Args:
+        db_config (dict): Cấu hình kết nối cho StudentPerformanceDAO.
+
+    Raises:
+        AssertionError: Nếu một truy vấn không dùng chỉ mục nào trong số được mong đợi.
+        DAOException: Nếu không kết nối được hoặc lỗi khi tạo chỉ mục.
+    """
+    with StudentPerformanceDAO(**db_config) as dao:
+        created = dao.create_indexes()
+        if created:
+            print(f'Created indexes: {", ".join(created)}')
+        check_index_usage_(dao)
+    print('All filter queries use the expected indexes.')
+
+
+def run_benchmarks(sizes: list[int], repeat: int = 3, row_limit: int = 20000,
+                   nan_rate: float = 0.05, out_of_range_rate: float = 0.02,
+                   duplicate_rate: float = 0.01) -> dict[str, dict]:
+    """
+    Đo thời gian của các bước ETL trên dữ liệu giả lập, không cần Kaggle hay MySQL.
+
+    Args:
+        sizes (list[int]): Các kích thước dữ liệu (số dòng).
+        repeat (int): Số lần lặp mỗi phép đo, mặc định là 3.
+        row_limit (int): Số dòng tối đa cho các phép đo từng dòng (create_model, load 'row'),
+            mặc định là 20000.
+        nan_rate (float): Tỷ lệ giá trị bị thiếu, mặc định là 0.05.
+        out_of_range_rate (float): Tỷ lệ giá trị ngoài miền hợp lệ, mặc định là 0.02.
+        duplicate_rate (float): Tỷ lệ Student ID bị trùng, mặc định là 0.01.
+
+    Returns:
+        dict[str, dict]: Kết quả theo '<tên phép đo>@<số dòng>', gồm số dòng, thời gian, số dòng/giây
+            và số câu lệnh SQL theo loại (với các phép đo load).
+    """
+    manager = fake_db.install()
+    with StudentPerformanceDAO(**etl.db_config) as dao:
+        dao.create_indexes()
+    workdir = tempfile.mkdtemp(prefix='sp_bench_')
+    etl.data_dir = workdir
+    etl.staging_dir = os.path.join(workdir, '.staging')
+    # Các dòng bị loại của dữ liệu giả lập không được ghi vào file cách ly thật
+    etl.quarantine_file = os.path.join(workdir, 'quarantine.csv')
+    results = {}
+    try:
+        run_cases_(manager, workdir, results, sizes, repeat, row_limit,
+                   dict(nan_rate=nan_rate, out_of_range_rate=out_of_range_rate, duplicate_rate=duplicate_rate))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def run_cases_(manager: fake_db.SQLiteConnectionManager, workdir: str, results: dict,
+               sizes: list[int], repeat: int, row_limit: int, kwargs: dict):
+    def record(name: str, size: int, rows: int, seconds: float, **extra):
+        results[f'{name}@{size}'] = {
+            'rows': rows,
+            'seconds': seconds,
+            'rows_per_second': rows / seconds if seconds > 0 else None,
+            **extra
+        }
+        print(f'{name:<24}{rows:>10} rows {seconds:>10.4f}s {rows / max(seconds, 1e-12):>14.0f} rows/s')
+
+    reader = SQLFileReader()
+    record('sql_reader.read', 1, 1, measure_(lambda: reader.read(sql_file_path), repeat * 100))
+    query_types = reader.get_enable_queries() * 100
+    record('sql_reader.get_query_of', len(query_types), len(query_types), measure_(
+        lambda: [reader.get_query_of(query_type) for query_type in query_types], repeat))
+
+    for size in sizes:
+        csv_path = write_csv(os.path.join(workdir, f'data_{size}.csv'), size, **kwargs)
+        record('extract', size, size, measure_(lambda: etl.extract(source=csv_path, use_staging=False), repeat))
+
+        raw_df = generate_frame(size, **kwargs)
+        record('transform', size, size, measure_(lambda: etl.transform(raw_df), repeat))
+
+        with redirect_stdout(io.StringIO()):
+            modified_df = etl.transform(raw_df)
+        row_df = modified_df.head(row_limit)
+        record('create_model', size, len(row_df), measure_(
+            lambda: [create_model(row) for _, row in row_df.iterrows()], repeat))
+        record('create_models_from_frame', size, len(modified_df), measure_(lambda: create_models_from_frame(modified_df), repeat))
+
+        for mode, df in (('bulk', modified_df), ('row', row_df)):
+            seconds = measure_(lambda: etl.load(df, mode=mode), repeat, setup=manager.reset)
+            record(f'load_{mode}', size, len(df), seconds, statements=dict(manager.statements))
+
+        # Bảng đang chứa dữ liệu của load_row, tải lại toàn bộ để đo các truy vấn lọc
+        manager.reset()
+        with redirect_stdout(io.StringIO()):
+            etl.load(modified_df)
+        with StudentPerformanceDAO(**etl.db_config) as dao:
+            check_index_usage_(dao)
+            for name, query_kwargs, _ in QUERY_CASES:
+                found = len(dao.find(as_batch=True, **query_kwargs))
+                record(f'dao.{name}', size, found, measure_(lambda: dao.find(as_batch=True, **query_kwargs), repeat))
+
+        sinks = (('sqlite_sink', SQLiteSink(os.path.join(workdir, 'sink.db'))),
+                 ('columnar_sink', ColumnarFileSink(os.path.join(workdir, 'columnar'))))
+        for name, sink in sinks:
+            with sink:
+                record(f'load_{name}', size, len(modified_df), measure_(
+                    lambda: etl.load(modified_df, sink=sink), repeat, setup=sink.delete_all))
+
+
+def compare_(results: dict, baseline: dict, tolerance: float, min_seconds: float = 0.005) -> list[str]:
+    """
+    So sánh kết quả với baseline.
+
+    Args:
+        results (dict): Kết quả của lần đo hiện tại.
+        baseline (dict): Kết quả đã lưu.
+        tolerance (float): Tỷ lệ chậm hơn tối đa được chấp nhận.
+        min_seconds (float): Các phép đo nhanh hơn mức này trong baseline chỉ được in ra,
+            không bị coi là chậm đi (sai số đo quá lớn), mặc định là 0.005.
+
+    Returns:
+        list[str]: Mô tả các phép đo bị chậm hơn quá mức cho phép.
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        ratio = result['seconds'] / base['seconds'] if base['seconds'] > 0 else 1.0
+        if ratio <= 1 + tolerance:
+            status = 'ok'
+        elif base['seconds'] < min_seconds:
+            status = 'noisy'
+        else:
+            status = 'REGRESSION'
+        print(f'{key:<36}{base["seconds"]:>10.4f}s -> {result["seconds"]:>10.4f}s  x{ratio:.2f}  {status}')
+        if status == 'REGRESSION':
+            regressions.append(f'{key}: x{ratio:.2f}')
+    return regressions
+
+
+def main(argv: list[str]|None = None) -> int:
+    parser = argparse.ArgumentParser(description='Offline benchmarks of the ETL pipeline.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--row-limit', type=int, default=20000)
+    parser.add_argument('--nan-rate', type=float, default=0.05)
+    parser.add_argument('--out-of-range-rate', type=float, default=0.02)
+    parser.add_argument('--duplicate-rate', type=float, default=0.01)
+    parser.add_argument('--baseline', default=default_baseline)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store the results as the new baseline instead of comparing')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown ratio before a case counts as a regression')
+    parser.add_argument('--min-seconds', type=float, default=0.005,
+                        help='cases faster than this in the baseline are not gated')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--check-mysql-indexes', action='store_true',
+                        help='check the EXPLAIN plans of the filter queries on the MySQL database '
+                             'of etl.db_config instead of running the benchmarks')
+    args = parser.parse_args(argv)
+
+    if args.check_mysql_indexes:
+        check_mysql_indexes(etl.db_config)
+        return 0
+
+    results = run_benchmarks(args.sizes, args.repeat, args.row_limit,
+                             args.nan_rate, args.out_of_range_rate, args.duplicate_rate)
+    report = {'python': platform.python_version(), 'machine': platform.machine(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f'Baseline saved to {args.baseline}')
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f'No baseline at {args.baseline}, run with --save-baseline first.')
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)['results']
+    regressions = compare_(results, baseline, args.tolerance, args.min_seconds)
+    if regressions:
+        print('Performance regressions: ' + ', '.join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
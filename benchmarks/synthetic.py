@@ -0,0 +1,84 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'business')))
+
+import numpy as np
+import pandas as pd
+
+from field import FieldName
+
+
+ACTIVITY_VALUES = ('Yes', 'No')
+PARENT_EDU_VALUES = ('High School', 'Associate', 'Bachelor', 'Master', 'Doctorate')
+PASSED_VALUES = ('Yes', 'No')
+
+
+def generate_frame(rows: int,
+                   nan_rate: float = 0.05,
+                   out_of_range_rate: float = 0.02,
+                   duplicate_rate: float = 0.01,
+                   seed: int = 42) -> pd.DataFrame:
+    """
+    Sinh dữ liệu thô giả lập có cùng lược đồ (FieldName) với file CSV của Kaggle dataset.
+
+    Mọi cột đều được sinh bằng numpy theo cả cột nên có thể sinh tới hàng chục triệu dòng.
+
+    Args:
+        rows (int): Số dòng cần sinh.
+        nan_rate (float): Tỷ lệ giá trị bị thiếu trong mỗi cột (trừ Student ID), mặc định là 0.05.
+        out_of_range_rate (float): Tỷ lệ giá trị nằm ngoài miền hợp lệ trong mỗi cột số
+            (giờ học âm, tỷ lệ tham gia và điểm số ngoài [0,100]), mặc định là 0.02.
+        duplicate_rate (float): Tỷ lệ dòng có Student ID trùng với một dòng khác, mặc định là 0.01.
+        seed (int): Hạt giống ngẫu nhiên để dữ liệu có thể tái tạo, mặc định là 42.
+
+    Returns:
+        pd.DataFrame: Dữ liệu thô.
+    """
+    rng = np.random.default_rng(seed)
+    width = max(len(str(rows)), 5)
+    ids = np.array([f'S{i:0{width}d}' for i in range(rows)], dtype=object)
+    duplicated = rng.random(rows) < duplicate_rate
+    if rows > 1 and duplicated.any():
+        ids[duplicated] = ids[rng.integers(0, rows, duplicated.sum())]
+
+    study_hours = rng.uniform(5, 40, rows).round(2)
+    attendance_rate = rng.uniform(50, 100, rows).round(2)
+    previous_grades = rng.uniform(40, 100, rows).round(2)
+    study_hours[rng.random(rows) < out_of_range_rate] *= -1
+    attendance_rate[rng.random(rows) < out_of_range_rate] += 100
+    previous_grades[rng.random(rows) < out_of_range_rate] *= -1
+
+    def with_nan(values: np.ndarray) -> np.ndarray:
+        values = values.astype(float if values.dtype.kind == 'f' else object)
+        values[rng.random(rows) < nan_rate] = np.nan
+        return values
+
+    def choice(categories: tuple) -> np.ndarray:
+        return np.array(categories, dtype=object)[rng.integers(0, len(categories), rows)]
+
+    return pd.DataFrame({
+        FieldName.STUDENT_ID: ids,
+        FieldName.STUDY_HOURS: with_nan(study_hours),
+        FieldName.ATTENDANCE_RATE: with_nan(attendance_rate),
+        FieldName.PREVIOUS_GRADES: with_nan(previous_grades),
+        FieldName.PARTICIPATE_ON_ACT: with_nan(choice(ACTIVITY_VALUES)),
+        FieldName.PARENT_EDU_LEVEL: with_nan(choice(PARENT_EDU_VALUES)),
+        FieldName.PASSED: with_nan(choice(PASSED_VALUES))
+    })
+
+
+def write_csv(path: str, rows: int, **kwargs) -> str:
+    """
+    Sinh dữ liệu giả lập và ghi ra file CSV.
+
+    Args:
+        path (str): Đường dẫn file CSV.
+        rows (int): Số dòng cần sinh.
+        **kwargs: Các tham số khác của generate_frame.
+
+    Returns:
+        str: Đường dẫn file CSV.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    generate_frame(rows, **kwargs).to_csv(path, index=False)
+    return path
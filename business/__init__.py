@@ -1,5 +1,11 @@
-from . import etl
-from . import dao
-from . import model
+import importlib
 
-__all__ = ['etl', 'dao', 'model']
\ No newline at end of file
+__all__ = ['etl', 'dao', 'model']
+
+
+def __getattr__(name: str):
+    # Các module con chỉ được import khi được dùng tới, để "from business.etl import ..." không kéo theo
+    # pandas và mysql.connector của dao/model
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,175 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+import time
+import asyncio
+import logging
+from typing import Awaitable, Callable, Literal
+
+from report import LoadReport
+from sampling import create_sampler
+from extractor import DataSource
+from dao import StudentPerformanceDAO
+from metrics import metrics
+import etl
+
+
+async def run_etl_async(load_for: int|None = None,
+                        strategy: Literal['head', 'tail', 'random']|None = 'head',
+                        need_reset: bool = False,
+                        load_mode: Literal['row', 'bulk'] = 'bulk',
+                        chunk_size: int = 1000,
+                        chunksize: int = 10000,
+                        source: DataSource|str|None = None,
+                        queue_size: int = 2,
+                        export_metrics: bool = True) -> LoadReport:
+    """
+    Thực hiện quá trình ETL theo chunk với ba giai đoạn chạy đồng thời (producer/consumer):
+    đọc chunk, transform chunk và load chunk, nối với nhau bằng các hàng đợi có giới hạn,
+    nên transform của chunk k+1 chạy cùng lúc với load của chunk k.
+
+    Các bước đọc file, transform và load (mysql.connector đồng bộ) được đẩy sang thread
+    bằng asyncio.to_thread để không chặn event loop. Các tham số giống như etl_process(stream=True).
+
+    Args:
+        load_for (int|None): Số lượng bản ghi cần tải vào cơ sở dữ liệu, mặc định là None
+        strategy (Literal['head', 'tail', 'random']|None): Chính sách để lấy các bản ghi, mặc định là 'head'
+        need_reset (bool): Yêu cầu reset lại các bản ghi trong CSDL, mặc định là False
+        load_mode (Literal['row', 'bulk']): Cách ghi dữ liệu vào CSDL, mặc định là 'bulk'
+        chunk_size (int): Số bản ghi mỗi lô khi load_mode là 'bulk', mặc định là 1000
+        chunksize (int): Số dòng đọc từ file CSV mỗi chunk, mặc định là 10000
+        source (DataSource|str|None): Nguồn dữ liệu truyền cho extract(), mặc định là None (Kaggle dataset)
+        queue_size (int): Số chunk tối đa chờ trong mỗi hàng đợi, mặc định là 2
+        export_metrics (bool): Ghi số liệu đo của lần chạy ra file khi kết thúc, mặc định là True
+
+    Returns:
+        LoadReport: Kết quả tổng hợp của tất cả các chunk.
+    """
+    raw_queue = asyncio.Queue(maxsize=queue_size)
+    modified_queue = asyncio.Queue(maxsize=queue_size)
+    stop = asyncio.Event()
+    sampler = create_sampler(load_for, strategy)
+    report = LoadReport()
+    # Lần đọc chunk đang chạy trong thread, reader chỉ được đóng sau khi lần đọc này kết thúc
+    reading = None
+
+    async def produce(reader):
+        nonlocal reading
+        while not stop.is_set():
+            reading = asyncio.ensure_future(asyncio.to_thread(next, reader, None))
+            # Hủy producer không hủy lần đọc đang chạy (thread không dừng giữa chừng được)
+            chunk = await asyncio.shield(reading)
+            if chunk is None:
+                break
+            await raw_queue.put(chunk)
+        await raw_queue.put(None)
+
+    async def transform_chunks():
+        while (chunk := await raw_queue.get()) is not None:
+            # Đã lấy đủ mẫu, chỉ cần lấy hết hàng đợi để producer dừng
+            if stop.is_set():
+                continue
+            modified_df = await asyncio.to_thread(etl.transform, chunk)
+            result = sampler.feed(modified_df)
+            if len(result):
+                await modified_queue.put(result)
+            if sampler.done:
+                stop.set()
+        rest = sampler.flush()
+        if rest is not None and len(rest):
+            await modified_queue.put(rest)
+        await modified_queue.put(None)
+
+    async def load_chunks(spDAO):
+        while (modified_df := await modified_queue.get()) is not None:
+            report.merge(await asyncio.to_thread(
+                etl.load, modified_df, load_mode, chunk_size, spDAO))
+
+    start_time = time.perf_counter()
+    status = 'failed'
+    reader = await asyncio.to_thread(etl.extract, chunksize, source)
+    spDAO = None
+    try:
+        spDAO = await asyncio.to_thread(StudentPerformanceDAO, **etl.db_config)
+        if need_reset:
+            await asyncio.to_thread(etl.reset, spDAO)
+        tasks = [
+            asyncio.create_task(produce(reader)),
+            asyncio.create_task(transform_chunks()),
+            asyncio.create_task(load_chunks(spDAO))
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Nếu một giai đoạn lỗi (hoặc lần chạy bị hủy) thì các giai đoạn còn lại bị hủy
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        status = 'ok'
+    finally:
+        # Đóng reader (và file của extractor) cả khi dừng sớm vì đã đủ mẫu hoặc vì lỗi
+        if reading is not None:
+            await asyncio.gather(reading, return_exceptions=True)
+        reader.close()
+        if spDAO is not None:
+            spDAO.close()
+        metrics.observe('etl_run_seconds', time.perf_counter() - start_time, status=status)
+        if export_metrics:
+            await asyncio.to_thread(etl.export_metrics_, status=status, load_mode=load_mode, stream=True, mode='async')
+
+    report.elapsed_time = time.perf_counter() - start_time
+    msg = 'Async ETL finished.\n' + str(report)
+    print(msg)
+    logging.info(msg)
+    return report
+
+
+async def run_schedule(job: Callable[[], Awaitable],
+                       interval: float,
+                       limits: int|None = None,
+                       allow_overlap: bool = False) -> int:
+    """
+    Chạy một job bất đồng bộ theo chu kỳ cố định. Các mốc chạy được tính từ thời điểm bắt đầu
+    (không cộng dồn thời gian chạy của job), nên một lần chạy lâu không đẩy lùi các mốc sau.
+
+    Nếu đến mốc mà lần chạy trước chưa xong: khi allow_overlap là True thì chạy song song,
+    ngược lại mốc đó bị bỏ qua và được ghi log cảnh báo.
+
+    Args:
+        job (Callable[[], Awaitable]): Hàm trả về coroutine cần chạy mỗi mốc.
+        interval (float): Chu kỳ (giây).
+        limits (int|None): Số lần chạy tối đa, None là không giới hạn, mặc định là None.
+        allow_overlap (bool): Cho phép các lần chạy chồng lên nhau, mặc định là False.
+
+    Returns:
+        int: Số lần job đã được chạy.
+    """
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    running = set()
+    job_cnt = 0
+
+    async def run(index: int):
+        logging.info(f'<<Job {index}>>')
+        try:
+            await job()
+        except Exception as e:
+            logging.error(f'Job {index} failed: {e}')
+
+    while limits is None or job_cnt < limits:
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        next_tick += interval
+        if running and not allow_overlap:
+            logging.warning('Previous job is still running, skip this tick.')
+            continue
+        job_cnt += 1
+        task = asyncio.create_task(run(job_cnt))
+        running.add(task)
+        task.add_done_callback(running.discard)
+
+    if running:
+        await asyncio.gather(*running)
+    logging.info(f"Execution count has reached {limits}. Cancelling the job.")
+    return job_cnt
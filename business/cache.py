@@ -0,0 +1,89 @@
+import time
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Bộ nhớ đệm trong tiến trình theo chính sách LRU (bỏ phần tử ít được dùng gần đây nhất),
+    có thể giới hạn thời gian sống (TTL) của từng phần tử. An toàn khi dùng từ nhiều thread.
+
+    Attributes:
+        maxsize (int): Số phần tử tối đa.
+        ttl (float|None): Thời gian sống (giây) của mỗi phần tử, None là không giới hạn.
+        hits (int): Số lần tìm thấy trong bộ nhớ đệm.
+        misses (int): Số lần không tìm thấy.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float|None = None):
+        """
+        Hàm khởi tạo của LRUCache.
+
+        Args:
+            maxsize (int): Số phần tử tối đa, mặc định là 10000.
+            ttl (float|None): Thời gian sống (giây) của mỗi phần tử, mặc định là None (không giới hạn).
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Lấy giá trị theo khóa, phần tử hết hạn được coi như không có.
+
+        Args:
+            key: Khóa.
+            default: Giá trị trả về nếu không tìm thấy, mặc định là None.
+
+        Returns:
+            Giá trị đã lưu hoặc default.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                value, expires_at = item
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value) -> None:
+        """
+        Lưu một giá trị, bỏ phần tử ít được dùng gần đây nhất nếu vượt quá maxsize.
+
+        Args:
+            key: Khóa.
+            value: Giá trị.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key) -> None:
+        """
+        Xóa một khóa khỏi bộ nhớ đệm (nếu có).
+
+        Args:
+            key: Khóa.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Xóa toàn bộ bộ nhớ đệm.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
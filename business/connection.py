@@ -0,0 +1,140 @@
+import time
+import atexit
+import hashlib
+import threading
+
+from mysql.connector import Error, pooling
+
+
+class ConnectionManager:
+    """
+    Lớp quản lý pool kết nối tới cơ sở dữ liệu MySQL, dùng chung cho các DAO trong cùng tiến trình.
+
+    Attributes:
+        _pool (pooling.MySQLConnectionPool): Pool kết nối của mysql.connector.
+        _health_check_interval (float): Số giây một kết nối được phép rảnh trước khi phải kiểm tra lại.
+    """
+
+    def __init__(self, host: str, db: str, user: str, password: str,
+                 pool_size: int = 5,
+                 health_check_interval: float = 30.0):
+        """
+        Hàm khởi tạo của ConnectionManager.
+
+        Args:
+            host (str): Địa chỉ host của cơ sở dữ liệu.
+            db (str): Tên cơ sở dữ liệu.
+            user (str): Tên người dùng của cơ sở dữ liệu.
+            password (str): Mật khẩu của cơ sở dữ liệu.
+            pool_size (int): Số kết nối tối đa trong pool, mặc định là 5.
+            health_check_interval (float): Số giây rảnh tối đa trước khi ping lại kết nối, mặc định là 30.
+
+        Raises:
+            Error: Nếu không tạo được pool kết nối.
+        """
+        # Mật khẩu chỉ tham gia vào tên pool dưới dạng hash
+        key = f'{host}/{db}/{user}/{password_hash_(password)}/{pool_size}/{health_check_interval}'
+        self._pool = pooling.MySQLConnectionPool(
+            pool_name='sp_' + hashlib.md5(key.encode()).hexdigest()[:16],
+            pool_size=pool_size,
+            pool_reset_session=True,
+            host=host,
+            database=db,
+            user=user,
+            password=password
+        )
+        self._health_check_interval = health_check_interval
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool.pool_size
+
+    def close(self) -> None:
+        """
+        Đóng các kết nối đang rảnh trong pool (kết nối đang được dùng vẫn dùng được cho tới khi được trả về).
+        """
+        try:
+            # mysql.connector không có phương thức công khai để đóng các kết nối của pool
+            self._pool._remove_connections()
+        except Error:
+            pass
+
+    def get_connection(self):
+        """
+        Lấy một kết nối từ pool. Gọi close() trên kết nối sẽ trả nó về pool.
+
+        Returns:
+            PooledMySQLConnection: Kết nối lấy từ pool.
+
+        Raises:
+            Error: Nếu pool đã hết kết nối hoặc không kết nối được.
+        """
+        return self._pool.get_connection()
+
+    def check_(self, connection, last_used: float) -> bool:
+        """
+        Kiểm tra sức khỏe của kết nối nếu nó đã rảnh quá lâu. Kết nối hỏng không được tự kết nối lại
+        (phiên mới không còn các câu lệnh prepared và các thay đổi chưa commit của phiên cũ), nơi gọi
+        phải bỏ kết nối và lấy kết nối khác từ pool.
+
+        Args:
+            connection: Kết nối cần kiểm tra.
+            last_used (float): Thời điểm (time.monotonic) kết nối được dùng lần cuối.
+
+        Returns:
+            bool: True nếu kết nối còn dùng được.
+        """
+        if time.monotonic() - last_used < self._health_check_interval:
+            return True
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+
+def password_hash_(password: str) -> str:
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+_managers: dict[tuple, ConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(host: str, db: str, user: str, password: str,
+                           pool_size: int = 5,
+                           health_check_interval: float = 30.0) -> ConnectionManager:
+    """
+    Lấy ConnectionManager dùng chung cho một cấu hình kết nối, tạo mới nếu chưa có.
+
+    Args:
+        host (str): Địa chỉ host của cơ sở dữ liệu.
+        db (str): Tên cơ sở dữ liệu.
+        user (str): Tên người dùng của cơ sở dữ liệu.
+        password (str): Mật khẩu của cơ sở dữ liệu.
+        pool_size (int): Số kết nối tối đa trong pool, mặc định là 5.
+        health_check_interval (float): Số giây rảnh tối đa trước khi ping lại kết nối, mặc định là 30.
+
+    Returns:
+        ConnectionManager: Đối tượng quản lý pool kết nối.
+    """
+    # Hai cấu hình chỉ khác mật khẩu hoặc health_check_interval không dùng chung pool
+    key = (host, db, user, password_hash_(password), pool_size, health_check_interval)
+    with _managers_lock:
+        if key not in _managers:
+            _managers[key] = ConnectionManager(host, db, user, password,
+                                               pool_size=pool_size,
+                                               health_check_interval=health_check_interval)
+        return _managers[key]
+
+
+@atexit.register
+def close_connection_managers() -> None:
+    """
+    Đóng pool kết nối của mọi ConnectionManager dùng chung, được gọi tự động khi tiến trình kết thúc.
+    """
+    with _managers_lock:
+        managers = list(_managers.values())
+        _managers.clear()
+    for manager in managers:
+        manager.close()
@@ -2,11 +2,72 @@ import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-import mysql.connector
+import re
+import time
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 from mysql.connector import Error
 
-from model import StudentModel, create_model
-from sql.sql_reader import SQLFileReader
+from model import StudentModel, StudentBatch, create_model, enum_index_
+from connection import get_connection_manager
+from cache import LRUCache
+from summary import Summary, CATEGORY_COLUMNS, NUMERIC_COLUMNS
+from metrics import metrics, timed, SIZE_BUCKETS
+from sql.sql_reader import get_sql_file_reader
+
+
+# Tên bảng chính, bảng phụ dùng khi tải lại toàn bộ dữ liệu và bảng của lần tải trước (để hoàn tác)
+TABLE = 'student_performance'
+SHADOW_TABLE = TABLE + '_next'
+PREVIOUS_TABLE = TABLE + '_prev'
+# Migration tạo các chỉ mục cho find/top_k (xem StudentPerformanceDAO.create_indexes)
+INDEX_MIGRATION = os.path.join(os.path.dirname(__file__), '..', 'sql', 'migrations', '002_secondary_indexes.sql')
+
+# Các CSDL (theo ConnectionManager) đã được chuẩn bị bảng tổng hợp trong tiến trình này
+_summary_managers = weakref.WeakSet()
+_summary_lock = threading.Lock()
+
+
+# Kết quả được giữ lại để cùng một câu lệnh luôn là cùng một đối tượng str (xem prepared_cursor_)
+@lru_cache(maxsize=None)
+def for_table_(query: str, table: str) -> str:
+    """
+    Đổi bảng student_performance trong một câu lệnh của queries.sql sang bảng khác có cùng cấu trúc.
+
+    Args:
+        query (str): Câu lệnh SQL.
+        table (str): Tên bảng cần dùng.
+
+    Returns:
+        str: Câu lệnh SQL trên bảng mới.
+    """
+    if table == TABLE:
+        return query
+    return re.sub(rf'\b{TABLE}\b', table, query)
+
+
+def apply_summary_(cursor, sql_file_reader, summary: Summary) -> None:
+    """
+    Cộng phần thay đổi vào các bảng tổng hợp bằng một cursor (không commit), dùng chung cho
+    StudentPerformanceDAO và các sink ghi thẳng vào bảng chính.
+
+    Args:
+        cursor: Cursor (không prepared) của kết nối đang ghi dữ liệu.
+        sql_file_reader (SQLFileReader): Đối tượng đọc file queries.sql.
+        summary (Summary): Phần thay đổi cần ghi.
+
+    Raises:
+        Error: Nếu ghi thất bại.
+    """
+    if not summary:
+        return
+    cursor.executemany(sql_file_reader.get_query_of('APPLY SUMMARY DELTA'), summary.summary_params_())
+    histogram = summary.histogram_params_()
+    if histogram:
+        cursor.executemany(sql_file_reader.get_query_of('APPLY HISTOGRAM DELTA'), histogram)
+    metrics.inc('dao_summary_groups_total', len(summary.groups))
 
 
 class DAOException(Exception):
@@ -45,16 +106,82 @@ class NotExistDataException(DAOException):
         super().__init__(message)
 
 
+class TransactionException(DAOException):
+    """
+    Ngoại lệ được ném ra khi một giao dịch của StudentPerformanceDAO.transaction() thất bại,
+    các thay đổi chưa commit đã được hoàn tác.
+
+    Attributes:
+        message (str): Thông điệp của ngoại lệ.
+        committed (int): Số bản ghi đã được commit trước khi lỗi xảy ra.
+        rolled_back_ids (list[str]): Mã sinh viên của các bản ghi bị hoàn tác (cần tải lại).
+    """
+
+    def __init__(self, message, committed: int, rolled_back_ids: list[str]):
+        """
+        Hàm khởi tạo của TransactionException.
+
+        Args:
+            message (str): Thông điệp của ngoại lệ.
+            committed (int): Số bản ghi đã được commit.
+            rolled_back_ids (list[str]): Mã sinh viên của các bản ghi bị hoàn tác.
+        """
+        super().__init__(message)
+        self.committed = committed
+        self.rolled_back_ids = rolled_back_ids
+
+
+class Transaction:
+    """
+    Trạng thái của một giao dịch gộp (unit of work) trên StudentPerformanceDAO.
+
+    Attributes:
+        batch_size (int|None): Số bản ghi ghi được gộp vào mỗi lần commit, None là chỉ commit khi kết thúc.
+        committed (int): Số bản ghi đã được commit.
+        commits (int): Số lần commit.
+        pending_ids (list[str]): Mã sinh viên của các bản ghi đã ghi nhưng chưa commit.
+    """
+
+    def __init__(self, batch_size: int|None):
+        """
+        Hàm khởi tạo của Transaction.
+
+        Args:
+            batch_size (int|None): Số bản ghi mỗi lần commit.
+        """
+        self.batch_size = batch_size
+        self.committed = 0
+        self.commits = 0
+        self.pending_ids = []
+
+
 class StudentPerformanceDAO:
     """
     Lớp để thao tác với cơ sở dữ liệu liên quan đến hiệu suất học tập của sinh viên.
 
+    Có thể dùng như một context manager để cả một lần chạy ETL dùng chung một kết nối,
+    kết nối được trả về pool khi thoát khỏi khối with.
+
     Attributes:
-        _connection: Kết nối cơ sở dữ liệu.
+        _connection: Kết nối cơ sở dữ liệu (lấy từ pool).
+        _manager (ConnectionManager): Đối tượng quản lý pool kết nối.
+        _last_used (float): Thời điểm kết nối được dùng lần cuối.
         _sqlFileReader: Đối tượng đọc file SQL.
+        _cache (LRUCache|None): Bộ nhớ đệm đọc theo mã sinh viên, bị xóa khi DAO này ghi dữ liệu.
+        _table (str): Bảng mà các câu lệnh đọc/ghi dữ liệu thao tác trên.
+        _cursors (dict): Các cursor prepared theo câu lệnh trên kết nối hiện tại.
+        _transaction (Transaction|None): Giao dịch gộp đang mở, None khi mỗi thao tác tự commit.
+        _checkpoint (tuple|None): Mốc tải (run_id, part, position) sẽ được ghi cùng lần commit ghi dữ liệu tiếp theo.
+        _enum_codes (bool): Gửi các cột phân loại dưới dạng chỉ số ENUM khi ghi nhiều bản ghi.
+        _summaries (bool): Cập nhật các bảng tổng hợp cùng mỗi lần ghi dữ liệu.
+        _summary (Summary|None): Phần thay đổi của các bảng tổng hợp sẽ được ghi cùng lần commit tiếp theo.
     """
 
-    def __init__(self, host: str, db: str, user: str, password: str):
+    def __init__(self, host: str, db: str, user: str, password: str, pool_size: int = 5,
+                 cache: LRUCache|None = None,
+                 table: str = TABLE,
+                 enum_codes: bool = False,
+                 summaries: bool = False):
         """
         Hàm khởi tạo của StudentPerformanceDAO.
 
@@ -63,49 +190,554 @@ class StudentPerformanceDAO:
             db (str): Tên cơ sở dữ liệu.
             user (str): Tên người dùng của cơ sở dữ liệu.
             password (str): Mật khẩu của cơ sở dữ liệu.
+            pool_size (int): Số kết nối tối đa trong pool dùng chung, mặc định là 5.
+            cache (LRUCache|None): Bộ nhớ đệm cho get/get_many, mặc định là None (không dùng).
+                Chỉ các thao tác ghi qua chính DAO này mới xóa phần tử tương ứng trong bộ nhớ đệm,
+                nên nên đặt TTL nếu có tiến trình khác cùng ghi vào bảng.
+            table (str): Bảng để đọc/ghi dữ liệu, ví dụ SHADOW_TABLE khi tải lại toàn bộ dữ liệu,
+                mặc định là TABLE (student_performance).
+            enum_codes (bool): Gửi các cột phân loại của upsert_many dưới dạng chỉ số ENUM (số nguyên nhỏ)
+                thay vì chuỗi, chỉ bật khi bảng đã được chuyển sang ENUM bằng
+                sql/migrations/001_categorical_enums.sql, mặc định là False.
+            summaries (bool): Cập nhật bảng student_performance_summary/student_performance_histogram theo
+                phần thay đổi của mỗi lần ghi, trong cùng giao dịch với dữ liệu (chỉ với bảng chính),
+                mặc định là False. Các bảng được tạo và tính từ dữ liệu hiện có ở lần đầu dùng trong tiến trình.
         """
-        self.connect_(host, db, user, password)
+        self._cache = cache
+        self._table = table
+        self._enum_codes = enum_codes
+        self._summaries = summaries and table == TABLE
+        self._summary = None
+        self._cursors = {}
+        self._transaction = None
+        self._checkpoint = None
+        self.connect_(host, db, user, password, pool_size)
         self.get_sql_file_reader_()
+        if self._summaries:
+            self.prepare_summaries_()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
-    def connect_(self, host: str, db: str, user: str, password: str):
+    def connect_(self, host: str, db: str, user: str, password: str, pool_size: int = 5):
         """
-        Kết nối tới cơ sở dữ liệu.
+        Lấy một kết nối tới cơ sở dữ liệu từ pool dùng chung.
 
         Args:
             host (str): Địa chỉ host của cơ sở dữ liệu.
             db (str): Tên cơ sở dữ liệu.
             user (str): Tên người dùng của cơ sở dữ liệu.
             password (str): Mật khẩu của cơ sở dữ liệu.
+            pool_size (int): Số kết nối tối đa trong pool dùng chung, mặc định là 5.
 
         Raises:
             DAOException: Nếu kết nối tới cơ sở dữ liệu thất bại.
         """
         try:
-            self._connection = mysql.connector.connect(
-                host=host,
-                database=db,
-                user=user,
-                password=password
-            )              
+            self._manager = get_connection_manager(host, db, user, password, pool_size=pool_size)
+            self._connection = self._manager.get_connection()
+            self._last_used = time.monotonic()
         except Error as ex:
             print("Error", ex)
             raise DAOException(ex.msg)
+
+    def check_connection_(self):
+        """
+        Kiểm tra kết nối trước khi thực thi câu lệnh. Kết nối chỉ được ping khi đã rảnh
+        quá lâu, nếu kết nối hỏng thì lấy kết nối khác từ pool.
+
+        Raises:
+            DAOException: Nếu không có kết nối dùng được.
+            TransactionException: Nếu kết nối hỏng khi đang trong transaction().
+        """
+        if self._connection is None:
+            raise DAOException("Connection is null!")
+        if not self._manager.check_(self._connection, self._last_used):
+            if self._transaction is not None:
+                # Kết nối mới không có các thay đổi chưa commit của giao dịch
+                raise TransactionException("Connection lost during transaction!",
+                                           self._transaction.committed, list(self._transaction.pending_ids))
+            self.close_cursors_()
+            try:
+                self._connection.close()
+            except Error:
+                pass
+            try:
+                self._connection = self._manager.get_connection()
+            except Error as ex:
+                self._connection = None
+                raise DAOException(ex.msg)
+        self._last_used = time.monotonic()
         
+    def commit_(self, ids: list[str] = ()):
+        """
+        Kết thúc một thao tác: commit ngay, hoặc khi đang trong transaction() thì chỉ ghi nhận
+        các bản ghi đã ghi và commit khi đủ batch_size bản ghi.
+
+        Args:
+            ids (list[str]): Mã sinh viên của các bản ghi vừa được ghi, mặc định là rỗng (thao tác đọc).
+
+        Raises:
+            Error: Nếu commit thất bại.
+            TransactionException: Nếu commit của giao dịch gộp thất bại.
+        """
+        transaction = self._transaction
+        if transaction is not None:
+            transaction.pending_ids.extend(ids)
+            if transaction.batch_size is None or len(transaction.pending_ids) < transaction.batch_size:
+                return
+            self.flush_()
+            return
+        if ids:
+            self.write_summary_()
+            self.write_checkpoint_()
+        self._connection.commit()
+        metrics.inc('dao_commits_total')
+
+    def flush_(self):
+        """
+        Commit các bản ghi đang chờ của giao dịch gộp.
+
+        Raises:
+            TransactionException: Nếu commit thất bại (giao dịch không thể tiếp tục).
+        """
+        transaction = self._transaction
+        try:
+            if transaction.pending_ids:
+                self.write_summary_()
+                self.write_checkpoint_()
+            self._connection.commit()
+        except Error as ex:
+            raise TransactionException(ex.msg, transaction.committed, list(transaction.pending_ids))
+        metrics.inc('dao_commits_total')
+        metrics.observe('dao_commit_batch_size', len(transaction.pending_ids), buckets=SIZE_BUCKETS)
+        transaction.committed += len(transaction.pending_ids)
+        transaction.commits += 1
+        transaction.pending_ids.clear()
+
+    @contextmanager
+    def transaction(self, batch_size: int|None = 1000):
+        """
+        Gộp các thao tác ghi trong khối with thành các giao dịch, mỗi giao dịch commit batch_size bản ghi
+        thay vì commit sau từng câu lệnh. Các thao tác đọc trong khối không commit.
+
+        Nếu có lỗi, các bản ghi chưa commit được hoàn tác và TransactionException cho biết số bản ghi đã
+        commit cùng mã sinh viên của các bản ghi cần tải lại.
+
+        Args:
+            batch_size (int|None): Số bản ghi mỗi lần commit, mặc định là 1000.
+                None là chỉ commit một lần khi ra khỏi khối with.
+
+        Yields:
+            Transaction: Trạng thái của giao dịch (số bản ghi đã commit, các bản ghi đang chờ).
+
+        Raises:
+            ValueError: Nếu batch_size không dương.
+            DAOException: Nếu DAO đang trong một giao dịch khác.
+            TransactionException: Nếu có lỗi khi ghi hoặc commit.
+        """
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("batch_size must be positive!")
+        if self._transaction is not None:
+            raise DAOException("Transaction is already in progress!")
+        self.check_connection_()
+        transaction = Transaction(batch_size)
+        self._transaction = transaction
+        try:
+            yield transaction
+            if transaction.pending_ids or transaction.commits == 0:
+                self.flush_()
+        except (Error, DAOException) as ex:
+            rolled_back_ids = list(transaction.pending_ids)
+            self._checkpoint = None
+            self._summary = None
+            try:
+                self._connection.rollback()
+            except Error:
+                pass
+            # Bộ nhớ đệm có thể chứa bản ghi chưa commit đã đọc trong giao dịch
+            if self._cache is not None:
+                self._cache.clear()
+            if isinstance(ex, TransactionException):
+                raise
+            msg = ex.msg if isinstance(ex, Error) else str(ex)
+            raise TransactionException(msg, transaction.committed, rolled_back_ids) from ex
+        finally:
+            self._transaction = None
+
+    def prepared_cursor_(self, query: str):
+        """
+        Lấy cursor prepared của một câu lệnh trên kết nối hiện tại, tạo mới nếu chưa có. Cursor được
+        dùng lại qua các lần gọi nên câu lệnh chỉ được prepare một lần cho mỗi kết nối.
+
+        Các câu lệnh phải đọc hết kết quả (fetchall) trước khi cursor được dùng lại.
+
+        Args:
+            query (str): Câu lệnh SQL (lấy từ query_).
+
+        Returns:
+            MySQLCursorPrepared: Cursor prepared.
+        """
+        cursor = self._cursors.get(query)
+        if cursor is None:
+            cursor = self._connection.cursor(prepared=True)
+            self._cursors[query] = cursor
+            metrics.inc('dao_statements_prepared_total')
+        return cursor
+
+    def close_cursors_(self):
+        """
+        Đóng các cursor prepared của kết nối hiện tại (trước khi trả hoặc bỏ kết nối).
+        """
+        for cursor in self._cursors.values():
+            try:
+                cursor.close()
+            except Error:
+                pass
+        self._cursors.clear()
+
     def get_sql_file_reader_(self):
         """
-        Lấy đối tượng đọc file SQL.
+        Lấy đối tượng đọc file SQL dùng chung trong tiến trình (chỉ đọc lại khi file thay đổi).
 
         Raises:
             Exception: Nếu đọc file SQL thất bại.
         """
-        self._sqlFileReader = SQLFileReader()
+        self._sqlFileReader = None
         try:
             curr_dir = os.path.dirname(__file__)
             sql_file_path = os.path.join(curr_dir, '..', 'sql', 'queries.sql')
-            self._sqlFileReader.read(sql_file_path=sql_file_path)
+            self._sqlFileReader = get_sql_file_reader(sql_file_path)
         except Exception as ioException:
             print(ioException)
     
+    def query_(self, query_type: str) -> str:
+        """
+        Lấy câu lệnh đọc/ghi dữ liệu trên bảng của DAO.
+
+        Args:
+            query_type (str): Loại truy vấn trong queries.sql.
+
+        Returns:
+            str: Câu lệnh SQL.
+        """
+        return for_table_(self._sqlFileReader.get_query_of(query_type), self._table)
+
+    def execute_ddl_(self, *query_types: str) -> None:
+        """
+        Thực thi lần lượt các câu lệnh định nghĩa bảng trong queries.sql (không đổi tên bảng).
+
+        Args:
+            *query_types (str): Các loại truy vấn.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi thực thi.
+        """
+        self.check_connection_()
+        if self._transaction is not None:
+            raise DAOException("DDL cannot run inside a transaction!")
+        try:
+            cursor = self._connection.cursor(prepared=False)
+            for query_type in query_types:
+                cursor.execute(self._sqlFileReader.get_query_of(query_type))
+            cursor.close()
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+
+    def create_indexes(self) -> list[str]:
+        """
+        Tạo các chỉ mục của sql/migrations/002_secondary_indexes.sql còn thiếu trên bảng. Các chỉ mục
+        đã có (theo information_schema.statistics) được bỏ qua nên chạy lại nhiều lần vẫn an toàn.
+
+        Returns:
+            list[str]: Tên các chỉ mục vừa được tạo.
+
+        Raises:
+            DAOException: Nếu đang trong transaction() hoặc lỗi khi đọc/tạo chỉ mục.
+        """
+        if self._transaction is not None:
+            raise DAOException("DDL cannot run inside a transaction!")
+        migration = get_sql_file_reader(INDEX_MIGRATION)
+        self.check_connection_()
+        created = []
+        try:
+            cursor = self._connection.cursor(prepared=False)
+            cursor.execute(self._sqlFileReader.get_query_of('GET INDEX NAMES'), (self._table,))
+            existing = {row[0] for row in cursor.fetchall()}
+            for query_type in migration.get_enable_queries():
+                query = for_table_(migration.get_query_of(query_type), self._table)
+                name = re.match(r'CREATE INDEX (\w+)', query).group(1)
+                if name not in existing:
+                    cursor.execute(query)
+                    created.append(name)
+            cursor.close()
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+        return created
+
+    def write_checkpoint_(self):
+        """
+        Ghi mốc tải đang chờ trong giao dịch hiện tại (ngay trước commit).
+
+        Raises:
+            Error: Nếu ghi thất bại.
+        """
+        if self._checkpoint is None:
+            return
+        save_query = self._sqlFileReader.get_query_of('SAVE CHECKPOINT')
+        self.prepared_cursor_(save_query).execute(save_query, self._checkpoint)
+        self._checkpoint = None
+
+    def create_checkpoint_table(self) -> None:
+        """
+        Tạo bảng etl_checkpoint lưu mốc tải của các lần tải có thể tiếp tục (nếu chưa có).
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi tạo bảng.
+        """
+        self.execute_ddl_('CREATE CHECKPOINT TABLE')
+
+    def get_checkpoints(self, run_id: str) -> dict[str, int]:
+        """
+        Lấy các mốc tải đã commit của một lần tải.
+
+        Args:
+            run_id (str): Mã của lần tải (theo nguồn dữ liệu và tham số).
+
+        Returns:
+            dict[str, int]: Số bản ghi đã tải xong theo từng phần dữ liệu.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi đọc.
+        """
+        self.check_connection_()
+        try:
+            get_query = self._sqlFileReader.get_query_of('GET CHECKPOINTS')
+            cursor = self.prepared_cursor_(get_query)
+            cursor.execute(get_query, (run_id,))
+            result = cursor.fetchall()
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+        return {part: int(position) for part, position in result}
+
+    def checkpoint(self, run_id: str, part: str, position: int) -> None:
+        """
+        Đặt mốc tải cho phần dữ liệu: mốc được ghi trong cùng giao dịch với lần commit ghi dữ liệu
+        tiếp theo, nên mốc đã lưu luôn khớp với dữ liệu đã commit.
+
+        Args:
+            run_id (str): Mã của lần tải.
+            part (str): Tên phần dữ liệu (ví dụ 'batch', 'chunk-3').
+            position (int): Số bản ghi đầu tiên của phần đã tải xong sau lần commit đó.
+        """
+        self._checkpoint = (run_id, part, position)
+
+    def discard_checkpoint(self) -> None:
+        """
+        Bỏ mốc tải đang chờ (khi lần ghi tương ứng thất bại).
+        """
+        self._checkpoint = None
+
+    def clear_checkpoints(self, run_id: str) -> None:
+        """
+        Xóa các mốc tải của một lần tải đã hoàn tất.
+
+        Args:
+            run_id (str): Mã của lần tải.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi xóa.
+        """
+        self.check_connection_()
+        try:
+            cursor = self._connection.cursor(prepared=False)
+            cursor.execute(self._sqlFileReader.get_query_of('CLEAR CHECKPOINTS'), (run_id,))
+            cursor.close()
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+
+    def track_summary_(self, added: StudentBatch|list[tuple] = (), removed: StudentBatch|list[tuple] = ()):
+        """
+        Ghi nhận phần thay đổi của các bảng tổng hợp sau một lần ghi, được ghi cùng lần commit tiếp theo.
+
+        Args:
+            added (StudentBatch|list[tuple]): Các bản ghi mới (theo thứ tự cột của bảng), mặc định là rỗng.
+            removed (StudentBatch|list[tuple]): Các bản ghi cũ bị thay thế hoặc bị xóa, mặc định là rỗng.
+        """
+        if self._summary is None:
+            self._summary = Summary()
+        for rows, sign in ((added, 1), (removed, -1)):
+            if isinstance(rows, StudentBatch):
+                self._summary.add_batch(rows, sign)
+            else:
+                for row in rows:
+                    self._summary.add_row(row, sign)
+
+    def write_summary_(self):
+        """
+        Ghi phần thay đổi đang chờ của các bảng tổng hợp (ngay trước commit).
+
+        Raises:
+            Error: Nếu ghi thất bại.
+        """
+        summary, self._summary = self._summary, None
+        if not summary:
+            return
+        cursor = self._connection.cursor(prepared=False)
+        apply_summary_(cursor, self._sqlFileReader, summary)
+        cursor.close()
+
+    def prepare_summaries_(self):
+        """
+        Tạo các bảng tổng hợp nếu chưa có và tính lại từ dữ liệu hiện có nếu bảng tổng hợp còn rỗng,
+        mỗi CSDL một lần trong tiến trình.
+
+        Raises:
+            DAOException: Nếu lỗi khi tạo hoặc tính các bảng tổng hợp.
+        """
+        with _summary_lock:
+            if self._manager in _summary_managers:
+                return
+            self.create_summary_tables()
+            if not self.get_summary() and self.has_records_():
+                self.refresh_summaries()
+            _summary_managers.add(self._manager)
+
+    def has_records_(self) -> bool:
+        """
+        Kiểm tra bảng có bản ghi nào hay không (chỉ đọc một dòng theo khóa chính).
+
+        Returns:
+            bool: True nếu bảng có ít nhất một bản ghi.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi đọc.
+        """
+        self.check_connection_()
+        try:
+            get_query = self.query_('GET PAGE AFTER ID')
+            cursor = self.prepared_cursor_(get_query)
+            cursor.execute(get_query, ('', 1))
+            rows = cursor.fetchall()
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+        return bool(rows)
+
+    def create_summary_tables(self) -> None:
+        """
+        Tạo các bảng student_performance_summary và student_performance_histogram (nếu chưa có).
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi tạo bảng.
+        """
+        self.execute_ddl_('CREATE SUMMARY TABLE', 'CREATE HISTOGRAM TABLE')
+
+    def refresh_summaries(self, batch_size: int = 10000) -> None:
+        """
+        Tính lại toàn bộ các bảng tổng hợp từ bảng chính (một lần duyệt toàn bảng), ví dụ sau khi đổi bảng
+        hoặc sau khi ghi bằng một sink không đi qua DAO. Các bảng tổng hợp được thay trong một giao dịch.
+
+        Args:
+            batch_size (int): Số bản ghi mỗi lần đọc, mặc định là 10000.
+
+        Raises:
+            DAOException: Nếu đang trong transaction() hoặc lỗi khi đọc/ghi.
+        """
+        if self._transaction is not None:
+            raise DAOException("Summaries cannot be refreshed inside a transaction!")
+        summary = Summary()
+        for batch in self.iter_all(batch_size=batch_size, as_batch=True, keyset=True):
+            summary.add_batch(batch)
+        self.check_connection_()
+        try:
+            cursor = self._connection.cursor(prepared=False)
+            cursor.execute(self._sqlFileReader.get_query_of('CLEAR SUMMARY'))
+            cursor.execute(self._sqlFileReader.get_query_of('CLEAR HISTOGRAM'))
+            cursor.close()
+            self._summary = summary
+            self.write_summary_()
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+
+    @timed('dao_call_seconds', call='get_summary')
+    def get_summary(self) -> Summary:
+        """
+        Đọc các bảng tổng hợp (số sinh viên, tổng, tổng bình phương và biểu đồ phân bố theo nhóm phân loại).
+        Chi phí chỉ phụ thuộc vào số nhóm, không phụ thuộc vào số bản ghi.
+
+        Returns:
+            Summary: Các số liệu tổng hợp, dùng Summary.pass_rates, Summary.stats, Summary.histogram.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi đọc.
+        """
+        self.check_connection_()
+        try:
+            cursor = self._connection.cursor(prepared=False)
+            cursor.execute(self._sqlFileReader.get_query_of('GET SUMMARY'))
+            summary_rows = cursor.fetchall()
+            cursor.execute(self._sqlFileReader.get_query_of('GET HISTOGRAM'))
+            histogram_rows = cursor.fetchall()
+            cursor.close()
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+        return Summary.from_rows_(summary_rows, histogram_rows)
+
+    def create_shadow_table(self) -> None:
+        """
+        Tạo mới bảng phụ SHADOW_TABLE (rỗng, cùng cấu trúc với bảng chính) để tải lại toàn bộ dữ liệu
+        trong khi bảng chính vẫn phục vụ đọc.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi tạo bảng.
+        """
+        self.execute_ddl_('DROP SHADOW TABLE', 'CREATE SHADOW TABLE')
+
+    def swap_tables(self, keep_previous: bool = False) -> None:
+        """
+        Đưa bảng phụ vào thay bảng chính bằng một câu lệnh RENAME TABLE (nguyên tử, người đọc không
+        bao giờ thấy bảng rỗng). Bảng chính cũ được đổi tên thành PREVIOUS_TABLE.
+
+        Args:
+            keep_previous (bool): Giữ lại bảng cũ để có thể hoàn tác bằng rollback_swap(),
+                mặc định là False (xóa bảng cũ).
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi đổi bảng.
+        """
+        self.execute_ddl_('DROP PREVIOUS TABLE', 'SWAP SHADOW TABLE')
+        if not keep_previous:
+            self.execute_ddl_('DROP PREVIOUS TABLE')
+        if self._cache is not None:
+            self._cache.clear()
+        if self._summaries:
+            self.refresh_summaries()
+
+    def rollback_swap(self) -> None:
+        """
+        Hoàn tác lần đổi bảng gần nhất: bảng cũ (PREVIOUS_TABLE) trở lại làm bảng chính,
+        bảng vừa tải trở thành bảng phụ.
+
+        Raises:
+            DAOException: Nếu không có bảng cũ (swap_tables chạy với keep_previous là False) hoặc lỗi khi đổi bảng.
+        """
+        self.execute_ddl_('DROP SHADOW TABLE', 'ROLLBACK SWAP')
+        if self._cache is not None:
+            self._cache.clear()
+        if self._summaries:
+            self.refresh_summaries()
+
+    @timed('dao_call_seconds', call='insert')
     def insert(self, new_model: StudentModel) -> None:
         """
         Thêm một bản ghi mới vào cơ sở dữ liệu.
@@ -116,12 +748,11 @@ class StudentPerformanceDAO:
         Raises:
             DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi thêm bản ghi.
         """
-        if not self._connection.is_connected():
-            raise DAOException("Connection is null!")
+        self.check_connection_()
         
         # Chuẩn bị câu lệnh truy vấn và giá trị cần thêm
-        cursor = self._connection.cursor(prepared=True)
-        insert_query = self._sqlFileReader.get_query_of('INSERT A NEW RECORD')
+        insert_query = self.query_('INSERT A NEW RECORD')
+        cursor = self.prepared_cursor_(insert_query)
         values = (
             new_model.id,
             new_model.study_hours_per_week,
@@ -132,31 +763,37 @@ class StudentPerformanceDAO:
             new_model.passed
         )
         cursor.execute(insert_query, values)
-        cursor.close()
+        if self._cache is not None:
+            self._cache.invalidate(new_model.id)
+        if self._summaries:
+            self.track_summary_(added=[values])
         
         # Commit các thay đổi vào cơ sở dữ liệu
         try:
-            self._connection.commit()
+            self.commit_([new_model.id])
         except Error as ex:
             raise DAOException(ex.msg)
         
-    def get_all(self) -> list[StudentModel]:
+    @timed('dao_call_seconds', call='get_all')
+    def get_all(self, as_batch: bool = False) -> list[StudentModel]|StudentBatch:
         """
         Lấy tất cả các bản ghi từ cơ sở dữ liệu.
 
+        Args:
+            as_batch (bool): Trả về StudentBatch lưu theo cột thay vì danh sách StudentModel, mặc định là False
+
         Returns:
-            list[StudentModel]: Danh sách các mô hình sinh viên.
+            list[StudentModel]|StudentBatch: Danh sách các mô hình sinh viên hoặc lô sinh viên.
 
         Raises:
             DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi lấy bản ghi.
             NotExistDataException: Nếu không tìm thấy dữ liệu.
         """
-        if not self._connection.is_connected():
-            raise DAOException("Connection is null!")
+        self.check_connection_()
         
         # Thực thi câu lệnh truy vấn để lấy tất cả các bản ghi
         cursor = self._connection.cursor(prepared=False)
-        get_query = self._sqlFileReader.get_query_of('GET ALL')
+        get_query = self.query_('GET ALL')
         cursor.execute(get_query)
         result = cursor.fetchall()
         cursor.close()
@@ -166,7 +803,9 @@ class StudentPerformanceDAO:
         
         # Chuyển đổi kết quả thành danh sách các mô hình sinh viên
         try:
-            self._connection.commit()
+            self.commit_()
+            if as_batch:
+                return StudentBatch.from_rows(result)
             models = []
             for row in result:
                 models.append(create_model(row))
@@ -174,6 +813,248 @@ class StudentPerformanceDAO:
         except Error as ex:
             raise DAOException(ex.msg)
         
+    def iter_all(self, batch_size: int = 1000,
+                 as_batch: bool = False,
+                 keyset: bool = False,
+                 after_id: str|None = None):
+        """
+        Duyệt tất cả các bản ghi theo từng lô thay vì đọc hết vào bộ nhớ như get_all().
+
+        Mặc định dùng một cursor không đệm (kết quả được đọc dần từ server bằng fetchmany), theo thứ tự
+        của get_all(). Trong lúc duyệt, kết nối của DAO không dùng được cho câu lệnh khác.
+        Khi keyset là True, mỗi lô là một truy vấn riêng WHERE student_id > (mã cuối của lô trước)
+        sắp theo student_id, nên có thể tiếp tục một lần duyệt dở dang bằng after_id.
+
+        Args:
+            batch_size (int): Số bản ghi mỗi lô, mặc định là 1000.
+            as_batch (bool): Trả về từng StudentBatch thay vì từng StudentModel, mặc định là False.
+            keyset (bool): Phân trang theo student_id, mặc định là False.
+            after_id (str|None): Chỉ lấy các bản ghi có mã sinh viên lớn hơn giá trị này
+                (dùng với keyset là True), mặc định là None.
+
+        Yields:
+            StudentModel|StudentBatch: Từng mô hình sinh viên hoặc từng lô sinh viên.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi lấy bản ghi.
+        """
+        if after_id is not None and not keyset:
+            raise ValueError("after_id requires keyset=True!")
+        pages = self.iter_keyset_pages_(batch_size, after_id) if keyset else self.iter_stream_pages_(batch_size)
+        for rows in pages:
+            if as_batch:
+                yield StudentBatch.from_rows(rows)
+            else:
+                for row in rows:
+                    yield create_model(row)
+
+    def iter_stream_pages_(self, batch_size: int):
+        """
+        Đọc các bản ghi của GET ALL qua một cursor không đệm, mỗi lần fetchmany một trang. Các dòng
+        chưa đọc được bỏ đi khi việc duyệt bị dừng giữa chừng để kết nối dùng lại được.
+
+        Args:
+            batch_size (int): Số bản ghi mỗi trang.
+
+        Yields:
+            list[tuple]: Các bản ghi của từng trang theo thứ tự cột của bảng.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi lấy bản ghi.
+        """
+        self.check_connection_()
+        cursor = self._connection.cursor(buffered=False)
+        try:
+            cursor.execute(self.query_('GET ALL'))
+            while rows := cursor.fetchmany(batch_size):
+                yield rows
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+        finally:
+            # Bỏ các dòng chưa đọc nếu việc duyệt bị dừng giữa chừng
+            try:
+                self._connection.consume_results()
+                cursor.close()
+            except Error:
+                pass
+
+    def iter_keyset_pages_(self, batch_size: int, after_id: str|None):
+        """
+        Đọc các bản ghi theo thứ tự student_id, mỗi trang là một truy vấn riêng WHERE student_id > mã cuối
+        của trang trước, nên kết nối không bị giữ giữa các trang.
+
+        Args:
+            batch_size (int): Số bản ghi mỗi trang.
+            after_id (str|None): Chỉ lấy các bản ghi có mã sinh viên lớn hơn giá trị này, None là từ đầu.
+
+        Yields:
+            list[tuple]: Các bản ghi của từng trang theo thứ tự cột của bảng.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi lấy bản ghi.
+        """
+        get_query = self.query_('GET PAGE AFTER ID')
+        last_id = after_id if after_id is not None else ''
+        while True:
+            self.check_connection_()
+            try:
+                cursor = self.prepared_cursor_(get_query)
+                cursor.execute(get_query, (last_id, batch_size))
+                rows = cursor.fetchall()
+                self.commit_()
+            except Error as ex:
+                raise DAOException(ex.msg)
+            if not rows:
+                return
+            yield rows
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
+    def find_query_(self, filters: dict, order_by: str|None, descending: bool,
+                    limit: int|None) -> tuple[str, tuple]:
+        """
+        Tạo câu lệnh FIND RECORDS từ các điều kiện lọc (chỉ gồm tên cột hợp lệ, giá trị được truyền
+        dưới dạng tham số).
+
+        Returns:
+            tuple[str, tuple]: Câu lệnh SQL và các tham số.
+
+        Raises:
+            ValueError: Nếu tên cột hoặc điều kiện lọc không hợp lệ.
+        """
+        conditions = []
+        params = []
+        for column, value in filters.items():
+            if column in NUMERIC_COLUMNS:
+                if not isinstance(value, tuple) or len(value) != 2:
+                    raise ValueError(f"Filter on {column} must be a (low, high) tuple!")
+                low, high = value
+                if low is not None:
+                    conditions.append(f'{column} >= %s')
+                    params.append(low)
+                if high is not None:
+                    conditions.append(f'{column} < %s')
+                    params.append(high)
+            elif column in CATEGORY_COLUMNS:
+                values = [value] if isinstance(value, str) else list(value)
+                if not values:
+                    raise ValueError(f"Filter on {column} must not be empty!")
+                if len(values) == 1:
+                    conditions.append(f'{column} = %s')
+                else:
+                    conditions.append(f'{column} IN ({", ".join(["%s"] * len(values))})')
+                params.extend(values)
+            else:
+                raise ValueError(f"Unknown filter column: {column}")
+
+        if order_by is None:
+            # Sắp theo cột có điều kiện khoảng để duyệt theo thứ tự của chính chỉ mục được dùng để lọc
+            order_by = next((column for column in filters if column in NUMERIC_COLUMNS), None)
+        elif order_by not in NUMERIC_COLUMNS + CATEGORY_COLUMNS:
+            raise ValueError(f"Unknown order column: {order_by}")
+        direction = ' DESC' if descending else ''
+        # Cùng chiều với cột sắp xếp để dùng được chỉ mục (chỉ mục phụ của InnoDB có kèm khóa chính)
+        order = f'{order_by}{direction}, student_id{direction}' if order_by is not None else f'student_id{direction}'
+        if limit is not None:
+            if limit <= 0:
+                raise ValueError("limit must be positive!")
+            params.append(limit)
+        query = self.query_('FIND RECORDS').format(
+            conditions=' AND '.join(conditions) if conditions else '1 = 1',
+            order=order,
+            limit='LIMIT %s' if limit is not None else ''
+        )
+        return query, tuple(params)
+
+    @timed('dao_call_seconds', call='find')
+    def find(self, limit: int|None = None,
+             order_by: str|None = None,
+             descending: bool = False,
+             as_batch: bool = False,
+             **filters) -> list[StudentModel]|StudentBatch:
+        """
+        Lấy các bản ghi thỏa mãn các điều kiện lọc, việc lọc và sắp xếp được thực hiện trên server
+        (dùng các chỉ mục của sql/migrations/002_secondary_indexes.sql) thay vì đọc cả bảng.
+
+        Ví dụ: find(attendance_rate=(None, 60), passed='No').
+
+        Args:
+            limit (int|None): Số bản ghi tối đa, mặc định là None (không giới hạn).
+            order_by (str|None): Cột để sắp xếp, mặc định là None (theo cột số đầu tiên có điều kiện
+                khoảng, nếu không có thì theo student_id).
+            descending (bool): Sắp xếp giảm dần, mặc định là False.
+            as_batch (bool): Trả về StudentBatch thay vì danh sách StudentModel, mặc định là False.
+            **filters: Điều kiện theo tên cột của bảng: các cột số nhận (low, high) với low <= giá trị < high
+                (None là không giới hạn phía đó), các cột phân loại nhận một giá trị hoặc danh sách giá trị.
+
+        Returns:
+            list[StudentModel]|StudentBatch: Các mô hình sinh viên hoặc lô sinh viên.
+
+        Raises:
+            ValueError: Nếu điều kiện lọc không hợp lệ.
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi lấy bản ghi.
+        """
+        query, params = self.find_query_(filters, order_by, descending, limit)
+        self.check_connection_()
+        try:
+            cursor = self._connection.cursor(prepared=False)
+            cursor.execute(query, params)
+            result = cursor.fetchall()
+            cursor.close()
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+        metrics.observe('dao_batch_size', len(result), buckets=SIZE_BUCKETS, call='find')
+        if as_batch:
+            return StudentBatch.from_rows(result)
+        return [create_model(row) for row in result]
+
+    def top_k(self, k: int, column: str = 'previous_grades', as_batch: bool = False,
+              **filters) -> list[StudentModel]|StudentBatch:
+        """
+        Lấy k bản ghi có giá trị lớn nhất của một cột số (mặc định là điểm số trước đó).
+
+        Args:
+            k (int): Số bản ghi.
+            column (str): Cột để xếp hạng, mặc định là 'previous_grades'.
+            as_batch (bool): Trả về StudentBatch thay vì danh sách StudentModel, mặc định là False.
+            **filters: Điều kiện lọc như của find.
+
+        Returns:
+            list[StudentModel]|StudentBatch: Các mô hình sinh viên theo thứ tự giảm dần.
+        """
+        return self.find(limit=k, order_by=column, descending=True, as_batch=as_batch, **filters)
+
+    def explain_find(self, limit: int|None = None,
+                     order_by: str|None = None,
+                     descending: bool = False,
+                     **filters) -> list[dict]:
+        """
+        Lấy kế hoạch thực thi (EXPLAIN) của câu lệnh mà find tạo ra với cùng tham số, ví dụ để kiểm tra
+        câu lệnh có dùng chỉ mục hay không (cột key trong kết quả EXPLAIN của MySQL).
+
+        Returns:
+            list[dict]: Các dòng kết quả của EXPLAIN theo tên cột.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi thực thi.
+        """
+        query, params = self.find_query_(filters, order_by, descending, limit)
+        self.check_connection_()
+        try:
+            cursor = self._connection.cursor(prepared=False)
+            cursor.execute('EXPLAIN ' + query, params)
+            columns = [column[0] for column in cursor.description]
+            result = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            cursor.close()
+            self.commit_()
+        except Error as ex:
+            raise DAOException(ex.msg)
+        return result
+
+    @timed('dao_call_seconds', call='get')
     def get(self, id: str) -> StudentModel:
         """
         Lấy một bản ghi từ cơ sở dữ liệu theo mã sinh viên.
@@ -188,27 +1069,92 @@ class StudentPerformanceDAO:
             DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi lấy bản ghi.
             NotExistDataException: Nếu không tìm thấy dữ liệu.
         """
-        if not self._connection.is_connected():
-            raise DAOException("Connection is null!")
+        if self._cache is not None:
+            model = self._cache.get(id)
+            if model is not None:
+                return model
+
+        self.check_connection_()
         
         # Thực thi câu lệnh truy vấn để lấy bản ghi theo mã sinh viên
-        cursor = self._connection.cursor(prepared=True)
-        get_query = self._sqlFileReader.get_query_of('GET A RECORD BY ID')
+        get_query = self.query_('GET A RECORD BY ID')
+        cursor = self.prepared_cursor_(get_query)
         values = (id,)
         cursor.execute(get_query, values)
-        result = cursor.fetchone()
-        cursor.close()
+        rows = cursor.fetchall()
+        result = rows[0] if rows else None
         
         if result is None:
             raise NotExistDataException("Not found!")
         
         # Chuyển đổi kết quả thành mô hình sinh viên
         try:
-            self._connection.commit()
-            return create_model(result)
+            self.commit_()
+            model = create_model(result)
         except Error as ex:
             raise DAOException(ex.msg)
+        if self._cache is not None:
+            self._cache.put(id, model)
+        return model
+
+    @timed('dao_call_seconds', call='get_many')
+    def get_many(self, ids: list[str], chunk_size: int = 500) -> dict[str, StudentModel]:
+        """
+        Lấy nhiều bản ghi theo danh sách mã sinh viên, mỗi lô mã sinh viên chỉ tốn một truy vấn
+        WHERE student_id IN (...). Các mã đã có trong bộ nhớ đệm không cần truy vấn.
+
+        Args:
+            ids (list[str]): Danh sách mã sinh viên.
+            chunk_size (int): Số mã sinh viên trong mỗi truy vấn, mặc định là 500.
+
+        Returns:
+            dict[str, StudentModel]: Mô hình sinh viên theo mã, các mã không tồn tại không có trong kết quả.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi lấy bản ghi.
+        """
+        models = {}
+        missing = []
+        for id in dict.fromkeys(ids):
+            model = self._cache.get(id) if self._cache is not None else None
+            if model is not None:
+                models[id] = model
+            else:
+                missing.append(id)
+        if not missing:
+            return models
+
+        self.check_connection_()
+        get_query = self.query_('GET RECORDS BY IDS')
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start:start + chunk_size]
+            try:
+                cursor = self._connection.cursor(prepared=False)
+                cursor.execute(get_query.format(ids=', '.join(['%s'] * len(chunk))), tuple(chunk))
+                result = cursor.fetchall()
+                cursor.close()
+                self.commit_()
+            except Error as ex:
+                raise DAOException(ex.msg)
+            for row in result:
+                model = create_model(row)
+                models[model.id] = model
+                if self._cache is not None:
+                    self._cache.put(model.id, model)
+        return models
+
+    def invalidate_(self, ids: list[str]) -> None:
+        """
+        Xóa các mã sinh viên khỏi bộ nhớ đệm đọc (nếu có).
+
+        Args:
+            ids (list[str]): Danh sách mã sinh viên.
+        """
+        if self._cache is not None:
+            for id in ids:
+                self._cache.invalidate(id)
     
+    @timed('dao_call_seconds', call='update')
     def update(self, model: StudentModel):
         """
         Cập nhật một bản ghi trong cơ sở dữ liệu.
@@ -219,12 +1165,14 @@ class StudentPerformanceDAO:
         Raises:
             DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi cập nhật bản ghi.
         """
-        if not self._connection.is_connected():
-            raise DAOException("Connection is null!")
+        self.check_connection_()
         
+        # Bản ghi cũ để trừ khỏi các bảng tổng hợp
+        old_rows = self.get_rows_([model.id]) if self._summaries else []
+
         # Chuẩn bị câu lệnh truy vấn và giá trị cần cập nhật
-        cursor = self._connection.cursor(prepared=True)
-        update_query = self._sqlFileReader.get_query_of('UPDATE A RECORD')
+        update_query = self.query_('UPDATE A RECORD')
+        cursor = self.prepared_cursor_(update_query)
         values = (
             model.study_hours_per_week,
             model.attendance_rate,
@@ -235,14 +1183,205 @@ class StudentPerformanceDAO:
             model.id
         )
         cursor.execute(update_query, values)
-        cursor.close()
+        if self._cache is not None:
+            self._cache.invalidate(model.id)
+        if self._summaries and old_rows:
+            self.track_summary_(added=[values[-1:] + values[:-1]], removed=old_rows)
         
         # Commit các thay đổi vào cơ sở dữ liệu
         try:
-            self._connection.commit()
+            self.commit_([model.id])
         except Error as ex:
             raise DAOException(ex.msg)
-        
+
+    @timed('dao_call_seconds', call='upsert_many')
+    def upsert_many(self, models: list[StudentModel]|StudentBatch, chunk_size: int = 1000) -> tuple[int, int]:
+        """
+        Thêm mới hoặc cập nhật nhiều bản ghi theo từng lô (INSERT ... ON DUPLICATE KEY UPDATE).
+
+        Mỗi lô chỉ tốn một truy vấn kiểm tra các mã sinh viên đã tồn tại, một lệnh
+        executemany và một lần commit.
+
+        Args:
+            models (list[StudentModel]|StudentBatch): Danh sách các mô hình sinh viên hoặc lô sinh viên.
+            chunk_size (int): Số bản ghi trong mỗi lô (mỗi lô commit một lần, trong transaction()
+                thì commit theo batch_size của giao dịch), mặc định là 1000.
+
+        Returns:
+            tuple[int, int]: Số bản ghi được thêm mới và số bản ghi được cập nhật.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi ghi một lô.
+                Các lô trước đó đã được commit.
+        """
+        self.check_connection_()
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive!")
+
+        upsert_query = self.query_('UPSERT MANY RECORDS')
+        inserted = 0
+        updated = 0
+        for start in range(0, len(models), chunk_size):
+            chunk = models[start:start + chunk_size]
+            if isinstance(chunk, StudentBatch):
+                values = list(chunk.iter_tuples(self._enum_codes))
+            elif self._enum_codes:
+                values = [
+                    (
+                        model.id,
+                        model.study_hours_per_week,
+                        model.attendance_rate,
+                        model.previous_grades,
+                        *map(enum_index_, ('parcipate_on_act', 'parent_edu_level', 'passed'), model.category_codes_())
+                    )
+                    for model in chunk
+                ]
+            else:
+                values = [
+                    (
+                        model.id,
+                        model.study_hours_per_week,
+                        model.attendance_rate,
+                        model.previous_grades,
+                        model.parcipate_on_act,
+                        model.parent_edu_level,
+                        model.passed
+                    )
+                    for model in chunk
+                ]
+            metrics.observe('dao_batch_size', len(values), buckets=SIZE_BUCKETS, call='upsert_many')
+            try:
+                if self._summaries:
+                    # Các bản ghi cũ vừa cho biết mã đã tồn tại vừa được trừ khỏi các bảng tổng hợp
+                    old_rows = self.get_rows_([row[0] for row in values])
+                    existing_ids = {row[0] for row in old_rows}
+                else:
+                    existing_ids = self.get_existing_ids_([row[0] for row in values])
+                # Cursor không prepared để connector gộp các dòng thành một lệnh INSERT nhiều giá trị
+                cursor = self._connection.cursor(prepared=False)
+                cursor.executemany(upsert_query, values)
+                cursor.close()
+                ids = [row[0] for row in values]
+                self.invalidate_(ids)
+                if self._summaries:
+                    self.track_summary_(added=self.final_rows_(chunk),
+                                        removed=StudentBatch.from_rows(old_rows) if old_rows else ())
+                self.commit_(ids)
+            except Error as ex:
+                raise DAOException(ex.msg)
+
+            # Phân loại thêm mới/cập nhật giống như vòng lặp get/update/insert từng dòng
+            seen_ids = set()
+            for row in values:
+                if row[0] in existing_ids or row[0] in seen_ids:
+                    updated += 1
+                else:
+                    inserted += 1
+                seen_ids.add(row[0])
+        metrics.inc('dao_rows_total', inserted, op='insert')
+        metrics.inc('dao_rows_total', updated, op='update')
+        return inserted, updated
+
+    def final_rows_(self, chunk: list[StudentModel]|StudentBatch) -> list[tuple]|StudentBatch:
+        """
+        Lấy giá trị cuối cùng của mỗi mã sinh viên trong một lô đã upsert (bản ghi sau ghi đè bản ghi trước).
+
+        Args:
+            chunk (list[StudentModel]|StudentBatch): Lô đã ghi.
+
+        Returns:
+            list[tuple]|StudentBatch: Chính lô đó nếu không có mã trùng, nếu không thì các bản ghi cuối cùng.
+        """
+        if isinstance(chunk, StudentBatch):
+            if len(set(chunk.ids.tolist())) == len(chunk):
+                return chunk
+            rows = (chunk.row_(index) for index in range(len(chunk)))
+        else:
+            rows = (
+                (model.id, model.study_hours_per_week, model.attendance_rate, model.previous_grades,
+                 model.parcipate_on_act, model.parent_edu_level, model.passed)
+                for model in chunk
+            )
+        return list({row[0]: row for row in rows}.values())
+
+    def get_rows_(self, ids: list[str]) -> list[tuple]:
+        """
+        Lấy các bản ghi theo danh sách mã sinh viên (không qua bộ nhớ đệm).
+
+        Args:
+            ids (list[str]): Danh sách mã sinh viên.
+
+        Returns:
+            list[tuple]: Các bản ghi đã tồn tại theo thứ tự cột của bảng.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        cursor = self._connection.cursor(prepared=False)
+        get_query = self.query_('GET RECORDS BY IDS')
+        cursor.execute(get_query.format(ids=', '.join(['%s'] * len(ids))), tuple(ids))
+        result = cursor.fetchall()
+        cursor.close()
+        return result
+
+    def get_existing_ids_(self, ids: list[str]) -> set[str]:
+        """
+        Lấy tập các mã sinh viên đã tồn tại trong cơ sở dữ liệu.
+
+        Args:
+            ids (list[str]): Danh sách mã sinh viên cần kiểm tra.
+
+        Returns:
+            set[str]: Các mã sinh viên đã có trong cơ sở dữ liệu.
+        """
+        if not ids:
+            return set()
+        cursor = self._connection.cursor(prepared=False)
+        get_query = self.query_('GET EXISTING IDS')
+        get_query = get_query.format(ids=', '.join(['%s'] * len(ids)))
+        cursor.execute(get_query, tuple(ids))
+        result = cursor.fetchall()
+        cursor.close()
+        return {row[0] for row in result}
+
+    @timed('dao_call_seconds', call='delete_many')
+    def delete_many(self, ids: list[str], chunk_size: int = 1000) -> int:
+        """
+        Xóa các bản ghi theo danh sách mã sinh viên, mỗi lô commit một lần.
+
+        Args:
+            ids (list[str]): Danh sách mã sinh viên cần xóa.
+            chunk_size (int): Số mã sinh viên trong mỗi lô, mặc định là 1000.
+
+        Returns:
+            int: Số bản ghi đã bị xóa.
+
+        Raises:
+            DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi xóa bản ghi.
+        """
+        self.check_connection_()
+
+        deleted = 0
+        for start in range(0, len(ids), chunk_size):
+            chunk = list(ids[start:start + chunk_size])
+            metrics.observe('dao_batch_size', len(chunk), buckets=SIZE_BUCKETS, call='delete_many')
+            delete_query = self.query_('DELETE RECORDS BY IDS')
+            delete_query = delete_query.format(ids=', '.join(['%s'] * len(chunk)))
+            try:
+                old_rows = self.get_rows_(chunk) if self._summaries else []
+                cursor = self._connection.cursor(prepared=False)
+                cursor.execute(delete_query, tuple(chunk))
+                deleted += cursor.rowcount
+                cursor.close()
+                self.invalidate_(chunk)
+                if old_rows:
+                    self.track_summary_(removed=StudentBatch.from_rows(old_rows))
+                self.commit_(chunk)
+            except Error as ex:
+                raise DAOException(ex.msg)
+        return deleted
+
+    @timed('dao_call_seconds', call='delete_all')
     def delete_all(self):
         """
         Xóa tất cả các bản ghi trong cơ sở dữ liệu.
@@ -250,24 +1389,31 @@ class StudentPerformanceDAO:
         Raises:
             DAOException: Nếu kết nối tới cơ sở dữ liệu không tồn tại hoặc lỗi khi xóa bản ghi.
         """
-        if not self._connection.is_connected():
-            raise DAOException("Connection is null!")
+        self.check_connection_()
         
         # Thực thi câu lệnh truy vấn để xóa tất cả các bản ghi
         cursor = self._connection.cursor(prepared=False)
-        delete_query = self._sqlFileReader.get_query_of('DELETE ALL')
+        delete_query = self.query_('DELETE ALL')
         cursor.execute(delete_query)
+        if self._summaries:
+            cursor.execute(self._sqlFileReader.get_query_of('CLEAR SUMMARY'))
+            cursor.execute(self._sqlFileReader.get_query_of('CLEAR HISTOGRAM'))
+            self._summary = None
         cursor.close()
+        if self._cache is not None:
+            self._cache.clear()
     
         # Commit các thay đổi vào cơ sở dữ liệu
         try:
-            self._connection.commit()
+            self.commit_()
         except Error as ex:
             raise DAOException(ex.msg)
     
     def close(self):
         """
-        Đóng kết nối tới cơ sở dữ liệu.
+        Trả kết nối về pool.
         """
-        if self._connection.is_connected():
-            self._connection.close()
\ No newline at end of file
+        if self._connection is not None:
+            self.close_cursors_()
+            self._connection.close()
+            self._connection = None
\ No newline at end of file
@@ -1,72 +1,259 @@
+from __future__ import annotations
+
 import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__))))
 
+import json
 import time
-from typing import Literal
-import pandas as pd
-import numpy as np
-from kaggle.api.kaggle_api_extended import KaggleApi
+from typing import TYPE_CHECKING, Iterable, Iterator, Literal
+
+# Chỉ gồm các module nhẹ, pandas/numpy và mysql.connector được import trong hàm khi thực sự cần
+# để lần chạy tăng dần không có gì thay đổi khởi động nhanh
+from field import FieldName, Categories
+from report import LoadReport
+from extractor import DataSource, KaggleSource, LocalSource, CachedExtractor
+from metrics import metrics
 
-from model import create_model
-from field import FieldName
-from dao import StudentPerformanceDAO, DAOException, NotExistDataException
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from dao import StudentPerformanceDAO
+    from fingerprint import FingerprintStore
+    from sink import Sink
 
 import logging
-# Thiết lập config cho log
-logging.basicConfig(filename='business/etl_log.log', level=logging.DEBUG,
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S')
 
 
 dataset_id = 'souradippal/student-performance-prediction'
 data_dir = 'business/data'
 file_dir = data_dir + '/student-performance-prediction/student_performance_prediction.csv'
+fingerprint_file = data_dir + '/fingerprints.db'
+staging_dir = data_dir + '/.staging'
+last_run_file = data_dir + '/.last_run.json'
+log_file = 'business/etl_log.log'
+metrics_file = data_dir + '/metrics.jsonl'
+metrics_prom_file = data_dir + '/metrics.prom'
+quarantine_file = data_dir + '/quarantine.csv'
+db_config = {
+    'host': 'localhost',
+    'db': 'student_performance_etl',
+    'user': 'root',
+    'password': 'Asensio1234@',
+    'pool_size': 5,
+    # Bật để cập nhật các bảng tổng hợp (StudentPerformanceDAO.get_summary) cùng mỗi lần tải,
+    # cả khi ghi qua MySQLBulkSink
+    'summaries': False
+}
+# Phiên bản của các quy tắc trong transform_columns_, cần tăng lên mỗi khi quy tắc thay đổi
+# để staging cache không trả lại dữ liệu đã được xử lý theo quy tắc cũ
+transform_version = 2
+
+def setup_logging_():
+    """
+    Thiết lập config cho log khi chạy ETL (không làm gì nếu chương trình đã tự thiết lập).
+    """
+    logging.basicConfig(filename=log_file, level=logging.DEBUG,
+                        format='%(asctime)s - %(levelname)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+
+def observe_stage_(stage: str, elapsed: float, rows: int, **labels):
+    """
+    Ghi số liệu của một giai đoạn ETL: thời gian, số dòng và tốc độ (dòng/giây).
+
+    Args:
+        stage (str): Tên giai đoạn ('extract', 'transform', 'load').
+        elapsed (float): Thời gian chạy (giây).
+        rows (int): Số dòng đã xử lý.
+        **labels: Các nhãn thêm cho thời gian chạy.
+    """
+    metrics.observe('etl_stage_seconds', elapsed, stage=stage, **labels)
+    metrics.inc('etl_rows_total', rows, stage=stage)
+    if elapsed > 0:
+        metrics.set('etl_rows_per_second', rows / elapsed, stage=stage)
+
+def export_metrics_(**extra):
+    """
+    Ghi các số liệu của lần chạy ra metrics_file (thêm một dòng JSON) và metrics_prom_file
+    (định dạng văn bản của Prometheus), sau đó xóa số liệu để lần chạy sau bắt đầu lại từ đầu.
+
+    Args:
+        **extra: Các trường thêm vào dòng JSON (ví dụ tham số của lần chạy).
+    """
+    metrics.record_memory()
+    try:
+        metrics.write_jsonl(metrics_file, **extra)
+        metrics.write_prometheus(metrics_prom_file)
+    except OSError as e:
+        logging.error(f'Cannot export metrics: {e}')
+    finally:
+        metrics.reset()
+
+def read_csv_chunks_(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Đọc file CSV theo từng chunk, file được đóng khi luồng kết thúc.
+
+    Args:
+        path (str): Đường dẫn file CSV.
+        chunksize (int): Số dòng mỗi chunk.
+
+    Yields:
+        pd.DataFrame: Từng chunk dữ liệu thô.
+    """
+    import pandas as pd
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        yield from reader
 
-def extract() -> pd.DataFrame:
+def resolve_source_(source: DataSource|str|None) -> DataSource:
     """
-    Tải và đọc dữ liệu từ Kaggle dataset.
+    Chuyển tham số source của extract() thành DataSource.
+
+    Args:
+        source (DataSource|str|None): Nguồn dữ liệu, đường dẫn hoặc None (Kaggle dataset).
 
     Returns:
-        pd.DataFrame: Dữ liệu thô từ file CSV.
+        DataSource: Nguồn dữ liệu.
+    """
+    if source is None:
+        return KaggleSource(dataset_id, os.path.relpath(file_dir, data_dir))
+    if isinstance(source, str):
+        return LocalSource(source)
+    return source
+
+def extract(chunksize: int|None = None,
+            source: DataSource|str|None = None,
+            use_staging: bool = True,
+            extractor: CachedExtractor|None = None) -> pd.DataFrame|Iterator[pd.DataFrame]:
+    """
+    Tải và đọc dữ liệu từ Kaggle dataset hoặc từ một nguồn khác.
+
+    Dữ liệu chỉ được tải lại khi phiên bản của nguồn hoặc checksum của file đã tải thay đổi,
+    nếu không thì dùng lại file CSV đã giải nén từ lần trước.
+
+    Args:
+        chunksize (int|None): Nếu khác None thì đọc file CSV theo từng chunk có chừng này dòng
+            và trả về một luồng các DataFrame, mặc định là None
+        source (DataSource|str|None): Nguồn dữ liệu, có thể là đường dẫn tới một file CSV hoặc thư mục
+            chứa file CSV, nếu là None thì dùng Kaggle dataset, mặc định là None
+        use_staging (bool): Đọc dữ liệu thô từ staging cache (các file .npy theo cột, khóa theo checksum
+            của file nguồn) thay vì phân tích lại file CSV, không dùng khi đọc theo chunk, mặc định là True
+        extractor (CachedExtractor|None): CachedExtractor đã lấy dữ liệu trước đó trong cùng lần chạy,
+            khi có thì source bị bỏ qua và nguồn không bị kiểm tra lại, mặc định là None
+
+    Returns:
+        pd.DataFrame|Iterator[pd.DataFrame]: Dữ liệu thô từ file CSV hoặc luồng các chunk,
+            DataFrame có attrs['source_checksum'] là checksum của file nguồn.
 
     Raises:
         Exception: Nếu có lỗi xảy ra trong quá trình tải dữ liệu.
     """
     logging.info('Extracting data...')
-    os.environ['KAGGLE_CONFIG_DIR'] = '~/.kaggle'
-    # Xác thực và tải dataset từ Kaggle 
-    kaggle_api = KaggleApi()
-    try:
-        kaggle_api.authenticate()
-        logging.info('Successfully authenticate Kaggle API.')
-    except Exception as e:
-        logging.error(f"Failed to authenticate Kaggle API.")
-        raise e
+    start_time = time.perf_counter()
     
-    start_time = time.time()
-    
-    #Tải
-    try:
-        kaggle_api.dataset_download_files(dataset_id, data_dir, force=True, unzip=True)
-        logging.info(f"Dataset downloaded successfully from {dataset_id}.")
-    except Exception as e:
-        logging.error(f'Failed to download datasets at {dataset_id}.')
-        raise e
-    raw_df = pd.read_csv(file_dir)
+    #Tải (nếu cần)
+    if extractor is None:
+        extractor = CachedExtractor(resolve_source_(source), data_dir)
+    path = extractor.extract_path()
+
+    if chunksize is not None:
+        elapsed = time.perf_counter() - start_time
+        metrics.observe('etl_stage_seconds', elapsed, stage='extract')
+        msg = f'Successfully extract: streaming by {chunksize} records. Elapsed Time: {elapsed:.4f}s'
+        print(msg)
+        logging.info(msg)
+        return read_csv_chunks_(path, chunksize)
+
+    import pandas as pd
+    from staging import StagingCache
+
+    raw_df = None
+    staging = StagingCache(staging_dir)
+    if use_staging:
+        raw_df = staging.load(extractor.checksum, 'raw')
+    if raw_df is None:
+        raw_df = pd.read_csv(path)
+        if use_staging:
+            staging.prune(keep=extractor.checksum)
+            staging.save(raw_df, extractor.checksum, 'raw')
+    raw_df.attrs['source_checksum'] = extractor.checksum
     
-    end_time = time.time()
+    end_time = time.perf_counter()
+    observe_stage_('extract', end_time - start_time, len(raw_df))
     msg = f'Successfully extract: {len(raw_df)} records. Elapsed Time: {end_time-start_time:.4f}s'
     print(msg)
     logging.info(msg)
     return raw_df
 
-def transform(raw_df: pd.DataFrame) -> pd.DataFrame:
+def categorical_(column: pd.Series, known: tuple) -> pd.Series:
+    """
+    Chuyển một cột thành kiểu category với các giá trị đã biết đứng đầu theo thứ tự cố định,
+    để mã của mỗi giá trị giống nhau giữa các phần dữ liệu và trùng với từ điển của StudentModel.
+
+    Args:
+        column (pd.Series): Cột phân loại.
+        known (tuple): Các giá trị đã biết theo Categories.
+
+    Returns:
+        pd.Series: Cột kiểu category, các giá trị mới được xếp sau theo thứ tự chữ cái.
+    """
+    column = column.astype('category')
+    extras = sorted(value for value in column.cat.categories if value not in known)
+    return column.cat.set_categories(list(known) + extras)
+
+
+def transform_stage_() -> str:
+    """
+    Tên giai đoạn của dữ liệu đã xử lý trong staging cache, gồm dấu vân tay của transform_version
+    và các giá trị của Categories (quyết định kiểu category của các cột phân loại).
+
+    Returns:
+        str: Tên giai đoạn dạng 'transformed-<dấu vân tay>'.
+    """
+    import hashlib
+
+    categories = {name: value for name, value in vars(Categories).items() if not name.startswith('_')}
+    key = json.dumps({'version': transform_version, 'categories': categories}, sort_keys=True)
+    return 'transformed-' + hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def transform_columns_(df: pd.DataFrame) -> dict[str, pd.Series]:
+    """
+    Tính các cột đã xử lý bằng các phép toán vector hóa trên toàn cột.
+
+    Args:
+        df (pd.DataFrame): Dữ liệu thô đã loại các dòng thiếu cột mục tiêu.
+
+    Returns:
+        dict[str, pd.Series]: Các cột mới theo FieldName.
+    """
+    # Đánh dấu giá trị bị thiếu hoặc dữ liệu sai bằng np.nan
+    # Giờ học phải là số không âm
+    study_hours = df[FieldName.STUDY_HOURS]
+    attendance_rate = df[FieldName.ATTENDANCE_RATE]
+    return {
+        FieldName.STUDY_HOURS: study_hours.where(study_hours >= 0),
+        # Tỷ lệ tham gia phải nằm trong [0,100]
+        FieldName.ATTENDANCE_RATE: attendance_rate.where(attendance_rate.between(0, 100)),
+        # Điểm số trước đó phải trong khoảng [0,100]
+        FieldName.PREVIOUS_GRADES: df[FieldName.PREVIOUS_GRADES].clip(0, 100),
+        # Điền giá trị NaN trong các đặc trưng phân loại bằng "Unknown", lưu dưới dạng category
+        FieldName.PARTICIPATE_ON_ACT: categorical_(df[FieldName.PARTICIPATE_ON_ACT].fillna('Unknown'),
+                                                   Categories.PARTICIPATE_ON_ACT),
+        FieldName.PARENT_EDU_LEVEL: categorical_(df[FieldName.PARENT_EDU_LEVEL].fillna('Unknown'),
+                                                 Categories.PARENT_EDU_LEVEL),
+        FieldName.PASSED: categorical_(df[FieldName.PASSED], Categories.PASSED)
+    }
+
+def transform(raw_df: pd.DataFrame, inplace: bool = False, use_staging: bool = False) -> pd.DataFrame:
     """
     Chuyển đổi dữ liệu thô thành dữ liệu đã được xử lý.
 
     Args:
         raw_df (pd.DataFrame): Dữ liệu thô.
+        inplace (bool): Sửa trực tiếp trên raw_df thay vì tạo DataFrame mới, mặc định là False.
+            Khi là False, raw_df được giữ nguyên mà không cần sao chép sâu trước khi xử lý.
+        use_staging (bool): Dùng lại/lưu kết quả trong staging cache theo attrs['source_checksum'] của raw_df
+            và phiên bản của quy tắc (xem transform_stage_), chỉ khi inplace là False, mặc định là False.
 
     Returns:
         pd.DataFrame: Dữ liệu đã được xử lý.
@@ -74,97 +261,374 @@ def transform(raw_df: pd.DataFrame) -> pd.DataFrame:
     Raises:
         Exception: Nếu có lỗi xảy ra trong quá trình chuyển đổi dữ liệu.
     """
-    logging.info('Transforming...')
-    start_time = time.time()
-    df = raw_df
-
-    # Xóa các giá trị NaN trong cột mục tiêu
-    df.dropna(subset=[FieldName.PASSED], inplace=True)
-    df.reset_index(inplace=True, drop=True)
-
-    # Đánh dấu giá trị bị thiếu hoặc dữ liệu sai bằng np.nan
-    # Giờ học phải là số không âm
-    df[FieldName.STUDY_HOURS] = df[FieldName.STUDY_HOURS].apply(lambda x: x if x >= 0 else np.nan)
+    import pandas as pd
+    from staging import StagingCache
 
-    # Tỷ lệ tham gia phải là số không âm
-    df[FieldName.ATTENDANCE_RATE] = df[FieldName.ATTENDANCE_RATE].apply(lambda x: x if (x>=0 and x<=100) else np.nan)
+    logging.info('Transforming...')
+    start_time = time.perf_counter()
 
-    # Điểm số trước đó phải trong khoảng [0,100]
-    df[FieldName.PREVIOUS_GRADES] = df[FieldName.PREVIOUS_GRADES].clip(0, 100)
-    df.fillna({FieldName.PREVIOUS_GRADES: np.nan}, inplace=True)
+    checksum = raw_df.attrs.get('source_checksum')
+    staging = StagingCache(staging_dir) if use_staging and not inplace and checksum else None
+    if staging is not None:
+        stage = transform_stage_()
+        df = staging.load(checksum, stage)
+        if df is not None:
+            elapsed = time.perf_counter() - start_time
+            observe_stage_('transform', elapsed, len(df), cached='true')
+            msg = f'Successfully transform (cached): {len(df)} records. Elapsed Time: {elapsed:.4f}s'
+            print(msg)
+            logging.info(msg)
+            return df
 
-    # Điền giá trị NaN trong các đặc trưng phân loại bằng "Unknown"
-    df.fillna({FieldName.PARTICIPATE_ON_ACT: 'Unknown',
-               FieldName.PARENT_EDU_LEVEL: 'Unknown'}, inplace=True)
+    # Xóa các giá trị NaN trong cột mục tiêu
+    if inplace:
+        df = raw_df
+        df.dropna(subset=[FieldName.PASSED], inplace=True)
+        df.reset_index(inplace=True, drop=True)
+        for name, column in transform_columns_(df).items():
+            df[name] = column
+    else:
+        df = raw_df[raw_df[FieldName.PASSED].notna()]
+        df = df.assign(**transform_columns_(df))
+        df.index = pd.RangeIndex(len(df))
+    if staging is not None:
+        # Dữ liệu đã xử lý theo quy tắc cũ không còn được dùng lại
+        staging.prune_stages(checksum, 'transformed', keep=stage)
+        staging.save(df, checksum, stage)
 
-    end_time = time.time()
+    end_time = time.perf_counter()
+    observe_stage_('transform', end_time - start_time, len(df))
     msg = f'Successfully transform: {len(df)} records. Elapsed Time: {end_time-start_time:.4f}s'
     print(msg)
     logging.info(msg)
     
     return df  
 
-def load(modified_df: pd.DataFrame):
+def validate(modified_df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    """
+    Kiểm tra dữ liệu đã được xử lý theo từng cột, các dòng không hợp lệ được ghi vào quarantine_file
+    thay vì làm dừng cả lần tải.
+
+    Args:
+        modified_df (pd.DataFrame): Dữ liệu đã được xử lý.
+
+    Returns:
+        tuple[pd.DataFrame, int]: Các dòng hợp lệ và số dòng bị loại.
+    """
+    from validation import validate_frame, write_quarantine
+
+    valid_df, validation = validate_frame(modified_df)
+    for (field, rule, action), count in validation.counts.items():
+        metrics.inc('etl_validation_violations_total', count, field=field, rule=rule, action=action)
+    if validation.rejections.empty:
+        return valid_df, 0
+    rejected = write_quarantine(modified_df, validation, quarantine_file)
+    metrics.inc('etl_rejected_rows_total', rejected)
+    print(f'Rejected {rejected} invalid records (see {quarantine_file}).')
+    logging.warning(str(validation))
+    return valid_df, rejected
+
+def load(modified_df: pd.DataFrame,
+         mode: Literal['row', 'bulk'] = 'bulk',
+         chunk_size: int = 1000,
+         dao: StudentPerformanceDAO|None = None,
+         sink: Sink|None = None,
+         commit_every: int|None = None,
+         checkpoint: tuple[str, str]|None = None) -> LoadReport:
     """
     Tải dữ liệu đã được xử lý vào cơ sở dữ liệu.
 
     Args:
         modified_df (pd.DataFrame): Dữ liệu đã được xử lý.
+        mode (Literal['row', 'bulk']): Cách ghi dữ liệu, 'row' là get/update/insert từng dòng,
+            'bulk' là upsert theo lô, mặc định là 'bulk'
+        chunk_size (int): Số bản ghi mỗi lô (mỗi lô commit một lần) khi mode là 'bulk', mặc định là 1000
+        dao (StudentPerformanceDAO|None): DAO dùng chung của lần chạy, nếu là None thì tự lấy
+            một kết nối từ pool và trả lại khi xong, mặc định là None
+        sink (Sink|None): Đích ghi dữ liệu thay cho DAO (ví dụ MySQLBulkSink, SQLiteSink, ColumnarFileSink),
+            khi có thì mode, chunk_size và dao bị bỏ qua, mặc định là None
+        commit_every (int|None): Gộp các thao tác ghi vào một giao dịch, commit mỗi commit_every bản ghi
+            (xem StudentPerformanceDAO.transaction). Nếu giao dịch lỗi, các bản ghi chưa commit và các
+            bản ghi chưa được tải được ghi vào failed_ids để tải lại. Mặc định là None (commit sau mỗi
+            lần ghi ở mode 'row', sau mỗi lô ở mode 'bulk')
+        checkpoint (tuple[str, str]|None): (run_id, part) để tải có thể tiếp tục: các bản ghi đầu tiên
+            đã tải xong theo mốc trong bảng etl_checkpoint được bỏ qua, và mốc mới được ghi cùng commit
+            của mỗi lô (mode 'row': mỗi chunk_size bản ghi). Dữ liệu phải có cùng thứ tự giữa các lần chạy.
+            Bị bỏ qua khi có sink, mặc định là None
+
+    Các dòng không hợp lệ được loại và ghi vào quarantine_file trước khi tải (xem validate).
+
+    Returns:
+        LoadReport: Kết quả tải, gồm cả mã sinh viên của các bản ghi thất bại và số bản ghi bị loại.
 
     Raises:
         DAOException: Nếu có lỗi xảy ra trong quá trình tải dữ liệu vào cơ sở dữ liệu.
     """
+    from contextlib import nullcontext
+    from model import StudentBatch, create_models_from_frame
+    from dao import StudentPerformanceDAO, DAOException, NotExistDataException, TransactionException
+
     logging.info('Loading data...')
-    models = modified_df.apply(create_model, axis=1).values
-    spDAO = StudentPerformanceDAO('localhost', 'student_performance_etl', 'root', 'Asensio1234@')
-    start_time = time.time()
-    update_records = [0, 0]
-    insert_records = [0, 0]
-
-    # Xử lý từng mô hình trong dữ liệu
-    for model in models:
-        try:
-            spDAO.get(model.id)
-            update_records[0] += 1
-            spDAO.update(model)
-            update_records[1] += 1
-        except NotExistDataException as ne:
-            insert_records[0] += 1
-            spDAO.insert(model)
-            insert_records[1] += 1
-        except DAOException as e:
-            print("Failed at ", model.id)
-            logging.error(f'Failed at {model.id}')
-
-    end_time = time.time()
-    msg = f'Load info: \n'
-    msg += f'\tUpdate Successfully: {update_records[1]}/{update_records[0]}\n'
-    msg += f'\tInsert Successfully: {insert_records[1]}/{insert_records[0]}\n'
-    msg += f'Elapsed Time: {end_time-start_time:.4f}s'
+    modified_df, rejected = validate(modified_df)
+    if sink is not None:
+        start_time = time.perf_counter()
+        report = sink.write(modified_df)
+        report.rejected = rejected
+        report.elapsed_time = time.perf_counter() - start_time
+        observe_stage_('load', report.elapsed_time, len(modified_df), mode=type(sink).__name__)
+        metrics.inc('etl_failed_rows_total', len(report.failed_ids))
+        msg = str(report)
+        print(msg)
+        logging.info(msg)
+        return report
+
+    spDAO = dao if dao is not None else StudentPerformanceDAO(**db_config)
+    start_time = time.perf_counter()
+    # Bỏ qua các bản ghi đã tải xong ở lần chạy bị dừng giữa chừng
+    resumed = 0
+    if checkpoint is not None:
+        resumed = min(spDAO.get_checkpoints(checkpoint[0]).get(checkpoint[1], 0), len(modified_df))
+        if resumed:
+            modified_df = modified_df.iloc[resumed:]
+            metrics.inc('etl_resumed_rows_total', resumed)
+            msg = f'Checkpoint: {resumed} records of {checkpoint[1]} were already loaded, resuming.'
+            print(msg)
+            logging.info(msg)
+    # Mốc tải chỉ tiến khi mọi bản ghi phía trước đã được ghi thành công
+    checkpointing = checkpoint is not None
+
+    # Chế độ bulk giữ dữ liệu theo cột, chỉ chế độ row mới cần từng StudentModel
+    if mode == 'bulk':
+        models = StudentBatch.from_frame(modified_df)
+    else:
+        models = create_models_from_frame(modified_df)
+    report = LoadReport()
+    report.rejected = rejected
+    # Số bản ghi đã xử lý và số bản ghi thêm mới/cập nhật chưa được commit của giao dịch gộp
+    done = 0
+    pending = [0, 0]
+
+    def written(transaction, inserted: int, updated: int):
+        report.insert_records[1] += inserted
+        report.update_records[1] += updated
+        if transaction is not None:
+            pending[0] += inserted
+            pending[1] += updated
+            if not transaction.pending_ids:
+                pending[:] = [0, 0]
+
+    try:
+        with spDAO.transaction(commit_every) if commit_every is not None else nullcontext() as transaction:
+            if mode == 'bulk':
+                # Upsert theo lô, mỗi lô commit một lần (hoặc theo commit_every)
+                for start in range(0, len(models), chunk_size):
+                    chunk = models[start:start + chunk_size]
+                    if checkpointing:
+                        spDAO.checkpoint(*checkpoint, resumed + start + len(chunk))
+                    try:
+                        inserted, updated = spDAO.upsert_many(chunk, chunk_size=chunk_size)
+                        report.insert_records[0] += inserted
+                        report.update_records[0] += updated
+                        written(transaction, inserted, updated)
+                    except TransactionException:
+                        raise
+                    except DAOException as e:
+                        if checkpointing:
+                            spDAO.discard_checkpoint()
+                            checkpointing = False
+                        report.failed_ids.extend(chunk.ids.tolist())
+                        print("Failed at chunk ", chunk[0].id, "-", chunk[-1].id)
+                        logging.error(f'Failed at chunk {chunk[0].id}-{chunk[-1].id}: {e}')
+                    done += len(chunk)
+            else:
+                # Xử lý từng mô hình trong dữ liệu
+                for model in models:
+                    if checkpointing and ((done + 1) % chunk_size == 0 or done + 1 == len(models)):
+                        spDAO.checkpoint(*checkpoint, resumed + done + 1)
+                    try:
+                        spDAO.get(model.id)
+                        report.update_records[0] += 1
+                        spDAO.update(model)
+                        written(transaction, 0, 1)
+                    except NotExistDataException as ne:
+                        report.insert_records[0] += 1
+                        spDAO.insert(model)
+                        written(transaction, 1, 0)
+                    except TransactionException:
+                        raise
+                    except DAOException as e:
+                        if checkpointing:
+                            spDAO.discard_checkpoint()
+                            checkpointing = False
+                        report.failed_ids.append(model.id)
+                        print("Failed at ", model.id)
+                        logging.error(f'Failed at {model.id}')
+                    done += 1
+    except TransactionException as e:
+        # Các bản ghi chưa commit đã bị hoàn tác, các bản ghi chưa xử lý cũng cần tải lại
+        report.insert_records[1] -= pending[0]
+        report.update_records[1] -= pending[1]
+        remaining = models.ids[done:].tolist() if mode == 'bulk' else [model.id for model in models[done:]]
+        # Bản ghi đang ghi khi commit lỗi có trong cả hai danh sách
+        report.failed_ids.extend(dict.fromkeys(e.rolled_back_ids + remaining))
+        print(f'Transaction failed after {e.committed} committed records: {e}')
+        logging.error(f'Transaction failed after {e.committed} committed records, '
+                      f'{len(e.rolled_back_ids)} rolled back: {e}')
+
+    end_time = time.perf_counter()
+    report.elapsed_time = end_time - start_time
+    observe_stage_('load', report.elapsed_time, len(models), mode=mode)
+    metrics.inc('etl_failed_rows_total', len(report.failed_ids))
+    msg = str(report)
     print(msg)
     logging.info(msg)
-    spDAO.close()
+    if dao is None:
+        spDAO.close()
+    return report
     
-def reset():
+def reset(dao: StudentPerformanceDAO|Sink|None = None):
     """
-    Xóa tất cả các bản ghi trong cơ sở dữ liệu.
+    Xóa tất cả các bản ghi trong cơ sở dữ liệu, rồi tạo các chỉ mục còn thiếu của bảng
+    (StudentPerformanceDAO.create_indexes, không áp dụng cho sink).
+
+    Args:
+        dao (StudentPerformanceDAO|Sink|None): DAO dùng chung của lần chạy hoặc đích ghi dữ liệu,
+            nếu là None thì tự lấy một kết nối từ pool và trả lại khi xong, mặc định là None
 
     Raises:
         DAOException: Nếu có lỗi xảy ra trong quá trình xóa dữ liệu.
     """
-    spDAO = StudentPerformanceDAO('localhost', 'student_performance_etl', 'root', 'Asensio1234@')
+    from dao import StudentPerformanceDAO, DAOException
+
+    spDAO = dao if dao is not None else StudentPerformanceDAO(**db_config)
     try:
         spDAO.delete_all()
+        if isinstance(spDAO, StudentPerformanceDAO):
+            spDAO.create_indexes()
         print('Successfully reset!')
         logging.info('Reset data...')
     except DAOException as e:
         print(e)
         logging.error('Error when reset!')
+    finally:
+        if dao is None:
+            spDAO.close()
     
+def rebuild_table(frames: pd.DataFrame|Iterable[pd.DataFrame],
+                  mode: Literal['row', 'bulk'] = 'bulk',
+                  chunk_size: int = 1000,
+                  sink: Sink|None = None,
+                  workers: int = 1,
+                  executor: Literal['thread', 'process'] = 'thread',
+                  keep_previous: bool = False,
+                  commit_every: int|None = None) -> LoadReport:
+    """
+    Tải lại toàn bộ dữ liệu mà không làm gián đoạn việc đọc: dữ liệu được tải vào bảng phụ
+    (SHADOW_TABLE) rồi đổi chỗ với bảng chính bằng một câu lệnh RENAME TABLE. Người đọc luôn thấy
+    bảng cũ đầy đủ cho tới khi bảng mới sẵn sàng, thay cho reset() (DELETE ALL) rồi load().
+
+    Args:
+        frames (pd.DataFrame|Iterable[pd.DataFrame]): Dữ liệu đã được xử lý, hoặc các chunk dữ liệu
+            khi chạy dạng luồng.
+        mode (Literal['row', 'bulk']): Cách ghi dữ liệu, mặc định là 'bulk'
+        chunk_size (int): Số bản ghi mỗi lô khi mode là 'bulk', mặc định là 1000
+        sink (Sink|None): Đích MySQL (có thuộc tính table, ví dụ MySQLBulkSink) dùng để ghi vào bảng phụ,
+            mặc định là None (ghi qua DAO)
+        workers (int): Số kết nối tải song song, mặc định là 1
+        executor (Literal['thread', 'process']): Chạy các phần tải song song bằng thread hay process,
+            mặc định là 'thread'
+        keep_previous (bool): Giữ bảng cũ (PREVIOUS_TABLE) để có thể hoàn tác bằng
+            StudentPerformanceDAO.rollback_swap(), mặc định là False
+        commit_every (int|None): Số bản ghi mỗi lần commit khi ghi qua DAO (xem load), mặc định là None
+
+    Returns:
+        LoadReport: Kết quả tải vào bảng phụ.
+
+    Raises:
+        ValueError: Nếu sink không ghi vào bảng MySQL.
+        DAOException: Nếu có bản ghi tải thất bại (bảng chính giữ nguyên) hoặc lỗi khi tạo/đổi bảng.
+    """
+    import pandas as pd
+    from dao import StudentPerformanceDAO, DAOException, SHADOW_TABLE
+    from parallel import parallel_load
+
+    if sink is not None and not hasattr(sink, 'table'):
+        raise ValueError(f'{type(sink).__name__} does not write to a MySQL table, cannot rebuild.')
+    if isinstance(frames, pd.DataFrame):
+        frames = [frames]
+    shadow_config = dict(db_config, table=SHADOW_TABLE)
+    total = LoadReport()
+
+    with StudentPerformanceDAO(**db_config) as spDAO:
+        spDAO.create_shadow_table()
+        logging.info(f'Rebuilding into {SHADOW_TABLE}...')
+        if sink is not None:
+            table, sink.table = sink.table, SHADOW_TABLE
+        try:
+            with StudentPerformanceDAO(**shadow_config) as shadowDAO:
+                for modified_df in frames:
+                    if sink is not None:
+                        report = load(modified_df, sink=sink)
+                    elif workers > 1:
+                        # spDAO và shadowDAO dùng chung pool với các phần dữ liệu
+                        report = parallel_load(modified_df, shadow_config, workers=workers, executor=executor,
+                                               mode=mode, chunk_size=chunk_size, commit_every=commit_every,
+                                               held_connections=2)
+                    else:
+                        report = load(modified_df, mode=mode, chunk_size=chunk_size, dao=shadowDAO,
+                                      commit_every=commit_every)
+                    total.merge(report)
+        finally:
+            if sink is not None:
+                sink.table = table
+
+        if total.failed_ids:
+            logging.error(f'Rebuild failed for {len(total.failed_ids)} records, the live table is unchanged.')
+            raise DAOException(f'{len(total.failed_ids)} records failed to load into {SHADOW_TABLE}, '
+                               'the live table is unchanged.')
+        start_time = time.perf_counter()
+        spDAO.swap_tables(keep_previous=keep_previous)
+        metrics.observe('etl_swap_seconds', time.perf_counter() - start_time)
+    print('Successfully rebuilt!')
+    logging.info(f'Swapped {SHADOW_TABLE} in (keep previous: {keep_previous}).')
+    return total
             
+def commit_fingerprints_(store: FingerprintStore, loaded_df: pd.DataFrame,
+                         hashes: np.ndarray, report: LoadReport):
+    """
+    Lưu hash của các bản ghi đã được tải thành công vào kho dấu vân tay.
+
+    Args:
+        store (FingerprintStore): Kho dấu vân tay.
+        loaded_df (pd.DataFrame): Các dòng đã được đưa vào load().
+        hashes (np.ndarray): Hash tương ứng của các dòng.
+        report (LoadReport): Kết quả tải của các dòng.
+    """
+    import numpy as np
+
+    ids = loaded_df[FieldName.STUDENT_ID].to_numpy(dtype=object)
+    succeeded = ~np.isin(ids, report.failed_ids)
+    store.commit(ids[succeeded].tolist(), hashes[succeeded])
+
 def etl_process(load_for: int|None = None, 
                  strategy: Literal['head', 'tail', 'random']|None = 'head',
-                 need_reset: bool = False):
+                 need_reset: bool = False,
+                 load_mode: Literal['row', 'bulk'] = 'bulk',
+                 chunk_size: int = 1000,
+                 stream: bool = False,
+                 chunksize: int = 10000,
+                 incremental: bool = False,
+                 delete_missing: bool = False,
+                 source: DataSource|str|None = None,
+                 use_staging: bool = True,
+                 workers: int = 1,
+                 executor: Literal['thread', 'process'] = 'thread',
+                 export_metrics: bool = True,
+                 sink: Sink|None = None,
+                 rebuild: bool = False,
+                 keep_previous: bool = False,
+                 commit_every: int|None = None,
+                 resume: bool = False):
     """
     Thực hiện quá trình ETL (Extract, Transform, Load) hoàn chỉnh.
 
@@ -172,19 +636,186 @@ def etl_process(load_for: int|None = None,
         load_for (int|None): Số lượng bản ghi cần tải vào cơ sở dữ liệu, mặc định là None
         strategy (Literal['head', 'tail', 'random']|None): Chính sách để lấy các bản ghi, mặc định là 'head'
         need_reset (bool): Yêu cầu reset lại các bản ghi trong CSDL (tức là xóa tất cả), mặc định là False
+        load_mode (Literal['row', 'bulk']): Cách ghi dữ liệu vào CSDL, mặc định là 'bulk'
+        chunk_size (int): Số bản ghi mỗi lô khi load_mode là 'bulk', mặc định là 1000
+        stream (bool): Đọc, xử lý và tải dữ liệu theo từng chunk để bộ nhớ không phụ thuộc kích thước file,
+            khi đó 'tail' dùng bộ đệm vòng và 'random' dùng reservoir sampling, mặc định là False
+        chunksize (int): Số dòng đọc từ file CSV mỗi chunk khi stream là True, mặc định là 10000
+        incremental (bool): Chỉ tải các bản ghi mới hoặc đã thay đổi so với lần tải trước, dựa trên
+            hash nội dung của từng Student ID lưu trong fingerprint_file. Nếu checksum của file nguồn và
+            các tham số lấy mẫu giống lần chạy tăng dần thành công gần nhất thì kết thúc ngay mà không
+            cần đọc dữ liệu hay kết nối CSDL, mặc định là False
+        delete_missing (bool): Khi incremental là True, xóa khỏi CSDL các bản ghi không còn trong dữ liệu
+            mới (không hỗ trợ khi stream là True), mặc định là False
+        source (DataSource|str|None): Nguồn dữ liệu truyền cho extract(), mặc định là None (Kaggle dataset)
+        use_staging (bool): Dùng staging cache cho dữ liệu thô và dữ liệu đã xử lý (khi stream là False),
+            mặc định là True
+        workers (int): Số kết nối tải song song (khi stream là False), dữ liệu được chia theo hash
+            của Student ID, mặc định là 1 (tải tuần tự)
+        executor (Literal['thread', 'process']): Chạy các phần tải song song bằng thread hay process,
+            mặc định là 'thread'
+        export_metrics (bool): Ghi số liệu đo của lần chạy ra metrics_file và metrics_prom_file khi kết thúc,
+            mặc định là True
+        sink (Sink|None): Đích ghi dữ liệu thay cho StudentPerformanceDAO, reset và delete_missing cũng
+            được thực hiện trên đích này, mặc định là None (ghi qua DAO theo load_mode)
+        rebuild (bool): Tải lại toàn bộ dữ liệu vào bảng phụ rồi đổi chỗ với bảng chính (xem rebuild_table),
+            thay cho need_reset để bảng không bị rỗng trong lúc tải, mặc định là False
+        keep_previous (bool): Khi rebuild là True, giữ lại bảng cũ để có thể hoàn tác, mặc định là False
+        commit_every (int|None): Số bản ghi mỗi lần commit khi ghi qua DAO (xem load), mặc định là None
+        resume (bool): Lưu mốc tải của từng phần dữ liệu vào bảng etl_checkpoint cùng với commit của mỗi lô.
+            Nếu lần chạy trước với cùng nguồn và tham số bị dừng giữa chừng, các bản ghi đã commit được
+            bỏ qua và việc tải tiếp tục từ lô cuối cùng đã commit. Không dùng khi có sink hoặc rebuild,
+            mặc định là False
     Raises:
+        ValueError: Nếu delete_missing được dùng với sink không hỗ trợ xóa từng bản ghi.
         Exception: Nếu có lỗi xảy ra trong quá trình ETL.
     """
+    if incremental and delete_missing and sink is not None and not sink.supports_delete:
+        raise ValueError(f'{type(sink).__name__} cannot delete records, delete_missing is not supported.')
+    setup_logging_()
+    start_time = time.perf_counter()
+    status = 'failed'
+    try:
+        extractor = CachedExtractor(resolve_source_(source), data_dir)
+        run_key = None
+        if incremental:
+            extractor.extract_path()
+            run_key = {
+                'checksum': extractor.checksum,
+                'load_for': load_for,
+                'strategy': strategy,
+                'stream': stream,
+                'chunksize': chunksize if stream else None,
+                'delete_missing': delete_missing
+            }
+            if not need_reset and not rebuild and is_unchanged_run_(run_key):
+                msg = 'Incremental: source is unchanged since the last run, nothing to load.'
+                print(msg)
+                logging.info(msg)
+                status = 'unchanged'
+                return
+        elif (need_reset or rebuild) and os.path.exists(last_run_file):
+            os.remove(last_run_file)
+
+        run_id = None
+        if resume and sink is None and not rebuild:
+            extractor.extract_path()
+            run_id = checkpoint_run_id_(extractor.checksum, load_for=load_for, strategy=strategy,
+                                        need_reset=need_reset, load_mode=load_mode, chunk_size=chunk_size,
+                                        stream=stream, chunksize=chunksize if stream else None,
+                                        incremental=incremental, workers=1 if stream else workers)
+
+        if stream:
+            report = stream_etl_process_(load_for, strategy, need_reset, load_mode, chunk_size, chunksize,
+                                         incremental, extractor=extractor, sink=sink,
+                                         rebuild=rebuild, keep_previous=keep_previous, commit_every=commit_every,
+                                         run_id=run_id)
+        else:
+            report = batch_etl_process_(load_for, strategy, need_reset, load_mode, chunk_size,
+                                        incremental, delete_missing, extractor, use_staging, workers, executor,
+                                        sink, rebuild, keep_previous, commit_every, run_id)
+        if run_key is not None and not report.failed_ids:
+            save_last_run_(run_key)
+        status = 'ok'
+    finally:
+        metrics.observe('etl_run_seconds', time.perf_counter() - start_time, status=status)
+        if export_metrics:
+            export_metrics_(status=status, load_mode=load_mode, stream=stream, incremental=incremental)
+
+def checkpoint_run_id_(checksum: str, **params) -> str:
+    """
+    Tính mã của một lần tải có thể tiếp tục từ checksum của nguồn dữ liệu và các tham số ảnh hưởng
+    tới thứ tự và cách chia các bản ghi.
+
+    Args:
+        checksum (str): Checksum của file nguồn.
+        **params: Các tham số của lần chạy.
+
+    Returns:
+        str: Mã của lần tải.
+    """
+    import hashlib
+
+    key = json.dumps({'checksum': checksum, **params}, sort_keys=True, default=str)
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+def prepare_checkpoints_(dao: StudentPerformanceDAO, run_id: str) -> bool:
+    """
+    Tạo bảng etl_checkpoint nếu chưa có và cho biết lần tải này có đang tiếp tục lần chạy trước không.
+
+    Args:
+        dao (StudentPerformanceDAO): DAO của lần chạy.
+        run_id (str): Mã của lần tải.
+
+    Returns:
+        bool: True nếu đã có mốc tải của run_id.
+    """
+    dao.create_checkpoint_table()
+    return bool(dao.get_checkpoints(run_id))
+
+def is_unchanged_run_(run_key: dict) -> bool:
+    """
+    Kiểm tra lần chạy tăng dần có cùng nguồn và tham số với lần chạy thành công gần nhất hay không.
+
+    Args:
+        run_key (dict): Checksum của file nguồn và các tham số lấy mẫu của lần chạy.
+
+    Returns:
+        bool: True nếu không có gì cần tải.
+    """
+    if not os.path.exists(fingerprint_file):
+        return False
+    try:
+        with open(last_run_file, 'r') as file:
+            return json.load(file) == run_key
+    except (OSError, ValueError):
+        return False
+
+def save_last_run_(run_key: dict):
+    """
+    Lưu checksum và tham số của lần chạy tăng dần thành công vào last_run_file.
+
+    Args:
+        run_key (dict): Checksum của file nguồn và các tham số lấy mẫu của lần chạy.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(last_run_file)), exist_ok=True)
+    with open(last_run_file, 'w') as file:
+        json.dump(run_key, file)
+
+def batch_etl_process_(load_for: int|None,
+                       strategy: Literal['head', 'tail', 'random']|None,
+                       need_reset: bool,
+                       load_mode: Literal['row', 'bulk'],
+                       chunk_size: int,
+                       incremental: bool,
+                       delete_missing: bool,
+                       extractor: CachedExtractor,
+                       use_staging: bool,
+                       workers: int,
+                       executor: Literal['thread', 'process'],
+                       sink: Sink|None = None,
+                       rebuild: bool = False,
+                       keep_previous: bool = False,
+                       commit_every: int|None = None,
+                       run_id: str|None = None) -> LoadReport:
+    """
+    Thực hiện quá trình ETL trên toàn bộ dữ liệu trong bộ nhớ. Các tham số giống như etl_process,
+    run_id là mã của lần tải khi resume là True (None khi không lưu mốc tải).
+
+    Returns:
+        LoadReport: Kết quả tải (rỗng nếu không có bản ghi nào cần tải).
+    """
+    from dao import StudentPerformanceDAO
+    from fingerprint import FingerprintStore
+    from parallel import parallel_load
+
     # Extract
-    raw_df = extract()
+    raw_df = extract(use_staging=use_staging, extractor=extractor)
     
     # Transform
-    modified_df = transform(raw_df)
+    modified_df = transform(raw_df, use_staging=use_staging)
+    all_ids = modified_df[FieldName.STUDENT_ID]
     
-    # Load
-    # Check reset 
-    if need_reset:
-        reset()
     # Check strategy
     if isinstance(load_for, int):
         if strategy == 'head':
@@ -193,5 +824,160 @@ def etl_process(load_for: int|None = None,
             modified_df = modified_df.tail(load_for)
         elif strategy == 'random':
             modified_df = modified_df.sample(load_for, random_state=42)
-        
-    load(modified_df)
\ No newline at end of file
+
+    report = LoadReport()
+    store = FingerprintStore(fingerprint_file) if incremental else None
+    try:
+        # Chỉ giữ lại các dòng mới hoặc đã thay đổi
+        deleted_ids = []
+        if store is not None:
+            if need_reset or rebuild:
+                store.clear()
+            total = len(modified_df)
+            modified_df, hashes = store.diff(modified_df)
+            if delete_missing:
+                deleted_ids = store.missing_ids(all_ids)
+            msg = f'Incremental: {len(modified_df)}/{total} records changed, {len(deleted_ids)} records deleted.'
+            print(msg)
+            logging.info(msg)
+            if len(modified_df) == 0 and not deleted_ids and not need_reset and not rebuild:
+                return report
+
+        if rebuild:
+            report = rebuild_table(modified_df, mode=load_mode, chunk_size=chunk_size, sink=sink,
+                                   workers=workers, executor=executor, keep_previous=keep_previous,
+                                   commit_every=commit_every)
+            if store is not None:
+                commit_fingerprints_(store, modified_df, hashes, report)
+            return report
+
+        # Load: cả reset và load dùng chung một kết nối lấy từ pool (hoặc cùng một sink)
+        with sink if sink is not None else StudentPerformanceDAO(**db_config) as spDAO:
+            checkpoint = (run_id, 'batch') if run_id is not None else None
+            resuming = prepare_checkpoints_(spDAO, run_id) if run_id is not None else False
+            # Check reset (lần chạy tiếp tục không reset lại các bản ghi đã tải)
+            if need_reset and not resuming:
+                reset(spDAO)
+            if sink is not None:
+                report = load(modified_df, sink=sink)
+            elif workers > 1:
+                report = parallel_load(modified_df, db_config, workers=workers, executor=executor,
+                                       mode=load_mode, chunk_size=chunk_size, commit_every=commit_every,
+                                       checkpoint=checkpoint, held_connections=1)
+            else:
+                report = load(modified_df, mode=load_mode, chunk_size=chunk_size, dao=spDAO,
+                              commit_every=commit_every, checkpoint=checkpoint)
+            if store is not None:
+                commit_fingerprints_(store, modified_df, hashes, report)
+                if deleted_ids:
+                    spDAO.delete_many(deleted_ids, chunk_size=chunk_size)
+                    store.remove(deleted_ids)
+                    logging.info(f'Deleted {len(deleted_ids)} records.')
+            if run_id is not None and not report.failed_ids:
+                spDAO.clear_checkpoints(run_id)
+    finally:
+        if store is not None:
+            store.close()
+    return report
+
+def stream_etl_process_(load_for: int|None,
+                        strategy: Literal['head', 'tail', 'random']|None,
+                        need_reset: bool,
+                        load_mode: Literal['row', 'bulk'],
+                        chunk_size: int,
+                        chunksize: int,
+                        incremental: bool = False,
+                        source: DataSource|str|None = None,
+                        extractor: CachedExtractor|None = None,
+                        sink: Sink|None = None,
+                        rebuild: bool = False,
+                        keep_previous: bool = False,
+                        commit_every: int|None = None,
+                        run_id: str|None = None) -> LoadReport:
+    """
+    Thực hiện quá trình ETL dạng luồng: mỗi chunk đọc từ CSV đi qua transform, lấy mẫu rồi load.
+    Các tham số giống như etl_process, run_id là mã của lần tải khi resume là True (mỗi chunk có mốc riêng).
+
+    Returns:
+        LoadReport: Kết quả tổng hợp của tất cả các chunk.
+    """
+    from dao import StudentPerformanceDAO
+    from fingerprint import FingerprintStore
+    from sampling import create_sampler, sample_stream
+
+    # Extract và Transform được nối thành một generator, chưa chunk nào được đọc ở đây
+    chunks = (transform(raw_chunk)
+              for raw_chunk in extract(chunksize=chunksize, source=source, extractor=extractor))
+    sampler = create_sampler(load_for, strategy)
+    total = LoadReport()
+
+    store = FingerprintStore(fingerprint_file) if incremental else None
+    if rebuild:
+        try:
+            return rebuild_stream_(sample_stream(chunks, sampler), store, load_mode, chunk_size, sink, keep_previous,
+                                   commit_every)
+        finally:
+            if store is not None:
+                store.close()
+    # Load: cả reset và load dùng chung một kết nối lấy từ pool (hoặc cùng một sink)
+    try:
+        with sink if sink is not None else StudentPerformanceDAO(**db_config) as spDAO:
+            resuming = prepare_checkpoints_(spDAO, run_id) if run_id is not None else False
+            # Check reset (lần chạy tiếp tục không reset lại các bản ghi đã tải)
+            if need_reset and not resuming:
+                reset(spDAO)
+                if store is not None:
+                    store.clear()
+            for index, modified_df in enumerate(sample_stream(chunks, sampler)):
+                checkpoint = (run_id, f'chunk-{index}') if run_id is not None else None
+                if store is None:
+                    total.merge(load(modified_df, mode=load_mode, chunk_size=chunk_size, dao=spDAO, sink=sink,
+                                     commit_every=commit_every, checkpoint=checkpoint))
+                    continue
+                changed_df, hashes = store.diff(modified_df)
+                if len(changed_df):
+                    report = load(changed_df, mode=load_mode, chunk_size=chunk_size, dao=spDAO, sink=sink,
+                                  commit_every=commit_every, checkpoint=checkpoint)
+                    commit_fingerprints_(store, changed_df, hashes, report)
+                    total.merge(report)
+            if run_id is not None and not total.failed_ids:
+                spDAO.clear_checkpoints(run_id)
+    finally:
+        if store is not None:
+            store.close()
+    return total
+
+def rebuild_stream_(frames: Iterator[pd.DataFrame],
+                    store: FingerprintStore|None,
+                    load_mode: Literal['row', 'bulk'],
+                    chunk_size: int,
+                    sink: Sink|None,
+                    keep_previous: bool,
+                    commit_every: int|None = None) -> LoadReport:
+    """
+    Tải lại toàn bộ dữ liệu dạng luồng bằng rebuild_table. Hash của các chunk chỉ được lưu vào
+    kho dấu vân tay sau khi bảng mới đã được đổi vào.
+
+    Returns:
+        LoadReport: Kết quả tổng hợp của tất cả các chunk.
+    """
+    import numpy as np
+    import pandas as pd
+
+    loaded = []
+
+    def fingerprinted(frames: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        for modified_df in frames:
+            if store is not None:
+                loaded.append((modified_df[[FieldName.STUDENT_ID]], store.hash_frame(modified_df)))
+            yield modified_df
+
+    if store is not None:
+        store.clear()
+
+    report = rebuild_table(fingerprinted(frames), mode=load_mode, chunk_size=chunk_size, sink=sink,
+                           keep_previous=keep_previous, commit_every=commit_every)
+    if store is not None and loaded:
+        commit_fingerprints_(store, pd.concat([df for df, _ in loaded], ignore_index=True),
+                             np.concatenate([hashes for _, hashes in loaded]), report)
+    return report
@@ -0,0 +1,232 @@
+import os
+import json
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+
+
+class DataSource(ABC):
+    """
+    Lớp cơ sở cho nguồn dữ liệu của bước Extract.
+    """
+
+    def signature(self) -> str|None:
+        """
+        Lấy chuỗi đặc trưng cho phiên bản hiện tại của nguồn (phiên bản dataset, ETag, ...).
+
+        Returns:
+            str|None: Chuỗi đặc trưng, None nếu không xác định được (khi đó luôn phải tải lại).
+        """
+        return None
+
+    @abstractmethod
+    def fetch(self, data_dir: str) -> str:
+        """
+        Lấy dữ liệu về máy (nếu cần) và trả về đường dẫn file CSV.
+
+        Args:
+            data_dir (str): Thư mục lưu dữ liệu tải về.
+
+        Returns:
+            str: Đường dẫn file CSV.
+        """
+
+
+class KaggleSource(DataSource):
+    """
+    Nguồn dữ liệu là một dataset trên Kaggle.
+
+    Attributes:
+        dataset_id (str): Mã dataset trên Kaggle.
+        relative_path (str): Đường dẫn file CSV trong thư mục dữ liệu sau khi giải nén.
+    """
+
+    def __init__(self, dataset_id: str, relative_path: str):
+        """
+        Hàm khởi tạo của KaggleSource.
+
+        Args:
+            dataset_id (str): Mã dataset trên Kaggle.
+            relative_path (str): Đường dẫn file CSV trong thư mục dữ liệu sau khi giải nén.
+        """
+        self.dataset_id = dataset_id
+        self.relative_path = relative_path
+        self._api = None
+
+    @property
+    def api(self):
+        # Chỉ import và xác thực Kaggle API khi thực sự cần
+        if self._api is None:
+            from kaggle.api.kaggle_api_extended import KaggleApi
+            os.environ['KAGGLE_CONFIG_DIR'] = '~/.kaggle'
+            api = KaggleApi()
+            try:
+                api.authenticate()
+                logging.info('Successfully authenticate Kaggle API.')
+            except Exception as e:
+                logging.error(f"Failed to authenticate Kaggle API.")
+                raise e
+            self._api = api
+        return self._api
+
+    def signature(self) -> str|None:
+        try:
+            result = self.api.dataset_list_files(self.dataset_id)
+        except Exception as e:
+            logging.warning(f'Failed to get the version of {self.dataset_id}: {e}')
+            return None
+        files = getattr(result, 'files', None) or []
+        parts = []
+        for file in files:
+            parts.append('{}:{}:{}'.format(
+                getattr(file, 'name', ''),
+                getattr(file, 'totalBytes', getattr(file, 'size', '')),
+                getattr(file, 'creationDate', '')
+            ))
+        return '|'.join(sorted(parts)) if parts else None
+
+    def fetch(self, data_dir: str) -> str:
+        try:
+            self.api.dataset_download_files(self.dataset_id, data_dir, force=True, unzip=True)
+            logging.info(f"Dataset downloaded successfully from {self.dataset_id}.")
+        except Exception as e:
+            logging.error(f'Failed to download datasets at {self.dataset_id}.')
+            raise e
+        return os.path.join(data_dir, self.relative_path)
+
+
+class LocalSource(DataSource):
+    """
+    Nguồn dữ liệu là một file CSV hoặc một thư mục chứa file CSV có sẵn trên máy.
+
+    Attributes:
+        path (str): Đường dẫn file CSV.
+    """
+
+    def __init__(self, path: str, file_name: str|None = None):
+        """
+        Hàm khởi tạo của LocalSource.
+
+        Args:
+            path (str): Đường dẫn file CSV hoặc thư mục.
+            file_name (str|None): Tên file CSV trong thư mục, nếu là None thì lấy file .csv
+                đầu tiên theo thứ tự tên, mặc định là None.
+
+        Raises:
+            FileNotFoundError: Nếu thư mục không có file CSV.
+        """
+        if os.path.isdir(path):
+            if file_name is None:
+                names = sorted(name for name in os.listdir(path) if name.endswith('.csv'))
+                if not names:
+                    raise FileNotFoundError(f'No CSV file in {path}')
+                file_name = names[0]
+            path = os.path.join(path, file_name)
+        self.path = path
+
+    def signature(self) -> str|None:
+        stat = os.stat(self.path)
+        return f'{stat.st_size}:{stat.st_mtime_ns}'
+
+    def fetch(self, data_dir: str) -> str:
+        return self.path
+
+
+def file_checksum(path: str) -> str:
+    """
+    Tính SHA-256 của một file.
+
+    Args:
+        path (str): Đường dẫn file.
+
+    Returns:
+        str: Chuỗi hex của SHA-256.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CachedExtractor:
+    """
+    Lớp lấy dữ liệu từ một DataSource, bỏ qua việc tải lại khi phiên bản của nguồn và
+    checksum của file đã tải không thay đổi so với lần trước.
+
+    Attributes:
+        source (DataSource): Nguồn dữ liệu.
+        data_dir (str): Thư mục lưu dữ liệu tải về.
+        cache_file (str): File JSON lưu phiên bản, checksum và đường dẫn file lần trước.
+        checksum (str|None): Checksum của file ở lần lấy dữ liệu gần nhất.
+        path (str|None): Đường dẫn file CSV ở lần lấy dữ liệu gần nhất.
+    """
+
+    def __init__(self, source: DataSource, data_dir: str, cache_file: str|None = None):
+        """
+        Hàm khởi tạo của CachedExtractor.
+
+        Args:
+            source (DataSource): Nguồn dữ liệu.
+            data_dir (str): Thư mục lưu dữ liệu tải về.
+            cache_file (str|None): File lưu thông tin cache, mặc định là data_dir/.extract_cache.json.
+        """
+        self.source = source
+        self.data_dir = data_dir
+        self.cache_file = cache_file or os.path.join(data_dir, '.extract_cache.json')
+        self.checksum = None
+        self.path = None
+
+    def read_cache_(self) -> dict:
+        try:
+            with open(self.cache_file, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def write_cache_(self, cache: dict) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+        with open(self.cache_file, 'w') as file:
+            json.dump(cache, file, indent=2)
+
+    def checksum_of_(self, path: str, cache: dict) -> str:
+        # Chỉ tính lại checksum khi kích thước hoặc thời gian sửa file thay đổi
+        stat = os.stat(path)
+        if (cache.get('path') == path and cache.get('size') == stat.st_size
+                and cache.get('mtime_ns') == stat.st_mtime_ns and cache.get('sha256')):
+            return cache['sha256']
+        return file_checksum(path)
+
+    def extract_path(self) -> str:
+        """
+        Lấy đường dẫn file CSV, chỉ tải lại khi nguồn có phiên bản mới hoặc file đã tải bị thay đổi.
+        Nguồn chỉ được kiểm tra ở lần gọi đầu tiên, các lần gọi sau trả lại kết quả đó.
+
+        Returns:
+            str: Đường dẫn file CSV.
+        """
+        if self.path is not None:
+            return self.path
+        cache = self.read_cache_()
+        signature = self.source.signature()
+        path = cache.get('path')
+        if (signature is not None and cache.get('signature') == signature
+                and path is not None and os.path.isfile(path)
+                and self.checksum_of_(path, cache) == cache.get('sha256')):
+            logging.info('Source is unchanged, reuse the extracted file.')
+            self.checksum = cache['sha256']
+            self.path = path
+            return path
+
+        path = self.source.fetch(self.data_dir)
+        stat = os.stat(path)
+        self.checksum = file_checksum(path)
+        self.write_cache_({
+            'signature': signature,
+            'path': path,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': self.checksum
+        })
+        self.path = path
+        return path
@@ -5,4 +5,13 @@ class FieldName:
     PREVIOUS_GRADES = "Previous Grades"
     PARTICIPATE_ON_ACT = "Participation in Extracurricular Activities"
     PARENT_EDU_LEVEL = "Parent Education Level"
-    PASSED = "Passed"
\ No newline at end of file
+    PASSED = "Passed"
+
+class Categories:
+    """
+    Các giá trị đã biết của các cột phân loại theo đúng thứ tự mã (mã 0, 1, ...), trùng với thứ tự
+    của các ENUM trong sql/migrations/001_categorical_enums.sql. Giá trị chưa biết được thêm vào cuối.
+    """
+    PARTICIPATE_ON_ACT = ('No', 'Yes', 'Unknown')
+    PARENT_EDU_LEVEL = ('High School', 'Associate', 'Bachelor', 'Master', 'Doctorate', 'Unknown')
+    PASSED = ('No', 'Yes')
@@ -0,0 +1,146 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from field import FieldName
+
+
+class FingerprintStore:
+    """
+    Lớp lưu dấu vân tay (hash nội dung) của từng Student ID đã được tải vào cơ sở dữ liệu,
+    dùng để chỉ gửi các bản ghi mới hoặc đã thay đổi trong chế độ tải tăng dần.
+
+    Dữ liệu được lưu trong một file SQLite cục bộ.
+
+    Attributes:
+        _connection (sqlite3.Connection): Kết nối tới file SQLite.
+    """
+
+    LOOKUP_CHUNK = 500
+
+    def __init__(self, path: str):
+        """
+        Hàm khởi tạo của FingerprintStore.
+
+        Args:
+            path (str): Đường dẫn file SQLite, được tạo mới nếu chưa có.
+        """
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS fingerprint('
+            'student_id TEXT PRIMARY KEY, hash INTEGER NOT NULL)'
+        )
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def hash_frame(df: pd.DataFrame) -> np.ndarray:
+        """
+        Tính hash nội dung của từng dòng (không tính index).
+
+        Args:
+            df (pd.DataFrame): Dữ liệu đã được xử lý có các cột theo FieldName.
+
+        Returns:
+            np.ndarray: Mảng int64 chứa hash của từng dòng.
+        """
+        columns = [FieldName.STUDENT_ID, FieldName.STUDY_HOURS, FieldName.ATTENDANCE_RATE,
+                   FieldName.PREVIOUS_GRADES, FieldName.PARTICIPATE_ON_ACT,
+                   FieldName.PARENT_EDU_LEVEL, FieldName.PASSED]
+        hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+        # SQLite chỉ lưu được số nguyên có dấu 64 bit
+        return hashes.view(np.int64)
+
+    def lookup(self, ids: list[str]) -> dict[str, int]:
+        """
+        Lấy hash đã lưu của các mã sinh viên.
+
+        Args:
+            ids (list[str]): Danh sách mã sinh viên.
+
+        Returns:
+            dict[str, int]: Hash đã lưu của các mã sinh viên có trong kho.
+        """
+        result = {}
+        for start in range(0, len(ids), self.LOOKUP_CHUNK):
+            chunk = ids[start:start + self.LOOKUP_CHUNK]
+            query = 'SELECT student_id, hash FROM fingerprint WHERE student_id IN ({})'.format(
+                ', '.join(['?'] * len(chunk)))
+            result.update(self._connection.execute(query, chunk).fetchall())
+        return result
+
+    def diff(self, df: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray]:
+        """
+        Tìm các dòng mới hoặc đã thay đổi so với lần tải trước.
+
+        Args:
+            df (pd.DataFrame): Dữ liệu đã được xử lý.
+
+        Returns:
+            tuple[pd.DataFrame, np.ndarray]: Các dòng cần tải và hash tương ứng của chúng.
+        """
+        hashes = self.hash_frame(df)
+        ids = df[FieldName.STUDENT_ID].tolist()
+        stored = self.lookup(ids)
+        present = np.fromiter((id in stored for id in ids), dtype=bool, count=len(ids))
+        old = np.fromiter((stored.get(id, 0) for id in ids), dtype=np.int64, count=len(ids))
+        changed = ~present | (old != hashes)
+        return df[changed], hashes[changed]
+
+    def missing_ids(self, ids) -> list[str]:
+        """
+        Lấy các mã sinh viên đã lưu nhưng không còn trong dữ liệu mới.
+
+        Args:
+            ids: Tất cả mã sinh viên của dữ liệu mới.
+
+        Returns:
+            list[str]: Các mã sinh viên không còn trong dữ liệu mới.
+        """
+        current = set(ids)
+        cursor = self._connection.execute('SELECT student_id FROM fingerprint')
+        return [row[0] for row in cursor if row[0] not in current]
+
+    def commit(self, ids: list[str], hashes: np.ndarray) -> None:
+        """
+        Lưu hash của các bản ghi đã tải thành công.
+
+        Args:
+            ids (list[str]): Mã sinh viên.
+            hashes (np.ndarray): Hash tương ứng.
+        """
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO fingerprint(student_id, hash) VALUES(?, ?)',
+            zip(ids, hashes.tolist())
+        )
+        self._connection.commit()
+
+    def remove(self, ids: list[str]) -> None:
+        """
+        Xóa hash của các bản ghi đã bị xóa khỏi cơ sở dữ liệu.
+
+        Args:
+            ids (list[str]): Mã sinh viên.
+        """
+        self._connection.executemany('DELETE FROM fingerprint WHERE student_id = ?',
+                                     [(id,) for id in ids])
+        self._connection.commit()
+
+    def clear(self) -> None:
+        """
+        Xóa toàn bộ hash đã lưu (dùng khi reset cơ sở dữ liệu).
+        """
+        self._connection.execute('DELETE FROM fingerprint')
+        self._connection.commit()
+
+    def close(self) -> None:
+        """
+        Đóng kết nối tới file SQLite.
+        """
+        self._connection.close()
@@ -0,0 +1,274 @@
+import os
+import json
+import bisect
+import time
+import threading
+import functools
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Các mốc (giây) mặc định của histogram thời gian
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Các mốc mặc định của histogram kích thước lô
+SIZE_BUCKETS = (1, 10, 100, 500, 1000, 2000, 5000, 10000, 50000, 100000)
+
+
+class Histogram:
+    """
+    Histogram tích lũy theo các mốc cố định (giống histogram của Prometheus).
+
+    Attributes:
+        buckets (tuple[float, ...]): Các mốc trên (le) của từng ô.
+        counts (list[int]): Số quan sát nhỏ hơn hoặc bằng từng mốc (không tích lũy).
+        count (int): Tổng số quan sát.
+        sum (float): Tổng giá trị các quan sát.
+        min (float|None): Giá trị nhỏ nhất.
+        max (float|None): Giá trị lớn nhất.
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float) -> None:
+        """
+        Ghi nhận một quan sát.
+
+        Args:
+            value (float): Giá trị quan sát.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'buckets': {str(bound): count for bound, count in zip(self.buckets + ('+Inf',), self.counts)}
+        }
+
+
+def key_(name: str, labels: dict) -> tuple:
+    return (name, tuple(sorted(labels.items())))
+
+
+def format_key_(key: tuple) -> str:
+    name, labels = key
+    if not labels:
+        return name
+    return name + '{' + ','.join(f'{k}="{v}"' for k, v in labels) + '}'
+
+
+class MetricsRegistry:
+    """
+    Nơi thu thập số liệu đo của quy trình ETL: bộ đếm (counter), giá trị tức thời (gauge)
+    và histogram, mỗi số liệu có thể gắn nhãn (labels). An toàn khi dùng từ nhiều thread.
+
+    Attributes:
+        counters (dict): Các bộ đếm theo (tên, nhãn).
+        gauges (dict): Các giá trị tức thời theo (tên, nhãn).
+        histograms (dict): Các histogram theo (tên, nhãn).
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """
+        Tăng một bộ đếm.
+
+        Args:
+            name (str): Tên số liệu.
+            value (float): Giá trị tăng thêm, mặc định là 1.
+            **labels: Các nhãn của số liệu.
+        """
+        key = key_(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels) -> None:
+        """
+        Đặt giá trị cho một gauge.
+
+        Args:
+            name (str): Tên số liệu.
+            value (float): Giá trị.
+            **labels: Các nhãn của số liệu.
+        """
+        with self._lock:
+            self.gauges[key_(name, labels)] = value
+
+    def set_max(self, name: str, value: float, **labels) -> None:
+        """
+        Đặt giá trị cho một gauge nếu lớn hơn giá trị hiện tại (mức cao nhất).
+        """
+        key = key_(name, labels)
+        with self._lock:
+            self.gauges[key] = max(self.gauges.get(key, value), value)
+
+    def observe(self, name: str, value: float, buckets: tuple = DEFAULT_BUCKETS, **labels) -> None:
+        """
+        Ghi nhận một quan sát vào histogram.
+
+        Args:
+            name (str): Tên số liệu.
+            value (float): Giá trị quan sát.
+            buckets (tuple): Các mốc của histogram nếu phải tạo mới, mặc định là DEFAULT_BUCKETS.
+            **labels: Các nhãn của số liệu.
+        """
+        key = key_(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """
+        Đo thời gian của một khối lệnh bằng đồng hồ đơn điệu độ phân giải cao (perf_counter_ns)
+        và ghi vào histogram (giây).
+
+        Args:
+            name (str): Tên số liệu.
+            **labels: Các nhãn của số liệu.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter_ns() - start) / 1e9, **labels)
+
+    def record_memory(self) -> None:
+        """
+        Ghi lại mức bộ nhớ cao nhất của tiến trình (max RSS) và của tracemalloc nếu đang bật.
+        """
+        if resource is not None:
+            # ru_maxrss tính bằng KB trên Linux
+            self.set_max('process_max_rss_bytes', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+        if tracemalloc.is_tracing():
+            self.set_max('python_heap_peak_bytes', tracemalloc.get_traced_memory()[1])
+
+    def reset(self) -> None:
+        """
+        Xóa tất cả các số liệu đã thu thập.
+        """
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+
+    def to_dict(self) -> dict:
+        """
+        Chuyển các số liệu thành dict có thể ghi ra JSON.
+
+        Returns:
+            dict: Các số liệu theo loại.
+        """
+        with self._lock:
+            return {
+                'counters': {format_key_(k): v for k, v in self.counters.items()},
+                'gauges': {format_key_(k): v for k, v in self.gauges.items()},
+                'histograms': {format_key_(k): h.to_dict() for k, h in self.histograms.items()}
+            }
+
+    def write_jsonl(self, path: str, **extra) -> None:
+        """
+        Ghi thêm một dòng JSON chứa các số liệu hiện tại vào cuối file.
+
+        Args:
+            path (str): Đường dẫn file .jsonl.
+            **extra: Các trường thêm vào dòng JSON (ví dụ mã của lần chạy).
+        """
+        record = {'timestamp': time.time(), **extra, **self.to_dict()}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'a') as file:
+            file.write(json.dumps(record) + '\n')
+
+    def to_prometheus(self) -> str:
+        """
+        Chuyển các số liệu sang định dạng văn bản của Prometheus.
+
+        Returns:
+            str: Nội dung theo định dạng văn bản của Prometheus.
+        """
+        def with_label(key: tuple, name: str, **more) -> str:
+            return format_key_((name, tuple(sorted(dict(key[1], **more).items()))))
+
+        lines = []
+        typed = set()
+
+        def add_type(name: str, kind: str):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f'# TYPE {name} {kind}')
+
+        with self._lock:
+            for key, value in sorted(self.counters.items()):
+                add_type(key[0], 'counter')
+                lines.append(f'{format_key_(key)} {value}')
+            for key, value in sorted(self.gauges.items()):
+                add_type(key[0], 'gauge')
+                lines.append(f'{format_key_(key)} {value}')
+            for key, histogram in sorted(self.histograms.items()):
+                name = key[0]
+                add_type(name, 'histogram')
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{with_label(key, name + "_bucket", le=bound)} {cumulative}')
+                lines.append(f'{with_label(key, name + "_sum")} {histogram.sum}')
+                lines.append(f'{with_label(key, name + "_count")} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Ghi các số liệu ra file văn bản theo định dạng Prometheus (ghi đè, dùng với textfile collector).
+
+        Args:
+            path (str): Đường dẫn file .prom.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as file:
+            file.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+
+# Registry mặc định dùng chung trong tiến trình
+metrics = MetricsRegistry()
+
+
+def timed(name: str, **labels):
+    """
+    Decorator đo thời gian của một hàm vào histogram của registry mặc định.
+
+    Args:
+        name (str): Tên số liệu.
+        **labels: Các nhãn của số liệu.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with metrics.timer(name, **labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
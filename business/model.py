@@ -1,7 +1,93 @@
+import threading
 import numpy as np
 import pandas as pd
 from typing import Literal
-from field import FieldName
+from field import FieldName, Categories
+from metrics import metrics
+
+
+class CategoryDictionary:
+    """
+    Từ điển mã hóa một cột phân loại: các giá trị đã biết có mã cố định theo thứ tự của Categories,
+    giá trị mới được thêm vào cuối. Dùng chung trong tiến trình để mỗi giá trị chỉ có một mã.
+
+    Attributes:
+        _values (list[str]): Các giá trị theo mã.
+        _codes (dict[str, int]): Mã của từng giá trị.
+        known (int): Số giá trị đã biết trước (các mã hợp lệ của ENUM trong CSDL).
+    """
+
+    def __init__(self, values: tuple):
+        self._values = list(values)
+        self._codes = {value: code for code, value in enumerate(values)}
+        self._lock = threading.Lock()
+        self.known = len(values)
+
+    @property
+    def values(self) -> tuple:
+        return tuple(self._values)
+
+    def encode(self, value: str|None) -> int:
+        """
+        Lấy mã của một giá trị, thêm giá trị mới vào từ điển nếu chưa có.
+
+        Args:
+            value (str|None): Giá trị cần mã hóa.
+
+        Returns:
+            int: Mã của giá trị, -1 nếu giá trị bị thiếu.
+        """
+        if value is None or value != value:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self._codes.setdefault(value, len(self._values))
+                if code == len(self._values):
+                    self._values.append(value)
+        return code
+
+    def decode(self, code: int) -> str|None:
+        """
+        Lấy giá trị của một mã.
+
+        Args:
+            code (int): Mã cần giải mã.
+
+        Returns:
+            str|None: Giá trị tương ứng, None nếu mã là -1.
+        """
+        return self._values[code] if code >= 0 else None
+
+
+# Từ điển của các cột phân loại theo tên thuộc tính của StudentModel
+DICTIONARIES = {
+    'parcipate_on_act': CategoryDictionary(Categories.PARTICIPATE_ON_ACT),
+    'parent_edu_level': CategoryDictionary(Categories.PARENT_EDU_LEVEL),
+    'passed': CategoryDictionary(Categories.PASSED)
+}
+ACT_DICTIONARY = DICTIONARIES['parcipate_on_act']
+EDU_DICTIONARY = DICTIONARIES['parent_edu_level']
+PASSED_DICTIONARY = DICTIONARIES['passed']
+
+
+def enum_index_(field: str, code: int) -> int|str|None:
+    """
+    Chuyển mã của một thuộc tính phân loại thành giá trị ghi vào cột ENUM của MySQL.
+
+    Args:
+        field (str): Tên thuộc tính theo DICTIONARIES.
+        code (int): Mã của giá trị.
+
+    Returns:
+        int|str|None: Chỉ số ENUM (bắt đầu từ 1) với giá trị đã biết, chuỗi với giá trị mới
+            và None nếu giá trị bị thiếu.
+    """
+    dictionary = DICTIONARIES[field]
+    if code < 0:
+        return None
+    return code + 1 if code < dictionary.known else dictionary.decode(code)
+
 
 class StudentModel:
     """
@@ -15,8 +101,14 @@ class StudentModel:
         parcipate_on_act (str): Tham gia các hoạt động ngoại khóa.
         parent_edu_level (str): Trình độ học vấn của phụ huynh.
         passed (str): Tình trạng đậu hoặc rớt của sinh viên.
+
+    Các thuộc tính phân loại được lưu dưới dạng mã của DICTIONARIES và chỉ được giải mã khi đọc thuộc tính.
     """
 
+    # Không dùng __dict__ cho từng đối tượng để giảm bộ nhớ khi có nhiều bản ghi
+    __slots__ = ('__id', '__study_hours_per_week', '__attendance_rate', '__previous_grades',
+                 '__parcipate_on_act', '__parent_edu_level', '__passed')
+
     def __init__(self, id: str, 
                  study_hours_per_week: float, 
                  attendance_rate: float,
@@ -62,15 +154,21 @@ class StudentModel:
 
     @property
     def parcipate_on_act(self):
-        return self.__parcipate_on_act
+        return ACT_DICTIONARY.decode(self.__parcipate_on_act)
 
     @property
     def parent_edu_level(self):
-        return self.__parent_edu_level
+        return EDU_DICTIONARY.decode(self.__parent_edu_level)
 
     @property
     def passed(self):
-        return self.__passed
+        return PASSED_DICTIONARY.decode(self.__passed)
+
+    def category_codes_(self) -> tuple[int, int, int]:
+        """
+        Lấy mã của các thuộc tính phân loại (parcipate_on_act, parent_edu_level, passed).
+        """
+        return self.__parcipate_on_act, self.__parent_edu_level, self.__passed
 
     @id.setter
     def id(self, id: str):
@@ -85,8 +183,8 @@ class StudentModel:
         elif np.isnan(study_hours_per_week):
             self.__study_hours_per_week = None
         elif study_hours_per_week < 0:
-            print('''Warning: Because study hours is non-negative
-                  so the value to assign is None''')
+            # Giờ học phải không âm, giá trị được gán None
+            metrics.inc('model_fixed_values_total', field=FieldName.STUDY_HOURS)
             self.__study_hours_per_week = None
         else:
             self.__study_hours_per_week = study_hours_per_week
@@ -98,8 +196,8 @@ class StudentModel:
         elif np.isnan(attendance_rate):        
             self.__attendance_rate = None
         elif attendance_rate < 0:
-            print('''Warning: Because attendance rate is non-negative
-                  so the value to assign is None''')
+            # Tỷ lệ tham gia phải không âm, giá trị được gán None
+            metrics.inc('model_fixed_values_total', field=FieldName.ATTENDANCE_RATE)
             self.__attendance_rate = None
         else:
             self.__attendance_rate = attendance_rate
@@ -111,8 +209,8 @@ class StudentModel:
         elif np.isnan(previous_grades):
             self.__previous_grades = None
         elif previous_grades < 0 or previous_grades > 100:
-            print('''Warning: Because attendance rate is in [0,100]
-                  so the value to assign is the boundary''')
+            # Điểm số phải trong [0,100], giá trị được đưa về biên
+            metrics.inc('model_fixed_values_total', field=FieldName.PREVIOUS_GRADES)
             if previous_grades < 0:
                 self.__previous_grades = 0
             else:
@@ -122,18 +220,44 @@ class StudentModel:
 
     @parcipate_on_act.setter
     def parcipate_on_act(self, parcipate_on_act: str):
-        self.__parcipate_on_act = parcipate_on_act
+        self.__parcipate_on_act = ACT_DICTIONARY.encode(parcipate_on_act)
 
     @parent_edu_level.setter
     def parent_edu_level(self, parent_edu_level: str):
-        self.__parent_edu_level = parent_edu_level
+        self.__parent_edu_level = EDU_DICTIONARY.encode(parent_edu_level)
 
     @passed.setter
     def passed(self, passed: str|Literal['Yes', 'No']):
         if passed not in ['Yes', 'No']:
             raise ValueError("Invalid value!")
         else:
-            self.__passed = passed
+            self.__passed = PASSED_DICTIONARY.encode(passed)
+
+    @classmethod
+    def from_valid_(cls, id: str,
+                    study_hours_per_week: float|None,
+                    attendance_rate: float|None,
+                    previous_grades: float|None,
+                    parcipate_on_act: str,
+                    parent_edu_level: str,
+                    passed: str) -> 'StudentModel':
+        """
+        Tạo mô hình sinh viên từ các giá trị đã được kiểm tra (bỏ qua các setter).
+
+        Chỉ dùng cho các giá trị đã qua validate_columns_, các giá trị thiếu phải là None.
+
+        Returns:
+            StudentModel: Mô hình sinh viên.
+        """
+        model = cls.__new__(cls)
+        model.__id = id
+        model.__study_hours_per_week = study_hours_per_week
+        model.__attendance_rate = attendance_rate
+        model.__previous_grades = previous_grades
+        model.__parcipate_on_act = ACT_DICTIONARY.encode(parcipate_on_act)
+        model.__parent_edu_level = EDU_DICTIONARY.encode(parent_edu_level)
+        model.__passed = PASSED_DICTIONARY.encode(passed)
+        return model
 
     def __str__(self):
         """
@@ -190,4 +314,343 @@ def create_model(record: pd.Series|tuple) -> StudentModel:
         parcipate_on_act=result[4],
         parent_edu_level=result[5],
         passed=result[6]
-    )
\ No newline at end of file
+    )
+
+
+def to_optional_column_(values: np.ndarray) -> np.ndarray:
+    """
+    Chuyển một cột số thành mảng object, các giá trị NaN được gán None.
+
+    Args:
+        values (np.ndarray): Cột số dạng float64.
+
+    Returns:
+        np.ndarray: Mảng object chứa float hoặc None.
+    """
+    result = values.astype(object)
+    result[np.isnan(values)] = None
+    return result
+
+
+def categorical_column_(column: pd.Series) -> pd.Categorical|np.ndarray:
+    """
+    Lấy một cột phân loại mà không giải mã nếu cột đã là kiểu category.
+
+    Args:
+        column (pd.Series): Cột phân loại.
+
+    Returns:
+        pd.Categorical|np.ndarray: Cột dạng Categorical (giữ nguyên mã) hoặc mảng object.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.array
+    return column.to_numpy(dtype=object)
+
+
+def validate_columns_(df: pd.DataFrame) -> tuple[np.ndarray, ...]:
+    """
+    Kiểm tra và chuẩn hóa toàn bộ các cột của DataFrame theo cùng quy tắc với các setter của StudentModel.
+
+    Args:
+        df (pd.DataFrame): Dữ liệu có các cột theo FieldName.
+
+    Returns:
+        tuple[np.ndarray, ...]: Bảy cột theo thứ tự thuộc tính của StudentModel,
+            các cột số là float64 với giá trị thiếu/không hợp lệ là NaN, các cột phân loại kiểu category
+            được giữ dạng pd.Categorical.
+
+    Raises:
+        ValueError: Nếu có mã sinh viên rỗng hoặc giá trị Passed không hợp lệ
+            (load() loại các dòng này trước bằng validation.validate_frame).
+    """
+    ids = df[FieldName.STUDENT_ID].to_numpy(dtype=object)
+    if pd.isna(ids).any():
+        raise ValueError('Empty value for id')
+    passed = categorical_column_(df[FieldName.PASSED])
+    valid = passed.isin(['Yes', 'No']) if isinstance(passed, pd.Categorical) else np.isin(passed, ['Yes', 'No'])
+    if not valid.all():
+        raise ValueError("Invalid value!")
+
+    study_hours = df[FieldName.STUDY_HOURS].to_numpy(dtype=np.float64, copy=True)
+    negative = study_hours < 0
+    if negative.any():
+        metrics.inc('model_fixed_values_total', int(negative.sum()), field=FieldName.STUDY_HOURS)
+        study_hours[negative] = np.nan
+
+    attendance_rate = df[FieldName.ATTENDANCE_RATE].to_numpy(dtype=np.float64, copy=True)
+    negative = attendance_rate < 0
+    if negative.any():
+        metrics.inc('model_fixed_values_total', int(negative.sum()), field=FieldName.ATTENDANCE_RATE)
+        attendance_rate[negative] = np.nan
+
+    previous_grades = df[FieldName.PREVIOUS_GRADES].to_numpy(dtype=np.float64)
+    out_of_range = (previous_grades < 0) | (previous_grades > 100)
+    if out_of_range.any():
+        metrics.inc('model_fixed_values_total', int(out_of_range.sum()), field=FieldName.PREVIOUS_GRADES)
+        previous_grades = np.clip(previous_grades, 0, 100)
+
+    return (
+        ids,
+        study_hours,
+        attendance_rate,
+        previous_grades,
+        categorical_column_(df[FieldName.PARTICIPATE_ON_ACT]),
+        categorical_column_(df[FieldName.PARENT_EDU_LEVEL]),
+        passed
+    )
+
+
+def create_models_from_frame(df: pd.DataFrame) -> list[StudentModel]:
+    """
+    Tạo danh sách mô hình sinh viên từ một DataFrame, kiểm tra dữ liệu theo từng cột thay vì từng dòng.
+
+    Args:
+        df (pd.DataFrame): Dữ liệu có các cột theo FieldName.
+
+    Returns:
+        list[StudentModel]: Danh sách các mô hình sinh viên theo thứ tự dòng.
+
+    Raises:
+        ValueError: Nếu có mã sinh viên rỗng hoặc giá trị Passed không hợp lệ.
+    """
+    ids, study_hours, attendance_rate, previous_grades, act, edu, passed = validate_columns_(df)
+    columns = (
+        ids,
+        to_optional_column_(study_hours),
+        to_optional_column_(attendance_rate),
+        to_optional_column_(previous_grades),
+        # Giải mã Categorical thành mảng object dùng chung các chuỗi của categories
+        np.asarray(act, dtype=object),
+        np.asarray(edu, dtype=object),
+        np.asarray(passed, dtype=object)
+    )
+    return [StudentModel.from_valid_(*row) for row in zip(*columns)]
+
+
+def encode_column_(values: np.ndarray|pd.Categorical, categories: tuple = ()) -> tuple[np.ndarray, tuple]:
+    """
+    Mã hóa một cột phân loại thành mã số nguyên nhỏ (int8), giá trị thiếu có mã -1.
+
+    Args:
+        values (np.ndarray|pd.Categorical): Cột phân loại, Categorical được dùng lại mã mà không so sánh chuỗi.
+        categories (tuple): Các giá trị đã biết trước, được giữ nguyên thứ tự mã, mặc định là rỗng.
+
+    Returns:
+        tuple[np.ndarray, tuple]: Mảng mã int8 và bộ giá trị tương ứng với từng mã.
+    """
+    if isinstance(values, pd.Categorical):
+        codes, uniques = values.codes, list(values.categories)
+    else:
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+        uniques = list(uniques)
+    result = list(categories) + [value for value in uniques if value not in categories]
+    if len(result) > np.iinfo(np.int8).max:
+        raise ValueError("Too many categories!")
+    # Ánh xạ mã của factorize/Categorical sang vị trí trong bộ giá trị kết quả
+    mapping = np.array([result.index(value) for value in uniques] + [-1], dtype=np.int8)
+    return mapping[codes], tuple(result)
+
+
+class StudentBatch:
+    """
+    Lớp lưu một lô sinh viên theo cột trong các mảng có kiểu cố định thay vì từng đối tượng StudentModel.
+
+    Attributes:
+        ids (np.ndarray): Mã sinh viên.
+        study_hours_per_week (np.ndarray): Số giờ học mỗi tuần (float64, NaN là thiếu).
+        attendance_rate (np.ndarray): Tỷ lệ tham gia học (float64, NaN là thiếu).
+        previous_grades (np.ndarray): Điểm số trước đó (float64, NaN là thiếu).
+        parcipate_on_act (np.ndarray): Mã int8 của việc tham gia hoạt động ngoại khóa.
+        parent_edu_level (np.ndarray): Mã int8 của trình độ học vấn của phụ huynh.
+        passed (np.ndarray): Mã int8 của tình trạng đậu hoặc rớt.
+        categories (dict[str, tuple]): Giá trị tương ứng với từng mã của các cột phân loại.
+    """
+
+    __slots__ = ('ids', 'study_hours_per_week', 'attendance_rate', 'previous_grades',
+                 'parcipate_on_act', 'parent_edu_level', 'passed', 'categories')
+
+    PASSED_CATEGORIES = Categories.PASSED
+
+    def __init__(self, ids: np.ndarray,
+                 study_hours_per_week: np.ndarray,
+                 attendance_rate: np.ndarray,
+                 previous_grades: np.ndarray,
+                 parcipate_on_act: np.ndarray,
+                 parent_edu_level: np.ndarray,
+                 passed: np.ndarray,
+                 categories: dict[str, tuple]):
+        """
+        Hàm khởi tạo lớp StudentBatch từ các cột đã được kiểm tra và mã hóa.
+        """
+        self.ids = ids
+        self.study_hours_per_week = study_hours_per_week
+        self.attendance_rate = attendance_rate
+        self.previous_grades = previous_grades
+        self.parcipate_on_act = parcipate_on_act
+        self.parent_edu_level = parent_edu_level
+        self.passed = passed
+        self.categories = categories
+
+    @classmethod
+    def from_columns_(cls, ids, study_hours, attendance_rate, previous_grades,
+                      act, edu, passed) -> 'StudentBatch':
+        # Các giá trị đã biết giữ mã cố định của Categories (trùng với thứ tự ENUM trong CSDL)
+        act_codes, act_categories = encode_column_(act, Categories.PARTICIPATE_ON_ACT)
+        edu_codes, edu_categories = encode_column_(edu, Categories.PARENT_EDU_LEVEL)
+        passed_codes, _ = encode_column_(passed, cls.PASSED_CATEGORIES)
+        return cls(
+            ids=ids,
+            study_hours_per_week=study_hours,
+            attendance_rate=attendance_rate,
+            previous_grades=previous_grades,
+            parcipate_on_act=act_codes,
+            parent_edu_level=edu_codes,
+            passed=passed_codes,
+            categories={
+                'parcipate_on_act': act_categories,
+                'parent_edu_level': edu_categories,
+                'passed': cls.PASSED_CATEGORIES
+            }
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'StudentBatch':
+        """
+        Tạo lô sinh viên từ một DataFrame, với cùng quy tắc kiểm tra như create_models_from_frame.
+
+        Args:
+            df (pd.DataFrame): Dữ liệu có các cột theo FieldName.
+
+        Returns:
+            StudentBatch: Lô sinh viên.
+
+        Raises:
+            ValueError: Nếu có mã sinh viên rỗng hoặc giá trị Passed không hợp lệ.
+        """
+        return cls.from_columns_(*validate_columns_(df))
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> 'StudentBatch':
+        """
+        Tạo lô sinh viên từ các bản ghi đọc từ cơ sở dữ liệu.
+
+        Args:
+            rows (list[tuple]): Các bản ghi theo thứ tự cột của bảng student_performance.
+
+        Returns:
+            StudentBatch: Lô sinh viên.
+        """
+        columns = list(zip(*rows)) if rows else [()] * 7
+        return cls.from_columns_(
+            np.array(columns[0], dtype=object),
+            np.array(columns[1], dtype=np.float64),
+            np.array(columns[2], dtype=np.float64),
+            np.array(columns[3], dtype=np.float64),
+            np.array(columns[4], dtype=object),
+            np.array(columns[5], dtype=object),
+            np.array(columns[6], dtype=object)
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int|slice) -> 'StudentModel|StudentBatch':
+        """
+        Lấy một dòng dưới dạng StudentModel hoặc một lô con (dùng chung mảng, không sao chép).
+
+        Args:
+            index (int|slice): Vị trí dòng hoặc khoảng dòng.
+
+        Returns:
+            StudentModel|StudentBatch: Mô hình sinh viên của dòng hoặc lô con.
+        """
+        if isinstance(index, slice):
+            return StudentBatch(
+                ids=self.ids[index],
+                study_hours_per_week=self.study_hours_per_week[index],
+                attendance_rate=self.attendance_rate[index],
+                previous_grades=self.previous_grades[index],
+                parcipate_on_act=self.parcipate_on_act[index],
+                parent_edu_level=self.parent_edu_level[index],
+                passed=self.passed[index],
+                categories=self.categories
+            )
+        return StudentModel.from_valid_(*self.row_(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def decode_(self, field: str, code: int) -> str|None:
+        return self.categories[field][code] if code >= 0 else None
+
+    def row_(self, index: int) -> tuple:
+        """
+        Lấy một dòng dưới dạng bộ giá trị theo thứ tự cột của bảng student_performance.
+
+        Args:
+            index (int): Vị trí dòng.
+
+        Returns:
+            tuple: Bộ giá trị của dòng, giá trị thiếu là None.
+        """
+        values = []
+        for column in (self.study_hours_per_week, self.attendance_rate, self.previous_grades):
+            value = column[index]
+            values.append(None if np.isnan(value) else float(value))
+        return (
+            self.ids[index],
+            *values,
+            self.decode_('parcipate_on_act', self.parcipate_on_act[index]),
+            self.decode_('parent_edu_level', self.parent_edu_level[index]),
+            self.decode_('passed', self.passed[index])
+        )
+
+    def iter_tuples(self, enum_codes: bool = False):
+        """
+        Duyệt các dòng dưới dạng bộ giá trị để ghi vào cơ sở dữ liệu, giải mã theo từng cột.
+
+        Args:
+            enum_codes (bool): Gửi chỉ số ENUM của MySQL (mã + 1) thay cho chuỗi với các giá trị đã biết
+                của Categories, mặc định là False.
+
+        Yields:
+            tuple: Bộ giá trị của từng dòng theo thứ tự cột của bảng student_performance.
+        """
+        columns = [self.ids]
+        for column in (self.study_hours_per_week, self.attendance_rate, self.previous_grades):
+            columns.append(to_optional_column_(column))
+        for field in ('parcipate_on_act', 'parent_edu_level', 'passed'):
+            values = list(self.categories[field])
+            if enum_codes:
+                # Chỉ số ENUM bắt đầu từ 1, các giá trị mới (ngoài Categories) vẫn được gửi dạng chuỗi
+                known = DICTIONARIES[field].known
+                values[:known] = range(1, known + 1)
+            lookup = np.array(values + [None], dtype=object)
+            # Mã -1 trỏ tới phần tử cuối là None
+            columns.append(lookup[getattr(self, field)])
+        return zip(*columns)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Chuyển lô sinh viên thành DataFrame với các cột phân loại là kiểu category.
+
+        Returns:
+            pd.DataFrame: Dữ liệu có các cột theo FieldName.
+        """
+        def categorical(field: str) -> pd.Categorical:
+            return pd.Categorical.from_codes(getattr(self, field), categories=list(self.categories[field]))
+
+        return pd.DataFrame({
+            FieldName.STUDENT_ID: self.ids,
+            FieldName.STUDY_HOURS: self.study_hours_per_week,
+            FieldName.ATTENDANCE_RATE: self.attendance_rate,
+            FieldName.PREVIOUS_GRADES: self.previous_grades,
+            FieldName.PARTICIPATE_ON_ACT: categorical('parcipate_on_act'),
+            FieldName.PARENT_EDU_LEVEL: categorical('parent_edu_level'),
+            FieldName.PASSED: categorical('passed')
+        })
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.__slots__[1:-1]) + self.ids.nbytes
\ No newline at end of file
@@ -0,0 +1,143 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+import time
+import logging
+from typing import Literal
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from field import FieldName
+from report import LoadReport
+from dao import DAOException
+
+
+def partition_frame(df: pd.DataFrame, shards: int) -> list[pd.DataFrame]:
+    """
+    Chia DataFrame thành các phần rời nhau theo hash của Student ID, cùng một mã sinh viên
+    luôn nằm trong cùng một phần.
+
+    Args:
+        df (pd.DataFrame): Dữ liệu đã được xử lý.
+        shards (int): Số phần cần chia.
+
+    Returns:
+        list[pd.DataFrame]: Các phần dữ liệu (có thể rỗng).
+    """
+    ids = df[FieldName.STUDENT_ID].to_numpy(dtype=object)
+    keys = pd.util.hash_array(ids) % np.uint64(shards)
+    return [df[keys == shard] for shard in range(shards)]
+
+
+def load_shard_(shard_df: pd.DataFrame,
+                mode: Literal['row', 'bulk'],
+                chunk_size: int,
+                db_config: dict,
+                commit_every: int|None = None,
+                checkpoint: tuple[str, str]|None = None) -> LoadReport:
+    """
+    Tải một phần dữ liệu trên một kết nối riêng (chạy trong thread hoặc process con).
+
+    Args:
+        shard_df (pd.DataFrame): Phần dữ liệu cần tải.
+        mode (Literal['row', 'bulk']): Cách ghi dữ liệu.
+        chunk_size (int): Số bản ghi mỗi lô.
+        db_config (dict): Cấu hình kết nối cho StudentPerformanceDAO.
+        commit_every (int|None): Số bản ghi mỗi lần commit (xem load), mặc định là None.
+        checkpoint (tuple[str, str]|None): Mốc tải (run_id, part) của phần dữ liệu (xem load), mặc định là None.
+
+    Returns:
+        LoadReport: Kết quả tải của phần dữ liệu.
+    """
+    # Import khi chạy để tránh import vòng giữa etl và parallel
+    from etl import load
+    from dao import StudentPerformanceDAO
+    with StudentPerformanceDAO(**db_config) as spDAO:
+        return load(shard_df, mode=mode, chunk_size=chunk_size, dao=spDAO, commit_every=commit_every,
+                    checkpoint=checkpoint)
+
+
+def parallel_load(modified_df: pd.DataFrame,
+                  db_config: dict,
+                  workers: int = 4,
+                  executor: Literal['thread', 'process'] = 'thread',
+                  mode: Literal['row', 'bulk'] = 'bulk',
+                  chunk_size: int = 1000,
+                  fail_fast: bool = False,
+                  commit_every: int|None = None,
+                  checkpoint: tuple[str, str]|None = None,
+                  held_connections: int = 0) -> LoadReport:
+    """
+    Tải dữ liệu song song: chia dữ liệu theo hash của Student ID thành các phần rời nhau,
+    mỗi phần được tải trên một kết nối riêng.
+
+    Nếu một phần thất bại (ví dụ không lấy được kết nối), các bản ghi của phần đó được ghi vào
+    failed_ids của kết quả và các phần khác vẫn tiếp tục, trừ khi fail_fast là True.
+    Các lô đã commit của phần thất bại không bị hoàn tác, tải lại phần đó là an toàn vì load là upsert.
+
+    Args:
+        modified_df (pd.DataFrame): Dữ liệu đã được xử lý.
+        db_config (dict): Cấu hình kết nối cho StudentPerformanceDAO.
+        workers (int): Số phần dữ liệu và số kết nối, mặc định là 4.
+        executor (Literal['thread', 'process']): Chạy các phần bằng thread hay process, mặc định là 'thread'.
+        mode (Literal['row', 'bulk']): Cách ghi dữ liệu, mặc định là 'bulk'.
+        chunk_size (int): Số bản ghi mỗi lô, mặc định là 1000.
+        fail_fast (bool): Hủy các phần chưa chạy và ném ngoại lệ ngay khi một phần thất bại, mặc định là False.
+        commit_every (int|None): Số bản ghi mỗi lần commit trên mỗi kết nối (xem load), mặc định là None.
+        checkpoint (tuple[str, str]|None): Mốc tải (run_id, part), mỗi phần dữ liệu có mốc riêng
+            '<part>-<số thứ tự phần>' (cách chia theo hash không đổi giữa các lần chạy), mặc định là None.
+        held_connections (int): Số kết nối của cùng pool (cùng db_config) mà nơi gọi đang giữ trong lúc
+            tải, pool không chờ khi hết kết nối nên cần chừa chỗ cho chúng (chỉ khi executor là 'thread',
+            mỗi process dùng pool riêng một kết nối), mặc định là 0.
+
+    Returns:
+        LoadReport: Kết quả tổng hợp của tất cả các phần.
+
+    Raises:
+        DAOException: Nếu fail_fast là True và có phần thất bại.
+    """
+    # Import khi chạy để tránh import vòng giữa etl và parallel
+    from etl import validate
+
+    start_time = time.perf_counter()
+    # Kiểm tra một lần trước khi chia để các phần không cùng ghi vào file cách ly
+    modified_df, rejected = validate(modified_df)
+    db_config = dict(db_config)
+    if executor == 'process':
+        # Mỗi process có pool riêng và pool mở sẵn đủ pool_size kết nối, nên chỉ cần một kết nối
+        db_config['pool_size'] = 1
+    else:
+        # Mỗi thread cần một kết nối riêng trong pool dùng chung, ngoài các kết nối nơi gọi đang giữ
+        db_config['pool_size'] = max(db_config.get('pool_size', 5), workers + held_connections)
+
+    shards = partition_frame(modified_df, workers)
+    pool_class = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+    report = LoadReport()
+    report.rejected = rejected
+    with pool_class(max_workers=workers) as pool:
+        futures = {
+            pool.submit(load_shard_, shard, mode, chunk_size, db_config, commit_every,
+                        (checkpoint[0], f'{checkpoint[1]}-{index}') if checkpoint is not None else None): index
+            for index, shard in enumerate(shards) if len(shard)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                report.merge(future.result())
+            except Exception as e:
+                logging.error(f'Failed at shard {index}: {e}')
+                print(f'Failed at shard {index}: {e}')
+                if fail_fast:
+                    for other in futures:
+                        other.cancel()
+                    raise DAOException(f'Failed at shard {index}: {e}')
+                report.failed_ids.extend(shards[index][FieldName.STUDENT_ID].tolist())
+
+    report.elapsed_time = time.perf_counter() - start_time
+    msg = f'Parallel load with {workers} {executor} workers.\n' + str(report)
+    print(msg)
+    logging.info(msg)
+    return report
@@ -0,0 +1,56 @@
+class LoadReport:
+    """
+    Lớp tổng hợp kết quả của một lần tải dữ liệu vào cơ sở dữ liệu.
+
+    Attributes:
+        update_records (list[int]): Số bản ghi cập nhật thành công và số bản ghi cần cập nhật.
+        insert_records (list[int]): Số bản ghi thêm mới thành công và số bản ghi cần thêm mới.
+        failed_ids (list[str]): Mã sinh viên của các bản ghi tải thất bại.
+        rejected (int): Số bản ghi không hợp lệ bị loại trước khi tải (được ghi vào file cách ly).
+        elapsed_time (float): Thời gian tải (giây).
+    """
+
+    def __init__(self):
+        """
+        Hàm khởi tạo của LoadReport.
+        """
+        self.update_records = [0, 0]
+        self.insert_records = [0, 0]
+        self.failed_ids = []
+        self.rejected = 0
+        self.elapsed_time = 0.0
+
+    def merge(self, other: 'LoadReport') -> 'LoadReport':
+        """
+        Cộng dồn kết quả của một lần tải khác vào kết quả này.
+
+        Args:
+            other (LoadReport): Kết quả cần cộng dồn.
+
+        Returns:
+            LoadReport: Chính đối tượng này.
+        """
+        for i in range(2):
+            self.update_records[i] += other.update_records[i]
+            self.insert_records[i] += other.insert_records[i]
+        self.failed_ids.extend(other.failed_ids)
+        self.rejected += other.rejected
+        self.elapsed_time += other.elapsed_time
+        return self
+
+    def __str__(self):
+        """
+        Trả về chuỗi mô tả kết quả tải, giống với log của load().
+
+        Returns:
+            str: Chuỗi mô tả kết quả tải.
+        """
+        msg = f'Load info: \n'
+        msg += f'\tUpdate Successfully: {self.update_records[1]}/{self.update_records[0]}\n'
+        msg += f'\tInsert Successfully: {self.insert_records[1]}/{self.insert_records[0]}\n'
+        if self.failed_ids:
+            msg += f'\tFailed: {len(self.failed_ids)}\n'
+        if self.rejected:
+            msg += f'\tRejected: {self.rejected}\n'
+        msg += f'Elapsed Time: {self.elapsed_time:.4f}s'
+        return msg
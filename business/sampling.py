@@ -0,0 +1,185 @@
+from collections import deque
+from typing import Iterator, Literal
+
+import numpy as np
+import pandas as pd
+
+
+class Sampler:
+    """
+    Lớp cơ sở cho các chiến lược lấy mẫu trên một luồng các DataFrame (chunk).
+
+    Mỗi chunk được đưa vào qua feed(), các dòng có thể tải ngay được trả về luôn,
+    phần còn lại được trả về khi gọi flush() sau chunk cuối cùng.
+    """
+
+    @property
+    def done(self) -> bool:
+        """
+        Cho biết không cần đọc thêm chunk nào nữa.
+        """
+        return False
+
+    def feed(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Đưa một chunk vào bộ lấy mẫu.
+
+        Args:
+            chunk (pd.DataFrame): Chunk dữ liệu đã được xử lý.
+
+        Returns:
+            pd.DataFrame: Các dòng có thể tải ngay (có thể rỗng).
+        """
+        return chunk
+
+    def flush(self) -> pd.DataFrame|None:
+        """
+        Lấy các dòng còn lại sau khi đã đưa vào chunk cuối cùng.
+
+        Returns:
+            pd.DataFrame|None: Các dòng còn lại, None nếu không còn.
+        """
+        return None
+
+
+class HeadSampler(Sampler):
+    """
+    Lấy n dòng đầu tiên của luồng, dừng đọc ngay khi đủ.
+
+    Attributes:
+        _remain (int): Số dòng còn cần lấy.
+    """
+
+    def __init__(self, n: int):
+        self._remain = n
+
+    @property
+    def done(self) -> bool:
+        return self._remain <= 0
+
+    def feed(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        chunk = chunk.head(self._remain)
+        self._remain -= len(chunk)
+        return chunk
+
+
+class TailSampler(Sampler):
+    """
+    Lấy n dòng cuối cùng của luồng bằng một bộ đệm vòng, chỉ giữ tối đa n dòng cộng một chunk.
+
+    Attributes:
+        _n (int): Số dòng cần lấy.
+        _buffer (deque): Các chunk gần nhất.
+        _size (int): Tổng số dòng trong bộ đệm.
+    """
+
+    def __init__(self, n: int):
+        self._n = n
+        self._buffer = deque()
+        self._size = 0
+
+    def feed(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        self._buffer.append(chunk)
+        self._size += len(chunk)
+        # Bỏ các chunk cũ không còn nằm trong n dòng cuối
+        while self._buffer and self._size - len(self._buffer[0]) >= self._n:
+            self._size -= len(self._buffer.popleft())
+        return chunk.iloc[0:0]
+
+    def flush(self) -> pd.DataFrame|None:
+        if not self._buffer:
+            return None
+        return pd.concat(list(self._buffer), ignore_index=True).tail(self._n)
+
+
+class ReservoirSampler(Sampler):
+    """
+    Lấy ngẫu nhiên n dòng của luồng bằng reservoir sampling (thuật toán R), chỉ giữ tối đa n dòng.
+
+    Attributes:
+        _n (int): Số dòng cần lấy.
+        _rng (np.random.Generator): Bộ sinh số ngẫu nhiên.
+        _reservoir (pd.DataFrame|None): Các dòng đang được giữ.
+        _seen (int): Số dòng đã đi qua.
+    """
+
+    def __init__(self, n: int, random_state: int|None = 42):
+        self._n = n
+        self._rng = np.random.default_rng(random_state)
+        self._reservoir = None
+        self._seen = 0
+
+    def feed(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        chunk = chunk.reset_index(drop=True)
+        # Lấp đầy reservoir trước
+        if self._reservoir is None or len(self._reservoir) < self._n:
+            need = self._n - (0 if self._reservoir is None else len(self._reservoir))
+            head = chunk.iloc[:need]
+            self._reservoir = head if self._reservoir is None else pd.concat([self._reservoir, head], ignore_index=True)
+            self._seen += len(head)
+            chunk = chunk.iloc[need:].reset_index(drop=True)
+        if len(chunk) == 0:
+            return chunk
+
+        # Dòng thứ i (tính từ 0 trên toàn luồng) thay vào vị trí j ~ U[0, i] nếu j < n
+        positions = np.arange(self._seen, self._seen + len(chunk))
+        slots = self._rng.integers(0, positions + 1)
+        self._seen += len(chunk)
+        rows = np.flatnonzero(slots < self._n)
+        if len(rows):
+            # Nếu nhiều dòng cùng thay một vị trí thì dòng sau cùng được giữ, giống như làm tuần tự
+            selected = pd.Series(rows, index=slots[rows])
+            selected = selected[~selected.index.duplicated(keep='last')]
+            take = np.arange(self._n)
+            take[selected.index.to_numpy()] = self._n + np.arange(len(selected))
+            merged = pd.concat([self._reservoir, chunk.iloc[selected.to_numpy()]], ignore_index=True)
+            self._reservoir = merged.iloc[take].reset_index(drop=True)
+        return chunk.iloc[0:0]
+
+    def flush(self) -> pd.DataFrame|None:
+        return self._reservoir
+
+
+def create_sampler(load_for: int|None,
+                   strategy: Literal['head', 'tail', 'random']|None) -> Sampler:
+    """
+    Tạo bộ lấy mẫu dạng luồng tương ứng với chính sách lấy bản ghi của etl_process.
+
+    Args:
+        load_for (int|None): Số lượng bản ghi cần lấy, None là lấy tất cả.
+        strategy (Literal['head', 'tail', 'random']|None): Chính sách lấy bản ghi.
+
+    Returns:
+        Sampler: Bộ lấy mẫu.
+    """
+    if not isinstance(load_for, int):
+        return Sampler()
+    if strategy == 'head':
+        return HeadSampler(load_for)
+    elif strategy == 'tail':
+        return TailSampler(load_for)
+    elif strategy == 'random':
+        return ReservoirSampler(load_for)
+    return Sampler()
+
+
+def sample_stream(chunks: Iterator[pd.DataFrame], sampler: Sampler) -> Iterator[pd.DataFrame]:
+    """
+    Áp dụng bộ lấy mẫu lên một luồng chunk.
+
+    Args:
+        chunks (Iterator[pd.DataFrame]): Luồng các chunk dữ liệu.
+        sampler (Sampler): Bộ lấy mẫu.
+
+    Yields:
+        pd.DataFrame: Các chunk cần tải vào cơ sở dữ liệu.
+    """
+    for chunk in chunks:
+        result = sampler.feed(chunk)
+        if len(result):
+            yield result
+        if sampler.done:
+            break
+    rest = sampler.flush()
+    if rest is not None and len(rest):
+        yield rest
@@ -0,0 +1,458 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import csv
+import shutil
+import sqlite3
+import logging
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Literal
+
+import pandas as pd
+
+from field import FieldName
+from model import StudentBatch
+from report import LoadReport
+from dao import DAOException, TABLE, for_table_, apply_summary_
+from staging import StagingCache
+from summary import Summary
+from sql.sql_reader import get_sql_file_reader
+
+
+class Sink(ABC):
+    """
+    Lớp cơ sở cho đích của bước Load, thay cho ghi từng dòng hoặc từng lô qua StudentPerformanceDAO.
+
+    Các phương thức delete_all, delete_many và close có cùng tên với StudentPerformanceDAO
+    nên reset() và etl_process() dùng được cả hai. Kết nối được mở khi cần và đóng bằng close(),
+    sau đó vẫn dùng lại được.
+
+    Attributes:
+        supports_delete (bool): Đích có xóa được từng bản ghi bằng delete_many hay không,
+            etl_process() từ chối delete_missing với đích không hỗ trợ.
+    """
+
+    supports_delete = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @abstractmethod
+    def write(self, modified_df: pd.DataFrame) -> LoadReport:
+        """
+        Ghi dữ liệu đã được xử lý vào đích, bản ghi có Student ID đã tồn tại được cập nhật.
+
+        Args:
+            modified_df (pd.DataFrame): Dữ liệu đã được xử lý.
+
+        Returns:
+            LoadReport: Kết quả tải, gồm cả mã sinh viên của các bản ghi thất bại.
+        """
+
+    @abstractmethod
+    def delete_all(self) -> None:
+        """
+        Xóa tất cả các bản ghi trong đích.
+        """
+
+    @abstractmethod
+    def delete_many(self, ids: list[str], chunk_size: int = 1000) -> int:
+        """
+        Xóa các bản ghi theo danh sách mã sinh viên.
+
+        Args:
+            ids (list[str]): Danh sách mã sinh viên cần xóa.
+            chunk_size (int): Số mã sinh viên trong mỗi lô, mặc định là 1000.
+
+        Returns:
+            int: Số bản ghi đã bị xóa.
+
+        Raises:
+            DAOException: Nếu đích không hỗ trợ xóa từng bản ghi.
+        """
+
+    def close(self) -> None:
+        pass
+
+
+def to_batches_(modified_df: pd.DataFrame, batch_size: int):
+    """
+    Kiểm tra dữ liệu theo cột và chia thành các lô, trong mỗi lô chỉ giữ dòng cuối của mỗi Student ID
+    (giống kết quả của upsert từng dòng).
+
+    Args:
+        modified_df (pd.DataFrame): Dữ liệu đã được xử lý.
+        batch_size (int): Số bản ghi mỗi lô.
+
+    Yields:
+        tuple[pd.DataFrame, int]: Dữ liệu của lô theo FieldName và số dòng bị trùng mã trong lô.
+    """
+    batch = StudentBatch.from_frame(modified_df)
+    for start in range(0, len(batch), batch_size):
+        frame = batch[start:start + batch_size].to_frame()
+        unique = frame.drop_duplicates(subset=[FieldName.STUDENT_ID], keep='last')
+        yield unique, len(frame) - len(unique)
+
+
+def write_tsv_(frame: pd.DataFrame, file) -> None:
+    """
+    Ghi một lô ra file TSV theo định dạng mặc định của LOAD DATA (thoát bằng dấu gạch chéo ngược,
+    không có ENCLOSED BY): dấu gạch chéo ngược, tab và xuống dòng trong giá trị chuỗi được thoát
+    để không làm lệch cột, dấu nháy được ghi nguyên, giá trị thiếu được ghi là \\N.
+
+    Args:
+        frame (pd.DataFrame): Dữ liệu của lô.
+        file: File văn bản đang mở để ghi.
+    """
+    escaped = {}
+    for name, column in frame.items():
+        if column.dtype.kind in 'biuf' or not column.str.contains(r'[\\\t\n\r]', na=False).any():
+            continue
+        for char, escape in (('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\r', '\\r')):
+            column = column.str.replace(char, escape, regex=False)
+        escaped[name] = column
+    if escaped:
+        frame = frame.assign(**escaped)
+    frame.to_csv(file, sep='\t', header=False, index=False, na_rep='\\N', lineterminator='\n',
+                 quoting=csv.QUOTE_NONE)
+
+
+class MySQLBulkSink(Sink):
+    """
+    Đích MySQL ghi theo file: mỗi lô được ghi ra một file TSV tạm, nạp vào bảng tạm
+    student_performance_staging bằng LOAD DATA LOCAL INFILE rồi gộp vào student_performance
+    bằng một câu lệnh INSERT ... SELECT ... ON DUPLICATE KEY UPDATE.
+
+    Server MySQL cần bật local_infile.
+
+    Attributes:
+        batch_size (int): Số bản ghi mỗi file TSV (mỗi lô commit một lần).
+        table (str): Bảng đích của các lô (ví dụ SHADOW_TABLE khi tải lại toàn bộ dữ liệu).
+        _config (dict): Cấu hình kết nối.
+        _summaries (bool): Cập nhật các bảng tổng hợp cùng mỗi lần ghi hoặc xóa (giống StudentPerformanceDAO).
+        _connection: Kết nối riêng (có bật allow_local_infile), None khi chưa mở.
+        _sqlFileReader (SQLFileReader): Đối tượng đọc file SQL.
+    """
+
+    def __init__(self, host: str, db: str, user: str, password: str,
+                 batch_size: int = 100000,
+                 tmp_dir: str|None = None,
+                 table: str = TABLE,
+                 summaries: bool = False, **kwargs):
+        """
+        Hàm khởi tạo của MySQLBulkSink.
+
+        Args:
+            host (str): Địa chỉ host của cơ sở dữ liệu.
+            db (str): Tên cơ sở dữ liệu.
+            user (str): Tên người dùng của cơ sở dữ liệu.
+            password (str): Mật khẩu của cơ sở dữ liệu.
+            batch_size (int): Số bản ghi mỗi file TSV, mặc định là 100000.
+            tmp_dir (str|None): Thư mục chứa file TSV tạm, mặc định là None (thư mục tạm của hệ thống).
+            table (str): Bảng đích, mặc định là TABLE (student_performance).
+            summaries (bool): Cập nhật bảng student_performance_summary/student_performance_histogram theo
+                phần thay đổi của mỗi lô, trong cùng giao dịch với dữ liệu (chỉ với bảng chính), mặc định là False.
+            **kwargs: Các tham số khác của db_config (ví dụ pool_size) được bỏ qua.
+        """
+        self.batch_size = batch_size
+        self._tmp_dir = tmp_dir
+        self.table = table
+        self._summaries = summaries and table == TABLE
+        self._config = {'host': host, 'database': db, 'user': user, 'password': password}
+        self._connection = None
+        self._sqlFileReader = get_sql_file_reader(os.path.join(os.path.dirname(__file__), '..', 'sql', 'queries.sql'))
+
+    def query_(self, query_type: str) -> str:
+        return for_table_(self._sqlFileReader.get_query_of(query_type), self.table)
+
+    def connection_(self):
+        if self._connection is None:
+            import mysql.connector
+            try:
+                self._connection = mysql.connector.connect(allow_local_infile=True, **self._config)
+                cursor = self._connection.cursor()
+                cursor.execute(self.query_('CREATE STAGING TABLE'))
+                cursor.close()
+            except mysql.connector.Error as ex:
+                self._connection = None
+                raise DAOException(ex.msg)
+            if self._summaries:
+                self.prepare_summaries_()
+        return self._connection
+
+    def prepare_summaries_(self):
+        """
+        Tạo và tính các bảng tổng hợp từ dữ liệu hiện có nếu cần (mỗi CSDL một lần trong tiến trình),
+        bằng StudentPerformanceDAO trên cùng CSDL.
+        """
+        from dao import StudentPerformanceDAO
+        config = self._config
+        with StudentPerformanceDAO(config['host'], config['database'], config['user'], config['password'],
+                                   pool_size=1, summaries=True):
+            pass
+
+    def write(self, modified_df: pd.DataFrame) -> LoadReport:
+        from mysql.connector import Error
+        report = LoadReport()
+        connection = self.connection_()
+        for frame, duplicated in to_batches_(modified_df, self.batch_size):
+            fd, path = tempfile.mkstemp(suffix='.tsv', dir=self._tmp_dir)
+            try:
+                with os.fdopen(fd, 'w', newline='') as file:
+                    write_tsv_(frame, file)
+                cursor = connection.cursor()
+                cursor.execute(self.query_('CLEAR STAGING TABLE'))
+                cursor.execute(self.query_('LOAD STAGING FILE'), (path,))
+                if self._summaries:
+                    # Phần thay đổi của các bảng tổng hợp: cộng lô mới, trừ các bản ghi cũ bị ghi đè
+                    cursor.execute(self.query_('GET EXISTING STAGING RECORDS'))
+                    old_rows = cursor.fetchall()
+                    existing = len(old_rows)
+                else:
+                    cursor.execute(self.query_('COUNT EXISTING STAGING RECORDS'))
+                    existing = cursor.fetchone()[0]
+                cursor.execute(self.query_('MERGE STAGING TABLE'))
+                if self._summaries:
+                    summary = Summary()
+                    summary.add_batch(StudentBatch.from_frame(frame))
+                    summary.add_batch(StudentBatch.from_rows(old_rows), -1)
+                    apply_summary_(cursor, self._sqlFileReader, summary)
+                cursor.close()
+                connection.commit()
+            except Error as ex:
+                try:
+                    connection.rollback()
+                except Error:
+                    pass
+                report.failed_ids.extend(frame[FieldName.STUDENT_ID].tolist())
+                logging.error(f'Failed at bulk file {frame[FieldName.STUDENT_ID].iloc[0]}-'
+                              f'{frame[FieldName.STUDENT_ID].iloc[-1]}: {ex.msg}')
+                continue
+            finally:
+                os.remove(path)
+            updated = existing + duplicated
+            inserted = len(frame) - existing
+            report.update_records[0] += updated
+            report.update_records[1] += updated
+            report.insert_records[0] += inserted
+            report.insert_records[1] += inserted
+        return report
+
+    def delete_all(self) -> None:
+        from mysql.connector import Error
+        connection = self.connection_()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self.query_('DELETE ALL'))
+            if self._summaries:
+                cursor.execute(self._sqlFileReader.get_query_of('CLEAR SUMMARY'))
+                cursor.execute(self._sqlFileReader.get_query_of('CLEAR HISTOGRAM'))
+            cursor.close()
+            connection.commit()
+        except Error as ex:
+            raise DAOException(ex.msg)
+
+    def delete_many(self, ids: list[str], chunk_size: int = 1000) -> int:
+        from mysql.connector import Error
+        connection = self.connection_()
+        deleted = 0
+        for start in range(0, len(ids), chunk_size):
+            chunk = list(ids[start:start + chunk_size])
+            placeholders = ', '.join(['%s'] * len(chunk))
+            try:
+                cursor = connection.cursor()
+                if self._summaries:
+                    cursor.execute(self.query_('GET RECORDS BY IDS').format(ids=placeholders), tuple(chunk))
+                    old_rows = cursor.fetchall()
+                cursor.execute(self.query_('DELETE RECORDS BY IDS').format(ids=placeholders), tuple(chunk))
+                deleted += cursor.rowcount
+                if self._summaries:
+                    summary = Summary()
+                    summary.add_batch(StudentBatch.from_rows(old_rows), -1)
+                    apply_summary_(cursor, self._sqlFileReader, summary)
+                cursor.close()
+                connection.commit()
+            except Error as ex:
+                try:
+                    connection.rollback()
+                except Error:
+                    pass
+                raise DAOException(ex.msg)
+        return deleted
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class SQLiteSink(Sink):
+    """
+    Đích là một file SQLite có bảng student_performance cùng cấu trúc với bảng trong MySQL,
+    dùng được khi không có MySQL.
+
+    Attributes:
+        path (str): Đường dẫn file SQLite.
+        batch_size (int): Số bản ghi mỗi lô (mỗi lô commit một lần).
+        _connection (sqlite3.Connection|None): Kết nối tới file SQLite, None khi chưa mở.
+    """
+
+    LOOKUP_CHUNK = 500
+
+    def __init__(self, path: str, batch_size: int = 10000):
+        """
+        Hàm khởi tạo của SQLiteSink.
+
+        Args:
+            path (str): Đường dẫn file SQLite, được tạo mới nếu chưa có.
+            batch_size (int): Số bản ghi mỗi lô, mặc định là 10000.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._connection = None
+
+    def connection_(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS student_performance('
+                'student_id TEXT PRIMARY KEY, study_hours_per_week REAL, attendance_rate REAL, '
+                'previous_grades REAL, participate_in_act TEXT, parent_edu_level TEXT, passed TEXT)'
+            )
+            self._connection.commit()
+        return self._connection
+
+    def count_existing_(self, ids: list[str]) -> int:
+        existing = 0
+        for start in range(0, len(ids), self.LOOKUP_CHUNK):
+            chunk = ids[start:start + self.LOOKUP_CHUNK]
+            query = 'SELECT COUNT(*) FROM student_performance WHERE student_id IN ({})'.format(
+                ', '.join(['?'] * len(chunk)))
+            existing += self._connection.execute(query, chunk).fetchone()[0]
+        return existing
+
+    def write(self, modified_df: pd.DataFrame) -> LoadReport:
+        report = LoadReport()
+        connection = self.connection_()
+        for frame, duplicated in to_batches_(modified_df, self.batch_size):
+            ids = frame[FieldName.STUDENT_ID].tolist()
+            try:
+                existing = self.count_existing_(ids)
+                connection.executemany(
+                    'INSERT INTO student_performance VALUES(?, ?, ?, ?, ?, ?, ?) '
+                    'ON CONFLICT(student_id) DO UPDATE SET '
+                    'study_hours_per_week = excluded.study_hours_per_week, '
+                    'attendance_rate = excluded.attendance_rate, previous_grades = excluded.previous_grades, '
+                    'participate_in_act = excluded.participate_in_act, '
+                    'parent_edu_level = excluded.parent_edu_level, passed = excluded.passed',
+                    StudentBatch.from_frame(frame).iter_tuples()
+                )
+                connection.commit()
+            except sqlite3.Error as ex:
+                connection.rollback()
+                report.failed_ids.extend(ids)
+                logging.error(f'Failed at chunk {ids[0]}-{ids[-1]}: {ex}')
+                continue
+            updated = existing + duplicated
+            inserted = len(frame) - existing
+            report.update_records[0] += updated
+            report.update_records[1] += updated
+            report.insert_records[0] += inserted
+            report.insert_records[1] += inserted
+        return report
+
+    def delete_all(self) -> None:
+        connection = self.connection_()
+        connection.execute('DELETE FROM student_performance')
+        connection.commit()
+
+    def delete_many(self, ids: list[str], chunk_size: int = 1000) -> int:
+        connection = self.connection_()
+        deleted = 0
+        for start in range(0, len(ids), chunk_size):
+            chunk = list(ids[start:start + chunk_size])
+            query = 'DELETE FROM student_performance WHERE student_id IN ({})'.format(
+                ', '.join(['?'] * len(chunk)))
+            deleted += connection.execute(query, chunk).rowcount
+            connection.commit()
+        return deleted
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class ColumnarFileSink(Sink):
+    """
+    Đích là các file theo cột trong một thư mục, mỗi lần write() tạo một phần mới
+    (part-00000, part-00001, ...), không gộp theo Student ID nên mọi bản ghi được tính là thêm mới.
+
+    Định dạng 'npy' dùng cấu trúc của StagingCache (đọc lại bằng memory-map, không cần thư viện thêm),
+    định dạng 'parquet' cần pyarrow.
+
+    Attributes:
+        root (str): Thư mục chứa các phần dữ liệu.
+        format (Literal['npy', 'parquet']): Định dạng file.
+    """
+
+    # Các phần dữ liệu chỉ được ghi thêm, không xóa được từng bản ghi
+    supports_delete = False
+
+    def __init__(self, root: str, format: Literal['npy', 'parquet'] = 'npy'):
+        """
+        Hàm khởi tạo của ColumnarFileSink.
+
+        Args:
+            root (str): Thư mục chứa các phần dữ liệu.
+            format (Literal['npy', 'parquet']): Định dạng file, mặc định là 'npy'.
+        """
+        self.root = root
+        self.format = format
+
+    def parts_(self) -> list[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted({name.split('.')[0] for name in os.listdir(self.root) if name.startswith('part-')})
+
+    def write(self, modified_df: pd.DataFrame) -> LoadReport:
+        frame = StudentBatch.from_frame(modified_df).to_frame()
+        parts = self.parts_()
+        part = f'part-{int(parts[-1][5:]) + 1 if parts else 0:05d}'
+        if self.format == 'parquet':
+            os.makedirs(self.root, exist_ok=True)
+            frame.to_parquet(os.path.join(self.root, part + '.parquet'), index=False)
+        else:
+            StagingCache(os.path.dirname(os.path.abspath(self.root))).save(
+                frame, os.path.basename(os.path.abspath(self.root)), part)
+        report = LoadReport()
+        report.insert_records[0] += len(frame)
+        report.insert_records[1] += len(frame)
+        return report
+
+    def read(self) -> pd.DataFrame:
+        """
+        Đọc lại tất cả các phần dữ liệu đã ghi.
+
+        Returns:
+            pd.DataFrame: Dữ liệu của tất cả các phần theo thứ tự ghi.
+        """
+        frames = []
+        for part in self.parts_():
+            if self.format == 'parquet':
+                frames.append(pd.read_parquet(os.path.join(self.root, part + '.parquet')))
+            else:
+                frames.append(StagingCache(os.path.dirname(os.path.abspath(self.root))).load(
+                    os.path.basename(os.path.abspath(self.root)), part))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def delete_all(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def delete_many(self, ids: list[str], chunk_size: int = 1000) -> int:
+        raise DAOException('ColumnarFileSink is append-only, cannot delete records by Student ID!')
@@ -0,0 +1,144 @@
+import os
+import json
+import shutil
+import logging
+
+import numpy as np
+import pandas as pd
+
+
+class StagingCache:
+    """
+    Lớp lưu DataFrame theo từng cột dưới dạng file .npy, khóa theo checksum của file nguồn,
+    để các lần chạy sau đọc lại bằng memory-map thay vì phân tích lại file CSV.
+
+    Cấu trúc thư mục: <root>/<checksum>/<stage>/meta.json và các file <i>.npy của từng cột.
+    Cột số được lưu nguyên mảng, cột phân loại và cột chuỗi được lưu dưới dạng mã số nguyên
+    cùng với mảng các giá trị.
+
+    Attributes:
+        root (str): Thư mục gốc của cache.
+    """
+
+    def __init__(self, root: str):
+        """
+        Hàm khởi tạo của StagingCache.
+
+        Args:
+            root (str): Thư mục gốc của cache.
+        """
+        self.root = root
+
+    def path_(self, checksum: str, stage: str) -> str:
+        return os.path.join(self.root, checksum, stage)
+
+    def has(self, checksum: str, stage: str = 'raw') -> bool:
+        return os.path.isfile(os.path.join(self.path_(checksum, stage), 'meta.json'))
+
+    def save(self, df: pd.DataFrame, checksum: str, stage: str = 'raw') -> None:
+        """
+        Lưu một DataFrame vào cache. Dữ liệu được ghi vào thư mục tạm rồi mới đổi tên,
+        nên một lần ghi dở dang không bao giờ được đọc lại.
+
+        Args:
+            df (pd.DataFrame): Dữ liệu cần lưu.
+            checksum (str): Checksum của file nguồn.
+            stage (str): Tên giai đoạn ('raw' hoặc 'transformed-<phiên bản>'), mặc định là 'raw'.
+        """
+        target = self.path_(checksum, stage)
+        tmp = target + '.tmp'
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+
+        columns = []
+        for i, name in enumerate(df.columns):
+            column = df[name]
+            meta = {'name': name, 'dtype': str(column.dtype)}
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                meta['kind'] = 'category'
+                codes = column.cat.codes.to_numpy()
+                categories = column.cat.categories.to_numpy(dtype=str)
+            elif pd.api.types.is_numeric_dtype(column.dtype) or pd.api.types.is_bool_dtype(column.dtype):
+                meta['kind'] = 'array'
+                np.save(os.path.join(tmp, f'{i}.npy'), column.to_numpy())
+                columns.append(meta)
+                continue
+            else:
+                # Cột chuỗi được mã hóa như cột phân loại, giá trị thiếu có mã -1
+                meta['kind'] = 'string'
+                codes, categories = pd.factorize(column)
+                categories = np.asarray(categories, dtype=str)
+            np.save(os.path.join(tmp, f'{i}.npy'), codes)
+            np.save(os.path.join(tmp, f'{i}.categories.npy'), categories)
+            columns.append(meta)
+
+        with open(os.path.join(tmp, 'meta.json'), 'w') as file:
+            json.dump({'rows': len(df), 'columns': columns}, file)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(tmp, target)
+
+    def load(self, checksum: str, stage: str = 'raw') -> pd.DataFrame|None:
+        """
+        Đọc một DataFrame từ cache, các cột số được memory-map (copy-on-write) thay vì đọc vào bộ nhớ.
+
+        Args:
+            checksum (str): Checksum của file nguồn.
+            stage (str): Tên giai đoạn ('raw' hoặc 'transformed-<phiên bản>'), mặc định là 'raw'.
+
+        Returns:
+            pd.DataFrame|None: Dữ liệu đã lưu, None nếu chưa có trong cache hoặc cache bị hỏng.
+        """
+        path = self.path_(checksum, stage)
+        if not self.has(checksum, stage):
+            return None
+        try:
+            with open(os.path.join(path, 'meta.json'), 'r') as file:
+                meta = json.load(file)
+            data = {}
+            for i, column in enumerate(meta['columns']):
+                values = np.load(os.path.join(path, f'{i}.npy'), mmap_mode='c')
+                if column['kind'] == 'array':
+                    data[column['name']] = values
+                    continue
+                categories = np.load(os.path.join(path, f'{i}.categories.npy'))
+                if column['kind'] == 'category':
+                    data[column['name']] = pd.Categorical.from_codes(values, categories=categories.astype(object))
+                else:
+                    # Mã -1 trỏ tới phần tử cuối là NaN
+                    lookup = np.append(categories.astype(object), np.nan)
+                    data[column['name']] = pd.Series(lookup[values], dtype=column['dtype'])
+            df = pd.DataFrame(data, copy=False)
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f'Staging cache at {path} is broken: {e}')
+            return None
+        df.attrs['source_checksum'] = checksum
+        return df
+
+    def prune(self, keep: str) -> None:
+        """
+        Xóa cache của các checksum cũ, chỉ giữ lại checksum hiện tại.
+
+        Args:
+            keep (str): Checksum cần giữ lại.
+        """
+        if not os.path.isdir(self.root):
+            return
+        for name in os.listdir(self.root):
+            if name != keep:
+                shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+
+    def prune_stages(self, checksum: str, prefix: str, keep: str) -> None:
+        """
+        Xóa các giai đoạn cũ của một checksum có tên bắt đầu bằng prefix, chỉ giữ lại giai đoạn hiện tại.
+
+        Args:
+            checksum (str): Checksum của file nguồn.
+            prefix (str): Tiền tố tên giai đoạn (ví dụ 'transformed').
+            keep (str): Tên giai đoạn cần giữ lại.
+        """
+        path = os.path.join(self.root, checksum)
+        if not os.path.isdir(path):
+            return
+        for name in os.listdir(path):
+            if name.startswith(prefix) and name != keep:
+                shutil.rmtree(os.path.join(path, name), ignore_errors=True)
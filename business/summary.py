@@ -0,0 +1,236 @@
+import math
+
+import numpy as np
+
+from model import StudentBatch
+
+
+# Các cột phân loại dùng làm khóa nhóm và các cột số được tổng hợp, theo tên cột của bảng student_performance
+CATEGORY_COLUMNS = ('participate_in_act', 'parent_edu_level', 'passed')
+NUMERIC_COLUMNS = ('study_hours_per_week', 'attendance_rate', 'previous_grades')
+# Độ rộng khoảng của biểu đồ phân bố theo từng cột số
+HISTOGRAM_WIDTHS = {'study_hours_per_week': 5, 'attendance_rate': 10}
+# Giá trị phân loại bị thiếu được gộp vào nhóm 'Unknown' (giống transform)
+UNKNOWN = 'Unknown'
+
+# Tên thuộc tính của StudentBatch theo cột phân loại
+BATCH_FIELDS = dict(zip(CATEGORY_COLUMNS, ('parcipate_on_act', 'parent_edu_level', 'passed')))
+
+
+class Summary:
+    """
+    Các số liệu tổng hợp theo nhóm (participate_in_act, parent_edu_level, passed): số sinh viên, và với
+    từng cột số là số giá trị, tổng, tổng bình phương, cùng số sinh viên theo từng khoảng của HISTOGRAM_WIDTHS.
+
+    Dùng cho cả phần thay đổi của một lần ghi (cộng các dòng mới, trừ các dòng cũ) và nội dung của các bảng
+    tổng hợp đọc từ cơ sở dữ liệu, nên các truy vấn thống kê chỉ duyệt qua số nhóm thay vì toàn bộ bảng.
+
+    Attributes:
+        groups (dict[tuple, list[float]]): Theo khóa nhóm: [số sinh viên, rồi (số giá trị, tổng,
+            tổng bình phương) của từng cột trong NUMERIC_COLUMNS].
+        buckets (dict[tuple, int]): Số sinh viên theo (khóa nhóm, cột, chỉ số khoảng).
+    """
+
+    __slots__ = ('groups', 'buckets')
+
+    def __init__(self):
+        self.groups = {}
+        self.buckets = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.groups)
+
+    def group_(self, key: tuple) -> list[float]:
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = [0] * (1 + 3 * len(NUMERIC_COLUMNS))
+        return group
+
+    def add_row(self, row: tuple, sign: int = 1) -> None:
+        """
+        Cộng (hoặc trừ) một bản ghi.
+
+        Args:
+            row (tuple): Bản ghi theo thứ tự cột của bảng student_performance (giá trị chuỗi).
+            sign (int): 1 để cộng bản ghi mới, -1 để trừ bản ghi cũ, mặc định là 1.
+        """
+        key = tuple(UNKNOWN if value is None else value for value in row[4:7])
+        group = self.group_(key)
+        group[0] += sign
+        for i, column in enumerate(NUMERIC_COLUMNS):
+            value = row[1 + i]
+            if value is None or value != value:
+                continue
+            group[1 + 3 * i] += sign
+            group[2 + 3 * i] += sign * value
+            group[3 + 3 * i] += sign * value * value
+            width = HISTOGRAM_WIDTHS.get(column)
+            if width is not None:
+                bucket = (key, column, math.floor(value / width))
+                self.buckets[bucket] = self.buckets.get(bucket, 0) + sign
+
+    def add_batch(self, batch: StudentBatch, sign: int = 1) -> None:
+        """
+        Cộng (hoặc trừ) một lô sinh viên, gom nhóm theo mã phân loại bằng các phép toán trên toàn mảng.
+
+        Args:
+            batch (StudentBatch): Lô sinh viên (không có mã sinh viên trùng nhau).
+            sign (int): 1 để cộng các bản ghi mới, -1 để trừ các bản ghi cũ, mặc định là 1.
+        """
+        if not len(batch):
+            return
+        # Gộp ba mã phân loại (-1 là thiếu) thành một mã nhóm
+        combined = np.zeros(len(batch), dtype=np.int64)
+        sizes = []
+        for column in CATEGORY_COLUMNS:
+            field = BATCH_FIELDS[column]
+            size = len(batch.categories[field]) + 1
+            combined = combined * size + getattr(batch, field).astype(np.int64) + 1
+            sizes.append(size)
+        codes, inverse = np.unique(combined, return_inverse=True)
+
+        keys = []
+        for code in codes.tolist():
+            values = []
+            for column, size in zip(reversed(CATEGORY_COLUMNS), reversed(sizes)):
+                code, value = divmod(code, size)
+                values.append(batch.decode_(BATCH_FIELDS[column], value - 1))
+            keys.append(tuple(UNKNOWN if value is None else value for value in reversed(values)))
+
+        columns = {}
+        totals = [np.bincount(inverse, minlength=len(codes))]
+        for column in NUMERIC_COLUMNS:
+            values = getattr(batch, column)
+            valid = ~np.isnan(values)
+            filled = np.where(valid, values, 0.0)
+            totals.append(np.bincount(inverse, weights=valid, minlength=len(codes)))
+            totals.append(np.bincount(inverse, weights=filled, minlength=len(codes)))
+            totals.append(np.bincount(inverse, weights=filled * filled, minlength=len(codes)))
+            columns[column] = (values, valid)
+        for key, row in zip(keys, np.column_stack(totals).tolist()):
+            group = self.group_(key)
+            for i, value in enumerate(row):
+                # Số sinh viên và số giá trị được giữ là số nguyên
+                group[i] += sign * (int(value) if i % 3 == 1 or i == 0 else value)
+
+        for column, width in HISTOGRAM_WIDTHS.items():
+            values, valid = columns[column]
+            if not valid.any():
+                continue
+            buckets = np.floor(values[valid] / width).astype(np.int64)
+            # Gộp (nhóm, khoảng) thành một mã để đếm bằng một lần np.unique trên mảng một chiều
+            low = buckets.min()
+            span = int(buckets.max() - low) + 1
+            pairs, counts = np.unique(inverse[valid] * span + (buckets - low), return_counts=True)
+            for pair, count in zip(pairs.tolist(), counts.tolist()):
+                index, bucket = divmod(pair, span)
+                key = (keys[index], column, bucket + int(low))
+                self.buckets[key] = self.buckets.get(key, 0) + sign * count
+
+    def summary_params_(self) -> list[tuple]:
+        return [key + tuple(group) for key, group in self.groups.items()]
+
+    def histogram_params_(self) -> list[tuple]:
+        return [key + (column, bucket, count) for (key, column, bucket), count in self.buckets.items() if count]
+
+    @classmethod
+    def from_rows_(cls, summary_rows: list[tuple], histogram_rows: list[tuple]) -> 'Summary':
+        """
+        Tạo đối tượng từ các dòng của bảng tổng hợp và bảng biểu đồ phân bố.
+        """
+        summary = cls()
+        for row in summary_rows:
+            key = tuple(row[:3])
+            summary.groups[key] = [int(row[3])] + [
+                int(value) if i % 3 == 0 else float(value) for i, value in enumerate(row[4:])
+            ]
+        for row in histogram_rows:
+            summary.buckets[(tuple(row[:3]), row[3], int(row[4]))] = int(row[5])
+        return summary
+
+    def grouped_(self, by: str|None):
+        """
+        Gộp các nhóm theo một cột phân loại (hoặc tất cả thành một nhóm None khi by là None).
+        """
+        if by is not None and by not in CATEGORY_COLUMNS:
+            raise ValueError(f"Unknown category column: {by}")
+        index = CATEGORY_COLUMNS.index(by) if by is not None else None
+        grouped = {}
+        for key, group in self.groups.items():
+            target = grouped.setdefault(key[index] if index is not None else None, [0] * len(group))
+            for i, value in enumerate(group):
+                target[i] += value
+        return grouped
+
+    def counts(self, by: str|None = None) -> dict[str|None, int]:
+        """
+        Số sinh viên theo một cột phân loại.
+
+        Args:
+            by (str|None): Cột phân loại trong CATEGORY_COLUMNS, mặc định là None (toàn bảng).
+
+        Returns:
+            dict[str|None, int]: Số sinh viên theo giá trị của cột (khóa None khi by là None).
+        """
+        return {value: group[0] for value, group in self.grouped_(by).items() if group[0]}
+
+    def pass_rates(self, by: str = 'parent_edu_level') -> dict[str, float]:
+        """
+        Tỷ lệ đậu (passed = 'Yes') theo một cột phân loại.
+
+        Args:
+            by (str): Cột phân loại, mặc định là 'parent_edu_level'.
+
+        Returns:
+            dict[str, float]: Tỷ lệ đậu trong [0, 1] theo giá trị của cột.
+        """
+        index = CATEGORY_COLUMNS.index(by) if by in CATEGORY_COLUMNS else None
+        if index is None or by == 'passed':
+            raise ValueError(f"Unknown category column: {by}")
+        students, passed = {}, {}
+        for key, group in self.groups.items():
+            students[key[index]] = students.get(key[index], 0) + group[0]
+            if key[2] == 'Yes':
+                passed[key[index]] = passed.get(key[index], 0) + group[0]
+        return {value: passed.get(value, 0) / count for value, count in students.items() if count}
+
+    def stats(self, column: str, by: str|None = None) -> dict[str|None, tuple[int, float, float]]:
+        """
+        Số giá trị, trung bình và độ lệch chuẩn (tổng thể) của một cột số.
+
+        Args:
+            column (str): Cột số trong NUMERIC_COLUMNS.
+            by (str|None): Cột phân loại để chia nhóm, mặc định là None (toàn bảng).
+
+        Returns:
+            dict[str|None, tuple[int, float, float]]: (số giá trị, trung bình, độ lệch chuẩn) theo nhóm.
+        """
+        i = NUMERIC_COLUMNS.index(column)
+        result = {}
+        for value, group in self.grouped_(by).items():
+            count, total, squares = group[1 + 3 * i:4 + 3 * i]
+            if count:
+                mean = total / count
+                result[value] = (count, mean, math.sqrt(max(squares / count - mean * mean, 0.0)))
+        return result
+
+    def histogram(self, column: str, by: str|None = None) -> dict[str|None, dict[float, int]]:
+        """
+        Biểu đồ phân bố của một cột số.
+
+        Args:
+            column (str): Cột số trong HISTOGRAM_WIDTHS.
+            by (str|None): Cột phân loại để chia nhóm, mặc định là None (toàn bảng).
+
+        Returns:
+            dict[str|None, dict[float, int]]: Theo nhóm, số sinh viên theo cận dưới của từng khoảng.
+        """
+        width = HISTOGRAM_WIDTHS[column]
+        index = CATEGORY_COLUMNS.index(by) if by is not None else None
+        result = {}
+        for (key, name, bucket), count in sorted(self.buckets.items(), key=lambda item: item[0][2]):
+            if name != column or not count:
+                continue
+            counts = result.setdefault(key[index] if index is not None else None, {})
+            counts[bucket * width] = counts.get(bucket * width, 0) + count
+        return result
@@ -0,0 +1,141 @@
+import os
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from field import FieldName
+
+
+# Cách xử lý khi một dòng vi phạm quy tắc: loại dòng, gán giá trị thiếu hoặc đưa về biên
+REJECT = 'reject'
+NULLIFY = 'nullify'
+CLIP = 'clip'
+
+
+class Rule:
+    """
+    Một quy tắc kiểm tra dữ liệu trên toàn bộ một cột.
+
+    Attributes:
+        field (str): Tên cột theo FieldName.
+        name (str): Tên quy tắc.
+        action (str): Cách xử lý dòng vi phạm (REJECT, NULLIFY hoặc CLIP).
+        check (Callable[[pd.Series], np.ndarray]): Hàm trả về mặt nạ các dòng vi phạm.
+    """
+
+    __slots__ = ('field', 'name', 'action', 'check')
+
+    def __init__(self, field: str, name: str, action: str, check: Callable[[pd.Series], np.ndarray]):
+        self.field = field
+        self.name = name
+        self.action = action
+        self.check = check
+
+
+# Cùng quy tắc với các setter của StudentModel và validate_columns_
+RULES = (
+    Rule(FieldName.STUDENT_ID, 'not_null', REJECT, lambda column: column.isna().to_numpy()),
+    Rule(FieldName.PASSED, 'in_yes_no', REJECT, lambda column: ~column.isin(['Yes', 'No']).to_numpy()),
+    Rule(FieldName.STUDY_HOURS, 'non_negative', NULLIFY, lambda column: (column < 0).to_numpy()),
+    Rule(FieldName.ATTENDANCE_RATE, 'non_negative', NULLIFY, lambda column: (column < 0).to_numpy()),
+    Rule(FieldName.PREVIOUS_GRADES, 'between_0_100', CLIP,
+         lambda column: ((column < 0) | (column > 100)).to_numpy())
+)
+
+
+class ValidationReport:
+    """
+    Kết quả kiểm tra một lô dữ liệu.
+
+    Attributes:
+        rejections (pd.DataFrame): Bảng các dòng bị loại, gồm các cột 'row' (index của dòng),
+            'field' và 'rule', mỗi vi phạm một dòng.
+        counts (dict[tuple[str, str, str], int]): Số dòng vi phạm theo (cột, quy tắc, cách xử lý),
+            kể cả các quy tắc không loại dòng.
+    """
+
+    def __init__(self, rejections: pd.DataFrame, counts: dict[tuple[str, str, str], int]):
+        self.rejections = rejections
+        self.counts = counts
+
+    @property
+    def rejected_rows(self) -> int:
+        """
+        Số dòng bị loại (một dòng có thể vi phạm nhiều quy tắc).
+        """
+        return self.rejections['row'].nunique()
+
+    def __str__(self):
+        """
+        Trả về chuỗi tóm tắt số vi phạm theo từng quy tắc.
+
+        Returns:
+            str: Chuỗi tóm tắt.
+        """
+        msg = f'Validation: {self.rejected_rows} rows rejected'
+        for (field, rule, action), count in self.counts.items():
+            msg += f'\n\t{field} {rule} ({action}): {count}'
+        return msg
+
+
+def validate_frame(df: pd.DataFrame, rules: tuple[Rule, ...] = RULES) -> tuple[pd.DataFrame, ValidationReport]:
+    """
+    Kiểm tra tất cả các quy tắc trên toàn bộ cột (không duyệt từng dòng) và tách các dòng bị loại.
+
+    Các quy tắc NULLIFY/CLIP chỉ được đếm, giá trị được sửa khi tạo mô hình (validate_columns_).
+
+    Args:
+        df (pd.DataFrame): Dữ liệu có các cột theo FieldName.
+        rules (tuple[Rule, ...]): Các quy tắc kiểm tra, mặc định là RULES.
+
+    Returns:
+        tuple[pd.DataFrame, ValidationReport]: Các dòng hợp lệ (df nếu không có dòng nào bị loại)
+            và kết quả kiểm tra.
+    """
+    rejected = np.zeros(len(df), dtype=bool)
+    counts = {}
+    rows, fields, names = [], [], []
+    for rule in rules:
+        violated = rule.check(df[rule.field])
+        count = int(violated.sum())
+        if not count:
+            continue
+        counts[(rule.field, rule.name, rule.action)] = count
+        if rule.action == REJECT:
+            rejected |= violated
+            rows.append(df.index.to_numpy()[violated])
+            fields.append(np.full(count, rule.field, dtype=object))
+            names.append(np.full(count, rule.name, dtype=object))
+
+    rejections = pd.DataFrame({
+        'row': np.concatenate(rows) if rows else np.array([], dtype=np.int64),
+        'field': np.concatenate(fields) if fields else np.array([], dtype=object),
+        'rule': np.concatenate(names) if names else np.array([], dtype=object)
+    })
+    report = ValidationReport(rejections, counts)
+    if not rejected.any():
+        return df, report
+    return df[~rejected], report
+
+
+def write_quarantine(df: pd.DataFrame, report: ValidationReport, path: str) -> int:
+    """
+    Ghi nối các dòng bị loại vào file CSV cách ly, kèm theo các quy tắc mà dòng vi phạm.
+
+    Args:
+        df (pd.DataFrame): Dữ liệu đã được kiểm tra (trước khi tách).
+        report (ValidationReport): Kết quả kiểm tra của df.
+        path (str): Đường dẫn file CSV cách ly.
+
+    Returns:
+        int: Số dòng đã ghi.
+    """
+    if report.rejections.empty:
+        return 0
+    rejections = report.rejections.assign(violation=report.rejections['field'] + ':' + report.rejections['rule'])
+    violations = rejections.groupby('row', sort=False)['violation'].agg(';'.join)
+    quarantined = df.loc[violations.index].assign(**{'Row': violations.index, 'Violations': violations.to_numpy()})
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    quarantined.to_csv(path, mode='a', header=not os.path.exists(path), index=False)
+    return len(quarantined)
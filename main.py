@@ -1,12 +1,8 @@
-from business.etl import etl_process
-import schedule
+from business.etl import etl_process, setup_logging_
 import time
+import sys
     
 import logging
-# Thiết lập config cho log
-logging.basicConfig(filename='business/etl_log.log', level=logging.DEBUG,
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S')
 
 # Các biến lưu giữ trạng thái của job hiện tại
 job_cnt = 0
@@ -19,6 +15,7 @@ def combined_etl_process(limits: int|None = None):
         limits (int or None): Giới hạn số lần thực hiện quy trình, nếu là
         None thì không có giới hạn. Giá trị mặc định là None
     """
+    import schedule
     global job_cnt
     global stop
     job_cnt += 1
@@ -26,7 +23,8 @@ def combined_etl_process(limits: int|None = None):
     etl_process(
         load_for=2000,
         strategy='random',
-        need_reset=False
+        need_reset=False,
+        resume=True
     )
     if limits is not None:
         if job_cnt >= limits:
@@ -34,8 +32,36 @@ def combined_etl_process(limits: int|None = None):
             stop = True
             return schedule.CancelJob
 
+async def combined_etl_process_async(limits: int|None = None):
+    """
+    Quy trình ETL tự động chạy bằng asyncio: các giai đoạn extract, transform, load chạy chồng lên nhau
+    theo từng chunk, và các mốc chạy cách đều nhau một phút dù một lần chạy có kéo dài.
+    Args:
+        limits (int or None): Giới hạn số lần thực hiện quy trình, nếu là
+        None thì không có giới hạn. Giá trị mặc định là None
+    """
+    from business.async_runner import run_etl_async, run_schedule
+    await run_schedule(
+        lambda: run_etl_async(load_for=2000, strategy='random', need_reset=False),
+        interval=60,
+        limits=limits
+    )
+
 # Giả thiết chạy ETL 5 lần, mỗi lần tải mẫu 2000 hàng dữ liệu
 if __name__ == '__main__':
+    # Thiết lập config cho log khi chạy trực tiếp (import main không thay đổi cấu hình log)
+    setup_logging_()
+    if '--once' in sys.argv:
+        # Chạy một lần (cron, container job): chỉ tải các bản ghi mới hoặc đã thay đổi
+        etl_process(load_for=2000, strategy='random', need_reset=False, incremental=True, resume=True)
+        logging.info('Done!!!')
+        sys.exit(0)
+    if '--async' in sys.argv:
+        import asyncio
+        asyncio.run(combined_etl_process_async(5))
+        logging.info('Done!!!')
+        sys.exit(0)
+    import schedule
     job = schedule.every().minute.do(lambda: combined_etl_process(5))
     while True:
         schedule.run_pending()
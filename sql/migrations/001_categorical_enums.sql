@@ -0,0 +1,6 @@
+-- Thứ tự giá trị của mỗi ENUM phải trùng với field.Categories (chỉ số ENUM = mã + 1)
+--CATEGORICAL ENUMS
+ALTER TABLE student_performance
+MODIFY participate_in_act ENUM('No', 'Yes', 'Unknown'),
+MODIFY parent_edu_level ENUM('High School', 'Associate', 'Bachelor', 'Master', 'Doctorate', 'Unknown'),
+MODIFY passed ENUM('No', 'Yes');
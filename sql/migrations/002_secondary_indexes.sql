@@ -0,0 +1,11 @@
+-- Chỉ mục cho StudentPerformanceDAO.find/top_k, bảng phụ tạo bằng CREATE TABLE ... LIKE có cùng các chỉ mục.
+-- MySQL không có CREATE INDEX IF NOT EXISTS: chạy bằng StudentPerformanceDAO.create_indexes() (etl.reset() gọi
+-- hàm này), các chỉ mục đã có được bỏ qua. Nếu chạy trực tiếp thì chỉ chạy một lần.
+--CREATE ATTENDANCE INDEX
+CREATE INDEX idx_attendance_rate ON student_performance(attendance_rate);
+
+--CREATE GRADES INDEX
+CREATE INDEX idx_previous_grades ON student_performance(previous_grades);
+
+--CREATE PASSED EDU INDEX
+CREATE INDEX idx_passed_edu_level ON student_performance(passed, parent_edu_level);
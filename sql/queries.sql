@@ -20,3 +20,176 @@ WHERE student_id = %s;
 
 --DELETE ALL
 DELETE FROM student_performance;
+
+--GET EXISTING IDS
+SELECT student_id FROM student_performance
+WHERE student_id IN ({ids});
+
+--UPSERT MANY RECORDS
+INSERT INTO student_performance(student_id, study_hours_per_week,
+attendance_rate, previous_grades, participate_in_act,
+parent_edu_level, passed)
+VALUES(%s, %s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE study_hours_per_week = VALUES(study_hours_per_week),
+attendance_rate = VALUES(attendance_rate), previous_grades = VALUES(previous_grades),
+participate_in_act = VALUES(participate_in_act),
+parent_edu_level = VALUES(parent_edu_level), passed = VALUES(passed);
+
+--DELETE RECORDS BY IDS
+DELETE FROM student_performance
+WHERE student_id IN ({ids});
+
+--GET RECORDS BY IDS
+SELECT * FROM student_performance
+WHERE student_id IN ({ids});
+
+--GET PAGE AFTER ID
+SELECT * FROM student_performance
+WHERE student_id > %s
+ORDER BY student_id
+LIMIT %s;
+
+--CREATE STAGING TABLE
+CREATE TEMPORARY TABLE IF NOT EXISTS student_performance_staging
+LIKE student_performance;
+
+--CLEAR STAGING TABLE
+DELETE FROM student_performance_staging;
+
+--LOAD STAGING FILE
+LOAD DATA LOCAL INFILE %s
+INTO TABLE student_performance_staging
+FIELDS TERMINATED BY '\t' LINES TERMINATED BY '\n'
+(student_id, study_hours_per_week, attendance_rate, previous_grades,
+participate_in_act, parent_edu_level, passed);
+
+--COUNT EXISTING STAGING RECORDS
+SELECT COUNT(*) FROM student_performance_staging s
+JOIN student_performance p ON p.student_id = s.student_id;
+
+--GET EXISTING STAGING RECORDS
+SELECT p.* FROM student_performance_staging s
+JOIN student_performance p ON p.student_id = s.student_id;
+
+--MERGE STAGING TABLE
+INSERT INTO student_performance(student_id, study_hours_per_week,
+attendance_rate, previous_grades, participate_in_act,
+parent_edu_level, passed)
+SELECT student_id, study_hours_per_week, attendance_rate, previous_grades,
+participate_in_act, parent_edu_level, passed
+FROM student_performance_staging
+ON DUPLICATE KEY UPDATE study_hours_per_week = VALUES(study_hours_per_week),
+attendance_rate = VALUES(attendance_rate), previous_grades = VALUES(previous_grades),
+participate_in_act = VALUES(participate_in_act),
+parent_edu_level = VALUES(parent_edu_level), passed = VALUES(passed);
+
+--DROP SHADOW TABLE
+DROP TABLE IF EXISTS student_performance_next;
+
+--CREATE SHADOW TABLE
+CREATE TABLE student_performance_next LIKE student_performance;
+
+--DROP PREVIOUS TABLE
+DROP TABLE IF EXISTS student_performance_prev;
+
+--SWAP SHADOW TABLE
+RENAME TABLE student_performance TO student_performance_prev,
+student_performance_next TO student_performance;
+
+--ROLLBACK SWAP
+RENAME TABLE student_performance TO student_performance_next,
+student_performance_prev TO student_performance;
+
+--CREATE CHECKPOINT TABLE
+CREATE TABLE IF NOT EXISTS etl_checkpoint(
+run_id VARCHAR(64) NOT NULL,
+part VARCHAR(64) NOT NULL,
+position BIGINT NOT NULL,
+PRIMARY KEY(run_id, part));
+
+--GET CHECKPOINTS
+SELECT part, position FROM etl_checkpoint
+WHERE run_id = %s;
+
+--SAVE CHECKPOINT
+INSERT INTO etl_checkpoint(run_id, part, position)
+VALUES(%s, %s, %s)
+ON DUPLICATE KEY UPDATE position = VALUES(position);
+
+--CLEAR CHECKPOINTS
+DELETE FROM etl_checkpoint
+WHERE run_id = %s;
+
+--CREATE SUMMARY TABLE
+CREATE TABLE IF NOT EXISTS student_performance_summary(
+participate_in_act VARCHAR(10) NOT NULL,
+parent_edu_level VARCHAR(50) NOT NULL,
+passed VARCHAR(10) NOT NULL,
+students BIGINT NOT NULL,
+study_hours_count BIGINT NOT NULL,
+study_hours_sum DOUBLE NOT NULL,
+study_hours_sq_sum DOUBLE NOT NULL,
+attendance_count BIGINT NOT NULL,
+attendance_sum DOUBLE NOT NULL,
+attendance_sq_sum DOUBLE NOT NULL,
+grades_count BIGINT NOT NULL,
+grades_sum DOUBLE NOT NULL,
+grades_sq_sum DOUBLE NOT NULL,
+PRIMARY KEY(participate_in_act, parent_edu_level, passed));
+
+--CREATE HISTOGRAM TABLE
+CREATE TABLE IF NOT EXISTS student_performance_histogram(
+participate_in_act VARCHAR(10) NOT NULL,
+parent_edu_level VARCHAR(50) NOT NULL,
+passed VARCHAR(10) NOT NULL,
+column_name VARCHAR(64) NOT NULL,
+bucket INT NOT NULL,
+students BIGINT NOT NULL,
+PRIMARY KEY(participate_in_act, parent_edu_level, passed, column_name, bucket));
+
+--APPLY SUMMARY DELTA
+INSERT INTO student_performance_summary(participate_in_act, parent_edu_level, passed,
+students, study_hours_count, study_hours_sum, study_hours_sq_sum,
+attendance_count, attendance_sum, attendance_sq_sum,
+grades_count, grades_sum, grades_sq_sum)
+VALUES(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE students = students + VALUES(students),
+study_hours_count = study_hours_count + VALUES(study_hours_count),
+study_hours_sum = study_hours_sum + VALUES(study_hours_sum),
+study_hours_sq_sum = study_hours_sq_sum + VALUES(study_hours_sq_sum),
+attendance_count = attendance_count + VALUES(attendance_count),
+attendance_sum = attendance_sum + VALUES(attendance_sum),
+attendance_sq_sum = attendance_sq_sum + VALUES(attendance_sq_sum),
+grades_count = grades_count + VALUES(grades_count),
+grades_sum = grades_sum + VALUES(grades_sum),
+grades_sq_sum = grades_sq_sum + VALUES(grades_sq_sum);
+
+--APPLY HISTOGRAM DELTA
+INSERT INTO student_performance_histogram(participate_in_act, parent_edu_level, passed,
+column_name, bucket, students)
+VALUES(%s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE students = students + VALUES(students);
+
+--GET SUMMARY
+SELECT * FROM student_performance_summary
+WHERE students > 0;
+
+--GET HISTOGRAM
+SELECT * FROM student_performance_histogram
+WHERE students > 0;
+
+--CLEAR SUMMARY
+DELETE FROM student_performance_summary;
+
+--CLEAR HISTOGRAM
+DELETE FROM student_performance_histogram;
+
+--GET INDEX NAMES
+SELECT DISTINCT index_name FROM information_schema.statistics
+WHERE table_schema = DATABASE() AND table_name = %s;
+
+--FIND RECORDS
+SELECT * FROM student_performance
+WHERE {conditions}
+ORDER BY {order}
+{limit};
@@ -1,3 +1,7 @@
+import os
+import threading
+
+
 class NotSupportedQueryException(Exception):
     """
     Ngoại lệ được ném ra khi truy vấn không được hỗ trợ.
@@ -86,12 +90,46 @@ class SQLFileReader:
         Raises:
             NotSupportedQueryException: Nếu loại truy vấn không được hỗ trợ.
         """
-        if query_type not in self.get_enable_queries():
+        try:
+            return self._stmts[query_type]
+        except KeyError:
             raise NotSupportedQueryException()
-        return self._stmts[query_type]
 
     def clear(self) -> None:
         """
         Xóa tất cả các câu lệnh SQL đã lưu trữ.
         """
-        self._stmts.clear()
\ No newline at end of file
+        self._stmts.clear()
+
+
+_readers: dict[str, tuple[int, SQLFileReader]] = {}
+_readers_lock = threading.Lock()
+
+
+def get_sql_file_reader(sql_file_path: str) -> SQLFileReader:
+    """
+    Lấy SQLFileReader dùng chung trong tiến trình cho một file SQL. File chỉ được đọc lại khi
+    thời điểm sửa đổi (mtime) của nó thay đổi.
+
+    Các câu lệnh của cùng một reader luôn là cùng một đối tượng str, nhờ đó cursor prepared của
+    mysql.connector (so sánh câu lệnh bằng `is`) không phải prepare lại câu lệnh.
+
+    Args:
+        sql_file_path (str): Đường dẫn tới file SQL.
+
+    Returns:
+        SQLFileReader: Đối tượng đọc file SQL (không được sửa đổi).
+
+    Raises:
+        Exception: Nếu xảy ra lỗi khi đọc file.
+    """
+    path = os.path.abspath(sql_file_path)
+    mtime = os.stat(path).st_mtime_ns
+    with _readers_lock:
+        cached = _readers.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        reader = SQLFileReader()
+        reader.read(path)
+        _readers[path] = (mtime, reader)
+        return reader